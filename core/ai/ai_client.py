@@ -79,6 +79,8 @@ class OpenAIAI(AIProvider):
         
         if not self.api_key:
             raise ValueError("OpenAI API密钥未设置")
+        # 首次调用时创建，之后复用同一个客户端及其HTTP连接池
+        self._llm = None
     
     def call(self, prompt: str, **kwargs) -> Union[str, Dict[str, Any]]:
         """调用OpenAI服务"""
@@ -86,14 +88,15 @@ class OpenAIAI(AIProvider):
             raise ImportError("langchain-openai库不可用")
         
         try:
-            llm = ChatOpenAI(
-                model=self.model,
-                openai_api_key=self.api_key,
-                openai_api_base=self.base_url
-            )
+            if self._llm is None:
+                self._llm = ChatOpenAI(
+                    model=self.model,
+                    openai_api_key=self.api_key,
+                    openai_api_base=self.base_url
+                )
             
             # 可以根据需要添加更多参数
-            response = llm.invoke(prompt)
+            response = self._llm.invoke(prompt)
             return response.content
         except Exception as e:
             raise e
@@ -110,6 +113,8 @@ class CustomAPIAI(AIProvider):
             raise ValueError("Custom API密钥未设置")
         if not self.api_url:
             raise ValueError("Custom API URL未设置")
+        # 首次调用时创建会话，之后的请求复用保持连接，免去每次的TCP/TLS握手
+        self._session = None
 
     def call(self, prompt: str, **kwargs) -> Union[str, Dict[str, Any]]:
         """调用自定义API服务"""
@@ -130,7 +135,9 @@ class CustomAPIAI(AIProvider):
         data.update(kwargs)
 
         try:
-            response = requests.post(self.api_url, headers=headers, json=data)
+            if self._session is None:
+                self._session = requests.Session()
+            response = self._session.post(self.api_url, headers=headers, json=data)
             if response.status_code == 200:
                 try:
                     result = response.json()
@@ -1,7 +1,89 @@
 from .base_checker import BaseChecker
 from models.document import Document
 from models.compliance import ComplianceResult, CheckType
-from typing import List, Dict, Any
+from core.checker.citation_checking.reference_mapper import map_author_year_citation_to_reference, extract_authors_from_reference, format_citation_by_authors
+from typing import List, Dict, Any, Optional, Tuple
+from datetime import datetime
+import concurrent.futures
+import logging
+import os
+import re
+
+logger = logging.getLogger(__name__)
+
+# 中文格式引用中的年份，如（2024）
+_CN_YEAR_PATTERN = re.compile(r'（(\d{4})）')
+
+# 作者年份引用数量超过该阈值时，分块交给多个进程并行匹配（数量少时进程开销大于收益）
+_PARALLEL_CITATION_THRESHOLD = 1024
+_CITATION_CHUNK_SIZE = 256
+
+
+def _match_author_year_citation(citation_text: str, reference_dicts: List[Dict]) -> Optional[Tuple[Dict, List[str], bool]]:
+    """
+    将单个作者年份格式的引用映射到参考文献，并根据参考文献的作者信息生成格式化后的引用
+
+    Args:
+        citation_text: 引用文本
+        reference_dicts: 参考文献字典列表
+
+    Returns:
+        (映射结果, 作者列表, 是否有et al.标记)，未匹配时返回None
+    """
+    result = map_author_year_citation_to_reference(citation_text, reference_dicts)
+    if not result:
+        return None
+
+    reference_text = result['reference']['text']
+    # 从映射结果中获取年份（优先使用映射结果中的年份）
+    ref_year = result['reference'].get('year', '')
+    
+    # 从参考文献文本中提取作者信息
+    authors, has_et_al = extract_authors_from_reference(reference_text)
+    
+    # 根据作者信息格式化引用
+    year = ref_year
+    if not year and 'corrected_citation' in result:
+        # 尝试从修正后的引用中提取年份
+        year_match = _CN_YEAR_PATTERN.search(result['corrected_citation'])
+        if year_match:
+            year = year_match.group(1)
+    
+    if year and authors:
+        formatted_citation = format_citation_by_authors(authors, year, result['corrected_citation'], has_et_al)
+        result['formatted_citation'] = formatted_citation
+    else:
+        result['formatted_citation'] = result['corrected_citation']
+    return result, authors, has_et_al
+
+
+def _match_citation_chunk(citation_texts: List[str], reference_dicts: List[Dict]) -> list:
+    """在子进程中匹配一块引用（模块级函数以便序列化）"""
+    return [_match_author_year_citation(text, reference_dicts) for text in citation_texts]
+
+
+def _match_author_year_citations(citation_texts: List[str], reference_dicts: List[Dict]) -> list:
+    """
+    按顺序匹配所有作者年份格式的引用；数量很多时每256个引用为一块，由进程池并行匹配
+
+    Args:
+        citation_texts: 引用文本列表
+        reference_dicts: 参考文献字典列表
+
+    Returns:
+        与citation_texts一一对应的匹配结果列表
+    """
+    if len(citation_texts) > _PARALLEL_CITATION_THRESHOLD and (os.cpu_count() or 1) > 1:
+        chunks = [citation_texts[start:start + _CITATION_CHUNK_SIZE]
+                  for start in range(0, len(citation_texts), _CITATION_CHUNK_SIZE)]
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(len(chunks), os.cpu_count())) as executor:
+                futures = [executor.submit(_match_citation_chunk, chunk, reference_dicts) for chunk in chunks]
+                return [match for future in futures for match in future.result()]
+        except Exception as e:
+            logger.warning("并行匹配引用失败，改为顺序匹配: %s", e)
+    return _match_citation_chunk(citation_texts, reference_dicts)
+
 
 class CitationChecker(BaseChecker):
     """引用合规性检查器 - 实现BaseChecker接口"""
@@ -31,9 +113,7 @@ class CitationChecker(BaseChecker):
             "year_inconsistencies": 0
         }
         
-        # 这里集成现有的引用匹配逻辑
-        # 使用utils/reference_mapper中的函数
-        from core.checker.citation_checking.reference_mapper import map_author_year_citation_to_reference, extract_authors_from_reference, format_citation_by_authors
+        # 这里集成现有的引用匹配逻辑（使用reference_mapper中的函数）
         
         # 转换参考文献为字典格式以兼容映射函数
         reference_dicts = []
@@ -54,6 +134,12 @@ class CitationChecker(BaseChecker):
         # 存储所有映射结果
         all_mapping_results = []
         
+        # 先统一匹配所有作者年份格式的引用（引用很多时并行），下面按原顺序汇总
+        author_year_matches = iter(_match_author_year_citations(
+            [citation.text for citation in document.citations if citation.format_type == 'author_year'],
+            reference_dicts
+        ))
+        
         # 处理每个引用
         for i, citation in enumerate(document.citations, 1):
             report_entry = {
@@ -66,34 +152,13 @@ class CitationChecker(BaseChecker):
             
             if citation.format_type == 'author_year':
                 # 使用现有的映射逻辑
-                result = map_author_year_citation_to_reference(
-                    citation.text,
-                    reference_dicts
-                )
+                match = next(author_year_matches)
                 
                 # 如果匹配成功，提取作者信息
-                if result:
+                if match:
+                    result, authors, has_et_al = match
                     reference_text = result['reference']['text']
-                    # 从映射结果中获取年份（优先使用映射结果中的年份）
                     ref_year = result['reference'].get('year', '')
-                    
-                    # 从参考文献文本中提取作者信息
-                    authors, has_et_al = extract_authors_from_reference(reference_text)
-                    
-                    # 根据作者信息格式化引用
-                    year = ref_year
-                    if not year and 'corrected_citation' in result:
-                        # 尝试从修正后的引用中提取年份
-                        import re
-                        year_match = re.search(r'（(\d{4})）', result['corrected_citation'])
-                        if year_match:
-                            year = year_match.group(1)
-                    
-                    if year and authors:
-                        formatted_citation = format_citation_by_authors(authors, year, result['corrected_citation'], has_et_al)
-                        result['formatted_citation'] = formatted_citation
-                    else:
-                        result['formatted_citation'] = result['corrected_citation']
                         
                     # 记录映射结果
                     all_mapping_results.append(result)
@@ -187,7 +252,7 @@ class CitationChecker(BaseChecker):
         
         # 创建兼容现有API格式的输出
         compatibility_output = {
-            "test_date": __import__('datetime').datetime.now().isoformat(),
+            "test_date": datetime.now().isoformat(),
             "document": document.metadata.get('file_path', ''),
             "total_citations": len(document.citations),
             "total_references": len(document.references),
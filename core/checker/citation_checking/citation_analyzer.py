@@ -4,6 +4,7 @@
 """
 
 import os
+import re
 import sys
 from typing import Dict, Any, List
 from datetime import datetime
@@ -18,6 +19,11 @@ from core.extractor.citation_extraction.citation_extractor import extract_author
 from core.extractor.citation_extraction.citation_formatter import CitationFormatter
 from config.citation_format_config import CitationFormatConfig, get_default_citation_format_config
 
+# 数字参考文献条目开头的序号，如[1]
+_REFERENCE_INDEX_PATTERN = re.compile(r'^\[\d+\]')
+# 中文格式引用中的年份，如（2024）
+_CN_YEAR_PATTERN = re.compile(r'（(\d{4})）')
+
 
 def analyze_document(doc_path: str) -> Dict[str, Any]:
     """分析文档并返回引用分析报告"""
@@ -78,9 +84,8 @@ def analyze_document(doc_path: str) -> Dict[str, Any]:
                 # 对数字引用执行其他处理（如果需要）
                 result = None
                 # 查找对应的数字参考文献
-                import re
                 for ref in checker.references:
-                    ref_match = re.search(r'^\[\d+\]', ref['text'])
+                    ref_match = _REFERENCE_INDEX_PATTERN.search(ref['text'])
                     if ref_match and ref_match.group() == citation:
                         result = {
                             'original_citation': citation,
@@ -104,8 +109,7 @@ def analyze_document(doc_path: str) -> Dict[str, Any]:
                 year = result['reference'].get('year', '')
                 if not year and 'corrected_citation' in result:
                     # 尝试从修正后的引用中提取年份
-                    import re
-                    year_match = re.search(r'（(\d{4})）', result['corrected_citation'])
+                    year_match = _CN_YEAR_PATTERN.search(result['corrected_citation'])
                     if year_match:
                         year = year_match.group(1)
 
@@ -7,6 +7,41 @@ import re
 from difflib import SequenceMatcher
 from typing import Dict, List, Optional, Tuple
 
+# 匹配所用的模式，在模块加载时编译一次，供所有引用和参考文献共用
+# 作者（年份）/ Author (Year)，允许年份中包含OCR错误字符
+_CN_CITATION_PATTERN = re.compile(r'^(.+?)（([0-9OoIiZzSsGgBbDd]{4})）')
+_EN_CITATION_PATTERN = re.compile(r'^(.+?)\s*\(([0-9OoIiZzSsGgBbDd]{4})\)')
+# 参考文献条目前的序号（如[1]、[71]等）
+_LEADING_INDEX_PATTERN = re.compile(r'^\s*\[\d+\]\s*')
+# 参考文献中的年份（4位数字），按优先级依次尝试
+_REFERENCE_YEAR_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\((\d{4})\)',         # 括号中的年份
+    r'\((\d{4})\)\.',       # 括号中的年份后跟句点
+    r',\s*(\d{4})[,)]',     # 逗号后跟年份和逗号或右括号
+    r',\s*(\d{4})\.',       # 逗号后跟年份和句点
+    r',\s*(\d{4})',         # 逗号后跟年份
+    r':\s*(\d{4})\.',       # 冒号后跟年份和句点
+    r':\s*(\d{4})',         # 冒号后跟年份
+    r'\s(\d{4})\.',         # 空格后跟年份和句点
+    r'\s(\d{4})',           # 空格后跟年份
+))
+_LEADING_AUTHOR_PATTERN = re.compile(r'^([^.,]+)')
+_TRAILING_DENG_PATTERN = re.compile(r'等$')
+_TRAILING_ET_AL_PATTERN = re.compile(r'et al\.?$')
+_ENGLISH_NAME_PATTERN = re.compile(r'^[A-Za-z\s.,]+$')
+_ET_AL_SUFFIX_PATTERN = re.compile(r'\s+et\s+al\.?', re.IGNORECASE)
+_DENG_SUFFIX_PATTERN = re.compile(r'\s+等')
+_CHINESE_CHAR_PATTERN = re.compile('[\u4e00-\u9fff]')
+# 第一个句号之前的内容
+_BEFORE_FIRST_PERIOD_PATTERN = re.compile(r'^([^\.]+?)\.')
+_ET_AL_PATTERN = re.compile(r'et al\.?', re.IGNORECASE)
+_AUTHORS_BEFORE_YEAR_PATTERN = re.compile(r'^([^\(]+?)\(\d{4}\)')
+_AUTHORS_BEFORE_PERIOD_YEAR_PATTERN = re.compile(r'^([^\.]+?)\.\s*\(\d{4}\)')
+_AND_PATTERN = re.compile(r'\s+and\s+')
+_AMPERSAND_PATTERN = re.compile(r'\s*&\s*')
+_ET_AL_REMOVE_PATTERN = re.compile(r',?\s*et al\.?', re.IGNORECASE)
+_INITIALS_PATTERN = re.compile(r'^[A-Z]\.(?:\s*[A-Z]\.)?$')
+
 
 def map_author_year_citation_to_reference(citation: str, references: List[Dict]) -> Optional[Dict]:
     """
@@ -241,14 +276,14 @@ def extract_author_year_from_citation(citation: str) -> Tuple[Optional[str], Opt
         tuple: (作者, 年份)
     """
     # 匹配格式：作者（年份），允许年份中包含OCR错误字符
-    match = re.search(r'^(.+?)（([0-9OoIiZzSsGgBbDd]{4})）', citation.strip())
+    match = _CN_CITATION_PATTERN.search(citation.strip())
     if match:
         author = match.group(1).strip()
         year = match.group(2)
         return author, year
     
     # 匹配英文格式：Author (Year)，允许年份中包含OCR错误字符
-    match = re.search(r'^(.+?)\s*\(([0-9OoIiZzSsGgBbDd]{4})\)', citation.strip())
+    match = _EN_CITATION_PATTERN.search(citation.strip())
     if match:
         author = match.group(1).strip()
         year = match.group(2)
@@ -273,30 +308,18 @@ def extract_author_year_from_reference(reference_text: str) -> Tuple[Optional[st
     # 或者：作者. 书名[M]. 出版社: 年份.
     
     # 去除参考文献条目前的序号（如[1]、[71]等）
-    clean_reference_text = re.sub(r'^\s*\[\d+\]\s*', '', reference_text)
+    clean_reference_text = _LEADING_INDEX_PATTERN.sub('', reference_text)
     
     # 提取年份（4位数字）- 更全面的模式
-    year_patterns = [
-        r'\((\d{4})\)',         # 括号中的年份
-        r'\((\d{4})\)\.',       # 括号中的年份后跟句点
-        r',\s*(\d{4})[,)]',     # 逗号后跟年份和逗号或右括号
-        r',\s*(\d{4})\.',       # 逗号后跟年份和句点
-        r',\s*(\d{4})',         # 逗号后跟年份
-        r':\s*(\d{4})\.',       # 冒号后跟年份和句点
-        r':\s*(\d{4})',         # 冒号后跟年份
-        r'\s(\d{4})\.',         # 空格后跟年份和句点
-        r'\s(\d{4})',           # 空格后跟年份
-    ]
-    
     year = None
-    for pattern in year_patterns:
-        year_match = re.search(pattern, clean_reference_text)
+    for pattern in _REFERENCE_YEAR_PATTERNS:
+        year_match = pattern.search(clean_reference_text)
         if year_match:
             year = year_match.group(1)
             break
     
     # 提取作者（第一个逗号或点之前的内容）
-    author_match = re.search(r'^([^.,]+)', clean_reference_text)
+    author_match = _LEADING_AUTHOR_PATTERN.search(clean_reference_text)
     author = author_match.group(1).strip() if author_match else None
     
     # 处理多个作者的情况，只取第一个作者
@@ -310,8 +333,8 @@ def extract_author_year_from_reference(reference_text: str) -> Tuple[Optional[st
     
     # 如果作者以"等"或"et al"结尾，去掉这些词
     if author:
-        author = re.sub(r'等$', '', author).strip()
-        author = re.sub(r'et al\.?$', '', author).strip()
+        author = _TRAILING_DENG_PATTERN.sub('', author).strip()
+        author = _TRAILING_ET_AL_PATTERN.sub('', author).strip()
     
     return author, year
 
@@ -446,12 +469,11 @@ def is_english_name(name: str) -> bool:
     # 确保输入是字符串类型
     name = str(name)
 
-    return bool(re.match(r'^[A-Za-z\s.,]+$', name))
+    return bool(_ENGLISH_NAME_PATTERN.match(name))
 
 
 def extract_surname(name: str) -> str:
     """提取英文名的姓氏"""
-    import re
 
     # 检查输入是否为None
     if name is None:
@@ -461,10 +483,10 @@ def extract_surname(name: str) -> str:
     name = str(name)
 
     # 去除"et al."后缀
-    name = re.sub(r'\s+et\s+al\.?', '', name, flags=re.IGNORECASE).strip()
+    name = _ET_AL_SUFFIX_PATTERN.sub('', name).strip()
 
     # 去除"等"后缀
-    name = re.sub(r'\s+等', '', name).strip()
+    name = _DENG_SUFFIX_PATTERN.sub('', name).strip()
 
     # 分割名字部分
     parts = name.split()
@@ -512,7 +534,7 @@ def extract_authors_from_reference(reference_text: str) -> Tuple[List[str], bool
 
 def contains_chinese(text: str) -> bool:
     """检查文本是否包含中文字符"""
-    return bool(re.search('[\u4e00-\u9fff]', text))
+    return bool(_CHINESE_CHAR_PATTERN.search(text))
 
 
 def extract_chinese_authors(reference_text: str) -> List[str]:
@@ -521,10 +543,8 @@ def extract_chinese_authors(reference_text: str) -> List[str]:
     """
     authors = []
 
-    # 中文文献模式: 作者1,作者2.文章名...
-    chinese_pattern = r'^([^\.]+?)\.'  # 匹配第一个句号之前的内容
-
-    match = re.search(chinese_pattern, reference_text)
+    # 中文文献模式: 作者1,作者2.文章名...（匹配第一个句号之前的内容）
+    match = _BEFORE_FIRST_PERIOD_PATTERN.search(reference_text)
     if match:
         authors_str = match.group(1)
         # 分割作者 (中文使用逗号或顿号分隔)
@@ -552,19 +572,19 @@ def extract_english_authors(reference_text: str) -> List[str]:
     has_et_al = False
 
     # 检查是否有et al.
-    if re.search(r'et al\.?', reference_text, re.IGNORECASE):
+    if _ET_AL_PATTERN.search(reference_text):
         has_et_al = True
 
     # 提取作者部分 (通常在第一个句号或括号之前)
-    match = re.search(r'^([^\(]+?)\(\d{4}\)', reference_text)
+    match = _AUTHORS_BEFORE_YEAR_PATTERN.search(reference_text)
     if match:
         authors_str = match.group(1)
     else:
-        match = re.search(r'^([^\.]+?)\.\s*\(\d{4}\)', reference_text)
+        match = _AUTHORS_BEFORE_PERIOD_YEAR_PATTERN.search(reference_text)
         if match:
             authors_str = match.group(1)
         else:
-            match = re.search(r'^([^\.]+?)\.', reference_text)
+            match = _BEFORE_FIRST_PERIOD_PATTERN.search(reference_text)
             if match:
                 authors_str = match.group(1)
             else:
@@ -580,11 +600,11 @@ def extract_english_authors(reference_text: str) -> List[str]:
                     return authors, has_et_al
 
     # 处理"and"和"&"连接符
-    authors_str = re.sub(r'\s+and\s+', ', ', authors_str)
-    authors_str = re.sub(r'\s*&\s*', ', ', authors_str)
+    authors_str = _AND_PATTERN.sub(', ', authors_str)
+    authors_str = _AMPERSAND_PATTERN.sub(', ', authors_str)
 
     # 移除"et al."等缩写
-    authors_str = re.sub(r',?\s*et al\.?', '', authors_str, flags=re.IGNORECASE)
+    authors_str = _ET_AL_REMOVE_PATTERN.sub('', authors_str)
 
     # 改进的作者分割逻辑
     # 使用更智能的方法分割作者，考虑名字缩写中的逗号
@@ -610,7 +630,7 @@ def extract_english_authors(reference_text: str) -> List[str]:
     # 处理每个作者
     for author in author_list:
         # 处理名字缩写 (如 "A." 或 "A. B.")
-        if re.match(r'^[A-Z]\.(?:\s*[A-Z]\.)?$', author):
+        if _INITIALS_PATTERN.match(author):
             if authors:
                 # 将缩写合并到前一个作者
                 authors[-1] = authors[-1] + ' ' + author
@@ -3,13 +3,73 @@
 支持快速检测（基于标题）和准确检查（基于全文）
 """
 import os
+import re
+import json
+import tempfile
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from .base_checker import BaseChecker
 from models.document import Document
 from models.compliance import ComplianceResult, CheckType
 from core.ai.ai_client import ai_generate
+from .relevance_checking.basic_relevance_checker import basic_relevance_check, JIEBA_AVAILABLE
+from .relevance_checking.title_extractor import extract_title_from_content
+from .relevance_checking.excerpt_selector import select_relevant_chunks
+
+# 优先使用orjson解析JSON，不可用时回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# AI服务错误响应的特征串（包括HTML错误页面），合并为一个正则一次扫描
+_AI_ERROR_TOKENS = ('错误：', 'AI服务未配置有效密钥', 'AI调用错误', 'AI服务返回空响应')
+_HTML_ERROR_TOKENS = ('<!DOCTYPE html>', '<html', '<head')
+_AI_ERROR_RE = re.compile('|'.join(map(re.escape, _AI_ERROR_TOKENS + _HTML_ERROR_TOKENS)))
+
+# 快速检测的预筛选阈值：基础匹配结论足够明确时跳过AI调用，可通过环境变量调整
+_PREFILTER_ENABLED = os.getenv("RELEVANCE_PREFILTER", "1") != "0"
+_PREFILTER_HIGH_SCORE = int(os.getenv("RELEVANCE_PREFILTER_HIGH_SCORE", "8"))
+_PREFILTER_LOW_SCORE = int(os.getenv("RELEVANCE_PREFILTER_LOW_SCORE", "1"))
+_PREFILTER_MIN_OVERLAP = float(os.getenv("RELEVANCE_PREFILTER_MIN_OVERLAP", "0.5"))
+# 中文字符：没有jieba时中文文本无法分词，关键词重合为0并不代表无关
+_CJK_PATTERN = re.compile('[\u4e00-\u9fff]')
+
+# 清理文献标题中可能导致提示词format错误的字符，单次translate完成全部替换
+_TITLE_TRANS = str.maketrans({'\n': ' ', '\r': ' ', '"': "'", '{': '(', '}': ')'})
+
+# AI响应解析所用的正则表达式，在模块加载时编译一次
+_JSON_START_RE = re.compile(r'\{')
+_JSON_DECODER = json.JSONDecoder()
+_JSON_OBJECT_PATTERN = re.compile(r'\{.*\}', re.DOTALL)
+_SCORE_LINE_PATTERN = re.compile(r'(\d+)/10分')
+_LOOSE_SCORE_PATTERN = re.compile(r'(\d{1,2})[分/]')
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[。！？.!?]')
+_SCORE_PATTERN = re.compile(r'(\d{1,2}(?:\.\d{1,2})?)/10分|评分[:：]?\s*(\d{1,2}(?:\.\d{1,2})?)|相关性[:：]?\s*(\d{1,2}(?:\.\d{1,2})?)分')
+_YES_NO_PATTERN = re.compile(r'(是否适合引用|适合引用)[：:]?\s*(是|否|适合|不适合|推荐|不推荐)')
+_BASIS_PATTERNS = (
+    re.compile(r'(简要依据|依据|理由|原因|分析|说明)[：:]?\s*([^\n\r。！？.!?]*[。！？.!?]|.*)'),
+    re.compile(r'(因为|由于|基于)[^，。！？.!?，。！？.!?]*[，。！？.!?]'),
+    re.compile(r'[^。！？.!?]*?(相关|引用|适合|不.*相关|不.*适合)[^。！？.!?]*[。！？.!?]'),
+)
+
+
+@lru_cache(maxsize=None)
+def _word_extractor():
+    """延迟导入并复用Word提取器实例（提取器无状态，可在多次调用间共享）"""
+    from core.extractor.word_extractor import WordExtractor
+    return WordExtractor()
+
+
+@lru_cache(maxsize=None)
+def _pdf_extractor():
+    """延迟导入并复用PDF提取器实例"""
+    from core.extractor.pdf_extractor import PDFExtractor
+    return PDFExtractor()
 
 
 class RelevanceChecker(BaseChecker):
@@ -61,36 +121,19 @@ class RelevanceChecker(BaseChecker):
         Returns:
             ComplianceResult: 检查结果
         """
-        # 读取提示词模板
-        prompt_template = (self.prompts_dir / "quick_check_prompt.txt").read_text(encoding='utf-8')
-
-        # 替换模板中的占位符
-        # 优先使用文档元数据中的标题，如果不存在则尝试从文档内容中提取
-        document_title = document.metadata.get('title', None) if hasattr(document, 'metadata') else None
-
-        if not document_title or document_title == '未知标题':
-            # 如果文档元数据中没有标题，尝试从文档内容中提取
-            if hasattr(document, 'content') and document.content:
-                from .relevance_checking.title_extractor import extract_title_from_content
-                extracted_title = extract_title_from_content(document.content)
-                if extracted_title:
-                    document_title = extracted_title
-                else:
-                    # 如果仍然无法提取标题，使用文件名作为后备
-                    if hasattr(document, 'metadata') and 'file_path' in document.metadata:
-                        import os  # 确保os模块可用
-                        document_title = os.path.splitext(os.path.basename(document.metadata['file_path']))[0]
-                    else:
-                        document_title = '未知标题'
-        # else: document_title 已经有值，不需要修改
-
-        # 确保document_title是字符串类型并且不包含可能导致format错误的字符
-        if not isinstance(document_title, str):
-            document_title = str(document_title) if document_title is not None else '未知标题'
+        document_title = self._resolve_document_title(document)
 
         # 防止document_title包含特殊字符导致format错误
         # 如果document_title包含换行符或其他特殊字符，进行清理
-        document_title = str(document_title).replace('\n', ' ').replace('\r', ' ').replace('"', "'").replace('{', '(').replace('}', ')').strip()
+        document_title = str(document_title).translate(_TITLE_TRANS).strip()
+
+        # 预筛选：明显相关或明显无关的情况直接使用基础检查结果，跳过AI调用
+        prefilter_result = self._prefilter(document_title, target_content, task_type)
+        if prefilter_result is not None:
+            return prefilter_result
+
+        # 读取提示词模板
+        prompt_template = (self.prompts_dir / "quick_check_prompt.txt").read_text(encoding='utf-8')
 
         try:
             prompt = prompt_template.format(task_type=task_type, document_title=document_title, target_content=target_content)
@@ -106,9 +149,8 @@ class RelevanceChecker(BaseChecker):
         ai_response = ai_generate(prompt)
 
         # 检查AI服务是否可用
-        if "错误：" in ai_response or "AI服务未配置有效密钥" in ai_response:
+        if _AI_ERROR_RE.search(ai_response):
             # 如果AI服务不可用，使用基础检查方法
-            from .relevance_checking.basic_relevance_checker import basic_relevance_check
             result = basic_relevance_check(document_title, target_content)
             result["task_type"] = task_type  # 添加task_type字段
         else:
@@ -137,6 +179,107 @@ class RelevanceChecker(BaseChecker):
 
         return compliance_result
 
+    def _prefilter(self, document_title: str, target_content: str, task_type: str) -> Optional[ComplianceResult]:
+        """
+        使用基础文本匹配进行预筛选，结论足够明确时返回结果以跳过AI调用
+
+        Args:
+            document_title: 文献标题
+            target_content: 对比内容（文章标题或段落内容）
+            task_type: 任务类型，"文章整体" 或 "段落"
+
+        Returns:
+            Optional[ComplianceResult]: 预筛选结果，结论不明确时返回None
+        """
+        if not _PREFILTER_ENABLED or not document_title or document_title == '未知标题':
+            return None
+
+        result = basic_relevance_check(document_title, target_content)
+
+        clearly_relevant = (result['relevance_score'] >= _PREFILTER_HIGH_SCORE
+                            and result['keyword_match_ratio'] > _PREFILTER_MIN_OVERLAP)
+        # 只有能够可靠分词时（安装了jieba，或文本不含中文）才根据关键词零重合判定明显无关；
+        # 否则中文标题和内容各自只会被切成一个词，相关的文本也会得到零重合
+        can_tokenize = JIEBA_AVAILABLE or not (_CJK_PATTERN.search(document_title)
+                                               or _CJK_PATTERN.search(target_content))
+        clearly_irrelevant = (can_tokenize
+                              and result['relevance_score'] <= _PREFILTER_LOW_SCORE
+                              and result['keywords_matched'] == 0)
+        if not (clearly_relevant or clearly_irrelevant):
+            return None
+
+        result["task_type"] = task_type  # 添加task_type字段
+        return ComplianceResult(
+            check_type=CheckType.RELEVANCE,
+            is_compliant=result['is_suitable_for_citation'],
+            issues=[result],
+            statistics={
+                "relevance_score": result['relevance_score'],
+                "task_type": task_type,
+                "check_method": "prefilter"
+            },
+            metadata={
+                "ai_response": None,
+                "checker_version": "1.0.0"
+            }
+        )
+
+    @staticmethod
+    def _meta(document: Document, key: str, default: Any = None) -> Any:
+        """
+        读取文档元数据中的字段
+
+        Args:
+            document: 文档对象
+            key: 元数据键名
+            default: 元数据缺失时的默认值
+
+        Returns:
+            Any: 元数据值
+        """
+        metadata = getattr(document, 'metadata', None)
+        return metadata.get(key, default) if metadata else default
+
+    def _resolve_document_title(self, document: Document) -> str:
+        """
+        解析文献标题，结果缓存在文档对象的 _cached_title 上（同一文献常与多个目标内容比较）；
+        该字段只由文档本身推导，文档经 extract_document 被多个调用方共享时也保持一致
+
+        Args:
+            document: 要检查的文献文档对象
+
+        Returns:
+            str: 文献标题
+        """
+        cached_title = getattr(document, '_cached_title', None)
+        if cached_title is not None:
+            return cached_title
+
+        # 优先使用文档元数据中的标题，如果不存在则尝试从文档内容中提取
+        document_title = self._meta(document, 'title')
+
+        if not document_title or document_title == '未知标题':
+            # 如果文档元数据中没有标题，尝试从文档内容中提取
+            if hasattr(document, 'content') and document.content:
+                extracted_title = extract_title_from_content(document.content)
+                if extracted_title:
+                    document_title = extracted_title
+                else:
+                    # 如果仍然无法提取标题，使用文件名作为后备
+                    file_path = self._meta(document, 'file_path')
+                    if file_path:
+                        document_title = os.path.splitext(os.path.basename(file_path))[0]
+                    else:
+                        document_title = '未知标题'
+        # else: document_title 已经有值，不需要修改
+
+        # 确保document_title是字符串类型
+        if not isinstance(document_title, str):
+            document_title = str(document_title) if document_title is not None else '未知标题'
+
+        document._cached_title = document_title
+        return document_title
+
     def _accurate_check(self, document: Document, target_content: str, task_type: str) -> ComplianceResult:
         """
         准确检查（基于全文）
@@ -159,18 +302,27 @@ class RelevanceChecker(BaseChecker):
         # 读取提示词模板
         prompt_template = (self.prompts_dir / "accurate_check_prompt.txt").read_text(encoding='utf-8')
         
+        # 只保留与对比内容最相关的片段，避免长文献超出模型上下文限制
+        selected_excerpts = select_relevant_chunks(full_content, target_content)
+
         # 替换模板中的占位符
-        prompt = prompt_template.format(task_type=task_type, full_content=full_content, target_content=target_content)
+        try:
+            prompt = prompt_template.format(task_type=task_type, selected_excerpts=selected_excerpts, target_content=target_content)
+        except (KeyError, ValueError, IndexError) as e:
+            # 模板中的JSON示例包含花括号，format失败时使用安全的字符串替换方法
+            print(f"格式化提示词模板时出错: {e}")
+            prompt = prompt_template.replace("{task_type}", str(task_type)) \
+                                   .replace("{selected_excerpts}", selected_excerpts) \
+                                   .replace("{target_content}", str(target_content))
 
         # 调用AI生成结果
         ai_response = ai_generate(prompt)
 
         # 检查AI服务是否可用
-        if "错误：" in ai_response or "AI服务未配置有效密钥" in ai_response:
+        if _AI_ERROR_RE.search(ai_response):
             # 如果AI服务不可用，使用基础检查方法
             # 使用文档标题和目标内容进行基础检查
-            document_title = document.metadata.get('title', '未知标题') if hasattr(document, 'metadata') else '未知标题'
-            from .relevance_checking.basic_relevance_checker import basic_relevance_check
+            document_title = self._meta(document, 'title', '未知标题')
             result = basic_relevance_check(document_title, target_content)
             result["task_type"] = task_type  # 添加task_type字段
         else:
@@ -199,6 +351,26 @@ class RelevanceChecker(BaseChecker):
 
         return compliance_result
 
+    def prewarm_contents(self, documents: List[Document], max_workers: Optional[int] = None) -> None:
+        """
+        并发提取一批文献的完整内容并缓存到 document.full_text，
+        之后的准确检查将直接使用缓存内容而不再重复提取（full_text只由文献文件推导，
+        与 _cached_title 一样是可以在共享文档上写入的备忘字段）
+
+        Args:
+            documents: 文献文档对象列表
+            max_workers: 最大线程数，默认为 min(8, CPU核数)
+        """
+        pending = [doc for doc in documents if not getattr(doc, 'full_text', None)]
+        if not pending:
+            return
+
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for document, full_content in zip(pending, executor.map(self._get_full_content, pending)):
+                if full_content:
+                    document.full_text = full_content
+
     def _get_full_content(self, document: Document) -> str:
         """
         获取文献的完整内容
@@ -214,28 +386,21 @@ class RelevanceChecker(BaseChecker):
             return document.full_text
 
         # 检查文档的metadata中是否有文件路径
-        file_path = None
-        if hasattr(document, 'metadata') and 'file_path' in document.metadata:
-            file_path = document.metadata['file_path']
-        elif hasattr(document, 'file_path'):
-            file_path = document.file_path
+        file_path = self._meta(document, 'file_path') or getattr(document, 'file_path', None)
 
         # 如果有文件路径，使用适当的提取器提取内容
-        import os  # 确保os模块可用
         if file_path and os.path.exists(file_path):
             _, ext = os.path.splitext(file_path)
             ext = ext.lower().lstrip('.')
 
             if ext in ['doc', 'docx']:
-                from core.extractor.word_extractor import WordExtractor
-                extractor = WordExtractor()
+                extractor = _word_extractor()
             elif ext == 'pdf':
                 # 使用PDF提取器
-                from core.extractor.pdf_extractor import PDFExtractor
-                extractor = PDFExtractor()
+                extractor = _pdf_extractor()
             else:
                 # 如果文件类型不支持，尝试获取文档标题用于AI搜索
-                document_title = document.metadata.get('title', '') if hasattr(document, 'metadata') else ''
+                document_title = self._meta(document, 'title', '')
                 return document_title if document_title is not None else "无法获取文献内容"
 
             try:
@@ -243,22 +408,22 @@ class RelevanceChecker(BaseChecker):
                 extracted_document = extractor.extract(file_path)
                 # 将提取的段落合并为完整内容
                 if extracted_document.content and extracted_document.content is not None:
-                    # 过滤掉 None 值并确保所有元素都是字符串
-                    filtered_content = [str(item) if item is not None else "" for item in extracted_document.content]
-                    full_content = '\n'.join(filtered_content)
+                    # 过滤掉 None 值并确保所有元素都是字符串（生成器直接交给join，不构造中间列表）
+                    full_content = '\n'.join(
+                        '' if item is None else item if isinstance(item, str) else str(item)
+                        for item in extracted_document.content
+                    )
                 else:
                     full_content = "文档内容为空"
                 return full_content
             except Exception as e:
                 print(f"提取文档内容失败: {e}")
                 # 如果提取失败，尝试获取文档标题用于AI搜索
-                document_title = document.metadata.get('title', '') if hasattr(document, 'metadata') else ''
+                document_title = self._meta(document, 'title', '')
                 return document_title if document_title is not None else f"提取文档内容失败: {str(e)}"
 
         # 检查文档的metadata中是否有PDF URL
-        pdf_url = None
-        if hasattr(document, 'metadata') and 'pdf_url' in document.metadata:
-            pdf_url = document.metadata['pdf_url']
+        pdf_url = self._meta(document, 'pdf_url')
 
         # 如果文档有PDF URL，则下载并转换PDF
         if pdf_url:
@@ -267,7 +432,7 @@ class RelevanceChecker(BaseChecker):
                 return pdf_content
 
         # 获取文档标题用于AI搜索
-        document_title = document.metadata.get('title', '') if hasattr(document, 'metadata') else ''
+        document_title = self._meta(document, 'title', '')
 
         # 如果没有PDF URL或下载失败，尝试通过AI搜索获取文献摘要或内容
         if document_title:
@@ -299,11 +464,8 @@ class RelevanceChecker(BaseChecker):
             ai_response = ai_generate(prompt)
 
             # 尝试解析AI返回的JSON格式内容
-            import json
-            import re
-
             # 提取可能的JSON部分（去除可能的额外文本）
-            json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+            json_match = _JSON_OBJECT_PATTERN.search(ai_response)
             if json_match:
                 json_str = json_match.group()
                 try:
@@ -353,34 +515,26 @@ class RelevanceChecker(BaseChecker):
         Returns:
             str: 转换后的文本内容
         """
-        import os  # 确保在此方法中导入os模块
         try:
             # 下载PDF文件
-            response = requests.get(pdf_url)
-            if response.status_code == 200:
-                # 保存临时PDF文件
-                temp_pdf_path = "/tmp/temp_document.pdf"
-                with open(temp_pdf_path, 'wb') as f:
-                    f.write(response.content)
+            response = requests.get(pdf_url, stream=True)
+            if response.status_code != 200:
+                return f"无法下载PDF文件，状态码: {response.status_code}"
+
+            # 保存为临时PDF文件（每次调用使用独立的文件名，避免并发时互相覆盖）
+            temp_file = tempfile.NamedTemporaryFile(suffix='.pdf', delete=False)
+            try:
+                with temp_file:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        temp_file.write(chunk)
 
                 # 使用mineru转换PDF为markdown
                 from utils.mineru_pdf_converter import convert_pdf_to_markdown
-                markdown_content = convert_pdf_to_markdown(temp_pdf_path)
-
-                # 删除临时文件
-                if os.path.exists(temp_pdf_path):
-                    os.remove(temp_pdf_path)
-
-                return markdown_content
-            else:
-                return f"无法下载PDF文件，状态码: {response.status_code}"
+                return convert_pdf_to_markdown(temp_file.name)
+            finally:
+                # 确保即使在异常情况下也清理临时文件
+                os.unlink(temp_file.name)
         except Exception as e:
-            # 确保即使在异常情况下也清理临时文件
-            try:
-                if os.path.exists(temp_pdf_path):
-                    os.remove(temp_pdf_path)
-            except:
-                pass  # 忽略清理临时文件时的错误
             return f"获取PDF内容时出错: {str(e)}"
 
     def _get_content_from_giisp(self, title: str) -> str:
@@ -396,6 +550,27 @@ class RelevanceChecker(BaseChecker):
         # 直接使用AI搜索功能
         return self._get_content_from_ai_search(title)
 
+    @staticmethod
+    def _fill_result_from_json(result: Dict[str, Any], json_data: Dict[str, Any]) -> None:
+        """
+        将AI返回的JSON字段填充到结果字典中
+
+        Args:
+            result: 待填充的结果字典
+            json_data: 解析得到的JSON对象
+        """
+        if 'relevance_score' in json_data:
+            result['relevance_score'] = int(json_data['relevance_score'])
+        if 'is_suitable_for_citation' in json_data:
+            result['is_suitable_for_citation'] = bool(json_data['is_suitable_for_citation'])
+        if 'brief_basis' in json_data:
+            result['brief_basis'] = str(json_data['brief_basis'])
+        if 'reasoning' in json_data:
+            result['detailed_reasoning'] = str(json_data['reasoning'])
+        # 兼容不同的字段名
+        if 'detailed_reasoning' in json_data:
+            result['detailed_reasoning'] = str(json_data['detailed_reasoning'])
+
     def _parse_ai_response(self, ai_response: str, task_type: str, detailed: bool = False) -> Dict[str, Any]:
         """
         解析AI响应
@@ -426,106 +601,46 @@ class RelevanceChecker(BaseChecker):
             result["brief_basis"] = f"AI响应类型错误，期望字符串，实际为{type(ai_response)}，无法进行相关性分析"
             return result
 
-        # 检查AI响应是否包含错误信息
-        if "AI服务返回空响应" in ai_response or "错误：" in ai_response or "AI调用错误" in ai_response:
-            result["brief_basis"] = f"AI服务调用失败: {ai_response}"
-            return result
-
-        # 检查AI响应是否为HTML页面（常见错误响应）
-        if "<!DOCTYPE html>" in ai_response or "<html" in ai_response or "<head" in ai_response:
-            result["brief_basis"] = "AI服务返回了HTML页面而非文本响应，请检查API配置"
+        # 快速路径：整个响应就是一个JSON对象时直接解析，跳过后续的启发式处理
+        stripped_response = ai_response.strip()
+        if stripped_response.startswith('{') and stripped_response.endswith('}'):
+            try:
+                json_result = dict(result)
+                self._fill_result_from_json(json_result, _json_loads(stripped_response))
+                return json_result
+            except (ValueError, TypeError):
+                pass
+
+        # 检查AI响应是否包含错误信息或为HTML页面（常见错误响应），一次扫描完成
+        error_match = _AI_ERROR_RE.search(ai_response)
+        if error_match:
+            if error_match.group(0) in _HTML_ERROR_TOKENS:
+                result["brief_basis"] = "AI服务返回了HTML页面而非文本响应，请检查API配置"
+            else:
+                result["brief_basis"] = f"AI服务调用失败: {ai_response}"
             return result
 
-        # 尝试解析JSON格式的响应（新添加）
-        import json
-        import re
-
         # 预处理AI响应，移除可能的多余空白字符
         processed_response = ai_response.strip()
 
-        # 提取可能的JSON部分（去除可能的额外文本）
-        # 使用更精确的正则表达式来匹配完整的JSON对象
-        # 首先尝试匹配最外层的完整JSON对象
-        try:
-            brace_count = 0
-            start_pos = -1
-            json_candidate = ""
-
-            # 找到第一个左花括号
-            for i, char in enumerate(processed_response):
-                if char == '{':
-                    if brace_count == 0:
-                        start_pos = i
-                    brace_count += 1
-                elif char == '}':
-                    brace_count -= 1
-                    if brace_count == 0 and start_pos != -1:
-                        # 找到匹配的闭合括号，提取JSON字符串
-                        json_candidate = processed_response[start_pos:i+1]
-                        try:
-                            json_data = json.loads(json_candidate)
-
-                            # 提取JSON中的字段
-                            if 'relevance_score' in json_data:
-                                result['relevance_score'] = int(json_data['relevance_score'])
-                            if 'is_suitable_for_citation' in json_data:
-                                result['is_suitable_for_citation'] = bool(json_data['is_suitable_for_citation'])
-                            if 'brief_basis' in json_data:
-                                result['brief_basis'] = str(json_data['brief_basis'])
-                            if 'reasoning' in json_data:
-                                result['detailed_reasoning'] = str(json_data['reasoning'])
-                            # 兼容不同的字段名
-                            if 'detailed_reasoning' in json_data:
-                                result['detailed_reasoning'] = str(json_data['detailed_reasoning'])
-
-                            # 如果JSON解析成功，直接返回结果
-                            return result
-                        except json.JSONDecodeError:
-                            # 如果当前JSON解析失败，继续寻找下一个可能的JSON对象
-                            continue
-                        except Exception as e:
-                            # 记录异常但继续寻找其他可能的JSON对象
-                            print(f"解析JSON时发生异常: {e}")
-                            continue
-        except Exception as e:
-            # 如果遍历字符串时出错，记录错误并继续使用其他方法
-            print(f"遍历AI响应字符串时发生异常: {e}")
+        # 尝试解析JSON格式的响应：从每个左花括号处用C实现的raw_decode解码，
+        # 遇到第一个合法的JSON对象即停止
+        for match in _JSON_START_RE.finditer(processed_response):
+            try:
+                json_data, _ = _JSON_DECODER.raw_decode(processed_response, match.start())
+            except json.JSONDecodeError:
+                # 如果当前位置解析失败，继续寻找下一个可能的JSON对象
+                continue
 
-        # 如果上述方法失败，再尝试使用正则表达式提取JSON
-        # Python的re模块不支持递归，所以我们使用简单的非贪婪匹配
-        try:
-            json_match = re.search(r'\{[^{}]*\}', processed_response) or re.search(r'\{.*?\}', processed_response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                try:
-                    json_data = json.loads(json_str)
+            try:
+                self._fill_result_from_json(result, json_data)
+            except (ValueError, TypeError) as e:
+                # 记录异常但继续寻找其他可能的JSON对象
+                print(f"解析JSON时发生异常: {e}")
+                continue
 
-                    # 提取JSON中的字段
-                    if 'relevance_score' in json_data:
-                        result['relevance_score'] = int(json_data['relevance_score'])
-                    if 'is_suitable_for_citation' in json_data:
-                        result['is_suitable_for_citation'] = bool(json_data['is_suitable_for_citation'])
-                    if 'brief_basis' in json_data:
-                        result['brief_basis'] = str(json_data['brief_basis'])
-                    if 'reasoning' in json_data:
-                        result['detailed_reasoning'] = str(json_data['reasoning'])
-                    # 兼容不同的字段名
-                    if 'detailed_reasoning' in json_data:
-                        result['detailed_reasoning'] = str(json_data['detailed_reasoning'])
-
-                    # 如果JSON解析成功，直接返回结果
-                    return result
-                except json.JSONDecodeError:
-                    # JSON解析失败，继续使用原来的解析方法
-                    pass
-                except Exception as e:
-                    # 其他异常也继续使用原来的解析方法
-                    print(f"解析JSON时发生异常: {e}")
-                    pass
-        except Exception as e:
-            # 如果正则表达式匹配失败，记录错误并继续使用原来的解析方法
-            print(f"正则表达式匹配JSON时发生异常: {e}")
-            pass
+            # 如果JSON解析成功，直接返回结果
+            return result
 
         # 方法1: 按照标准格式解析（保留向后兼容性）
         try:
@@ -537,7 +652,7 @@ class RelevanceChecker(BaseChecker):
                     continue
                 if line.startswith('1. 相关性评分：') or '相关性评分：' in line:
                     # 提取评分
-                    score_match = re.search(r'(\d+)/10分', line)
+                    score_match = _SCORE_LINE_PATTERN.search(line)
                     if score_match:
                         try:
                             result['relevance_score'] = int(score_match.group(1))
@@ -569,8 +684,7 @@ class RelevanceChecker(BaseChecker):
             if result['relevance_score'] == 0 and (not result['brief_basis'] or result['brief_basis'] in ['简要依据未找到', '详细理由未找到']):
                 # 尝试从整个响应中提取评分
                 # 查找 "X/10分" 或 "X分" 的模式
-                score_pattern = r'(\d{1,2}(?:\.\d{1,2})?)/10分|评分[:：]?\s*(\d{1,2}(?:\.\d{1,2})?)|相关性[:：]?\s*(\d{1,2}(?:\.\d{1,2})?)分'
-                score_matches = re.findall(score_pattern, processed_response)
+                score_matches = _SCORE_PATTERN.findall(processed_response)
                 for match in score_matches:
                     # match 是一个元组，包含所有捕获组
                     for group in match:
@@ -586,7 +700,7 @@ class RelevanceChecker(BaseChecker):
 
                 # 如果上面没找到评分，尝试更宽松的模式
                 if result['relevance_score'] == 0:
-                    loose_score_match = re.search(r'(\d{1,2})[分/]', processed_response)
+                    loose_score_match = _LOOSE_SCORE_PATTERN.search(processed_response)
                     if loose_score_match:
                         try:
                             score_val = int(loose_score_match.group(1))
@@ -595,8 +709,7 @@ class RelevanceChecker(BaseChecker):
                             pass  # 如果无法转换为整数，保持默认值
 
                 # 查找是否适合引用 - 使用更精确的模式
-                yes_no_pattern = r'(是否适合引用|适合引用)[：:]?\s*(是|否|适合|不适合|推荐|不推荐)'
-                yes_no_match = re.search(yes_no_pattern, processed_response)
+                yes_no_match = _YES_NO_PATTERN.search(processed_response)
                 if yes_no_match:
                     decision_part = yes_no_match.group(2)
                     positive_keywords = ['是', '适合', '推荐', '可以', '建议']
@@ -614,14 +727,8 @@ class RelevanceChecker(BaseChecker):
                         result['is_suitable_for_citation'] = False
 
                 # 查找简要依据 - 使用更广泛的模式
-                basis_patterns = [
-                    r'(简要依据|依据|理由|原因|分析|说明)[：:]?\s*([^\n\r。！？.!?]*[。！？.!?]|.*)',
-                    r'(因为|由于|基于)[^，。！？.!?，。！？.!?]*[，。！？.!?]',
-                    r'[^。！？.!?]*?(相关|引用|适合|不.*相关|不.*适合)[^。！？.!?]*[。！？.!?]'
-                ]
-
-                for pattern in basis_patterns:
-                    match = re.search(pattern, processed_response)
+                for pattern in _BASIS_PATTERNS:
+                    match = pattern.search(processed_response)
                     if match:
                         if len(match.groups()) > 1:
                             result['brief_basis'] = match.group(2).strip()
@@ -631,7 +738,7 @@ class RelevanceChecker(BaseChecker):
 
                 # 如果仍然没有找到简要依据，尝试提取包含关键信息的句子
                 if not result['brief_basis'] or result['brief_basis'] in ['简要依据未找到', '详细理由未找到']:
-                    sentences = re.split(r'[。！？.!?]', processed_response)
+                    sentences = _SENTENCE_SPLIT_PATTERN.split(processed_response)
                     for sentence in sentences:
                         sentence = sentence.strip()
                         if len(sentence) > 10 and any(kw in sentence for kw in ['相关', '引用', '适合', '不', '因为', '所以', '由于']):
@@ -4,7 +4,70 @@
 """
 import re
 from difflib import SequenceMatcher
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+# 优先使用C++实现的rapidfuzz计算相似度，不可用时回退到difflib
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# 中文分词（可选），不可用时按空白字符切分
+try:
+    import jieba
+    JIEBA_AVAILABLE = True
+except ImportError:
+    JIEBA_AVAILABLE = False
+
+
+def split_words(text: str) -> Tuple[str, ...]:
+    """
+    对清理后的文本分词（不缓存，用于只处理一次的长文本）
+
+    Args:
+        text: 已清理的文本
+
+    Returns:
+        分词结果
+    """
+    if JIEBA_AVAILABLE:
+        return tuple(word for word in jieba.lcut(text) if word.strip())
+    return tuple(text.split())
+
+
+@lru_cache(maxsize=1024)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """
+    对清理后的文本分词，结果按文本缓存（同一目标内容常与多个标题比较）
+
+    Args:
+        text: 已清理的文本
+
+    Returns:
+        分词结果
+    """
+    return split_words(text)
+
+
+def _similarity(doc_title_tokens: Tuple[str, ...], target_content_tokens: Tuple[str, ...],
+                doc_title_clean: str, target_content_clean: str) -> float:
+    """
+    计算标题与目标内容的相似度（0-1）
+
+    Args:
+        doc_title_tokens: 标题分词结果
+        target_content_tokens: 目标内容分词结果
+        doc_title_clean: 清理后的标题（difflib回退时使用）
+        target_content_clean: 清理后的目标内容（difflib回退时使用）
+
+    Returns:
+        相似度
+    """
+    if RAPIDFUZZ_AVAILABLE:
+        return fuzz.token_set_ratio(' '.join(doc_title_tokens), ' '.join(target_content_tokens)) / 100.0
+    return SequenceMatcher(None, doc_title_clean, target_content_clean).ratio()
 
 
 def basic_relevance_check(document_title: str, target_content: str) -> Dict[str, Any]:
@@ -22,8 +85,11 @@ def basic_relevance_check(document_title: str, target_content: str) -> Dict[str,
     doc_title_clean = re.sub(r'[^\w\s]', '', document_title.lower())
     target_content_clean = re.sub(r'[^\w\s]', '', target_content.lower())
     
+    title_tokens = tokenize(doc_title_clean)
+    target_tokens = tokenize(target_content_clean)
+
     # 计算文本相似度
-    similarity_ratio = SequenceMatcher(None, doc_title_clean, target_content_clean).ratio()
+    similarity_ratio = _similarity(title_tokens, target_tokens, doc_title_clean, target_content_clean)
     
     # 基于相似度计算相关性评分
     relevance_score = int(similarity_ratio * 10)  # 转换为0-10分制
@@ -33,8 +99,8 @@ def basic_relevance_check(document_title: str, target_content: str) -> Dict[str,
     total_keywords = 0
     
     # 从目标内容中提取关键词
-    target_words = set(target_content_clean.split())
-    title_words = set(doc_title_clean.split())
+    target_words = set(target_tokens)
+    title_words = set(title_tokens)
     
     if target_words:
         keywords_matched = len(target_words.intersection(title_words))
@@ -64,5 +130,7 @@ def basic_relevance_check(document_title: str, target_content: str) -> Dict[str,
         "relevance_score": relevance_score,
         "is_suitable_for_citation": is_suitable,
         "brief_basis": basis,
-        "detailed_reasoning": f"文本相似度: {similarity_ratio:.2f}, 关键词匹配率: {keyword_match_ratio:.2f}, 匹配关键词数: {keywords_matched}/{total_keywords}"
+        "detailed_reasoning": f"文本相似度: {similarity_ratio:.2f}, 关键词匹配率: {keyword_match_ratio:.2f}, 匹配关键词数: {keywords_matched}/{total_keywords}",
+        "keyword_match_ratio": keyword_match_ratio,
+        "keywords_matched": keywords_matched
     }
\ No newline at end of file
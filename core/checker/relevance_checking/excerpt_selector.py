@@ -0,0 +1,133 @@
+"""
+文献摘录选择工具
+准确检查时不再把整篇文献放入提示词，而是挑选与对比内容最相关的若干片段
+"""
+import heapq
+import logging
+import os
+import re
+from typing import List, Optional
+
+from .basic_relevance_checker import split_words
+
+logger = logging.getLogger(__name__)
+
+# 单个片段的目标长度（字符数，约对应512个token）
+CHUNK_CHARS = 1000
+# 片段之间的分隔标记
+EXCERPT_SEPARATOR = '\n...\n'
+# 是否使用句向量为片段打分（需要sentence-transformers，首次使用时可能下载模型），默认关闭
+EMBEDDINGS_ENABLED = os.getenv("RELEVANCE_EMBEDDINGS", "0") == "1"
+# 句向量模型名称，可通过环境变量覆盖
+EMBEDDING_MODEL_NAME = os.getenv("RELEVANCE_EMBEDDING_MODEL", "paraphrase-multilingual-MiniLM-L12-v2")
+
+_CLEAN_PATTERN = re.compile(r'[^\w\s]')
+
+# 已加载的句向量模型（加载成功后才保存，失败时下次重试）
+_EMBEDDING_MODEL = None
+
+
+def _embedding_model():
+    """
+    延迟加载句向量模型，未启用或加载失败时返回None
+    """
+    global _EMBEDDING_MODEL
+    if not EMBEDDINGS_ENABLED:
+        return None
+    if _EMBEDDING_MODEL is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _EMBEDDING_MODEL = SentenceTransformer(EMBEDDING_MODEL_NAME)
+        except Exception as e:
+            logger.warning("加载句向量模型 %s 失败，改用关键词打分: %s", EMBEDDING_MODEL_NAME, e)
+            return None
+    return _EMBEDDING_MODEL
+
+
+def _split_chunks(full_content: str, chunk_chars: int) -> List[str]:
+    """
+    按段落切分全文，并将相邻的短段落合并为不超过chunk_chars的片段；
+    超过chunk_chars的段落按chunk_chars硬切分
+
+    Args:
+        full_content: 文献全文
+        chunk_chars: 单个片段的最大长度（含段落间的换行）
+
+    Returns:
+        片段列表
+    """
+    chunks = []
+    current = []
+    current_len = 0
+    for paragraph in full_content.split('\n'):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        for start in range(0, len(paragraph), chunk_chars):
+            piece = paragraph[start:start + chunk_chars]
+            # 加入当前片段时还需要一个换行分隔
+            if current and current_len + 1 + len(piece) > chunk_chars:
+                chunks.append('\n'.join(current))
+                current = []
+                current_len = 0
+            current_len += len(piece) + (1 if current else 0)
+            current.append(piece)
+    if current:
+        chunks.append('\n'.join(current))
+    return chunks
+
+
+def _embedding_scores(chunks: List[str], target_content: str) -> Optional[List[float]]:
+    """
+    使用句向量的余弦相似度为片段打分，模型不可用时返回None
+    """
+    model = _embedding_model()
+    if model is None:
+        return None
+    embeddings = model.encode([target_content] + chunks, normalize_embeddings=True)
+    return (embeddings[1:] @ embeddings[0]).tolist()
+
+
+def _keyword_scores(chunks: List[str], target_content: str) -> List[float]:
+    """
+    使用关键词覆盖率为片段打分（句向量模型不可用时的备用方案）
+    """
+    target_words = set(split_words(_CLEAN_PATTERN.sub('', target_content.lower())))
+    if not target_words:
+        return [0.0] * len(chunks)
+    scores = []
+    for chunk in chunks:
+        chunk_words = set(split_words(_CLEAN_PATTERN.sub('', chunk.lower())))
+        scores.append(len(target_words & chunk_words) / len(target_words))
+    return scores
+
+
+def select_relevant_chunks(full_content: str, target_content: str, k: int = 8,
+                           chunk_chars: int = CHUNK_CHARS) -> str:
+    """
+    从文献全文中选出与对比内容最相关的k个片段，按原文顺序拼接
+
+    Args:
+        full_content: 文献全文
+        target_content: 对比内容（文章标题或段落内容）
+        k: 保留的片段数
+        chunk_chars: 单个片段的目标长度
+
+    Returns:
+        拼接后的摘录文本，长度不超过 k * chunk_chars；全文本身不超过预算时原样返回
+    """
+    budget = k * chunk_chars
+    if not full_content or len(full_content) <= budget:
+        return full_content
+
+    # 为片段之间的分隔标记留出空间，保证拼接结果不超过预算
+    chunks = _split_chunks(full_content, chunk_chars - len(EXCERPT_SEPARATOR))
+    if len(chunks) <= k:
+        return EXCERPT_SEPARATOR.join(chunks)
+
+    scores = _embedding_scores(chunks, target_content)
+    if scores is None:
+        scores = _keyword_scores(chunks, target_content)
+
+    top_indices = heapq.nlargest(k, range(len(chunks)), key=scores.__getitem__)
+    return EXCERPT_SEPARATOR.join(chunks[i] for i in sorted(top_indices))
@@ -3,7 +3,128 @@
 从文档内容中提取实际标题，而不是使用文件名
 """
 import re
-from typing import Optional
+from typing import Optional, Tuple
+
+
+# 论文标题中常见的关键词；先用一次字面量扫描判断行内是否包含关键词，
+# 避免以前 ^(.*?)(关键词1|关键词2|...).*?$ 形式的回溯
+_TITLE_KEYWORDS = frozenset((
+    '题目', '标题', '论文题目', '研究题目', '毕业论文', '学位论文', '硕士论文', '博士论文', '课程论文',
+    '开题报告', '毕业设计', '研究', '分析', '探讨', '综述', '调查报告', '研究综述', '实证研究', '理论研究',
+    '实验研究', '应用研究', '系统设计', '算法研究', '模型构建', '优化方法', '解决方案', '研究进展', '发展现状',
+    '问题及对策', '影响因素分析', '比较研究', '案例分析', '实证分析', '理论分析', '文献综述', '技术综述',
+    '综述报告', '研究方法', '研究方案', '研究计划', '研究背景', '研究目的', '研究意义', '研究内容', '研究结果',
+    '研究结论', '摘要', '前言', '引言', '绪论', '导论', '背景', '目的', '意义', '现状', '发展', '趋势', '问题',
+    '对策', '策略', '方案', '设计', '实现', '应用', '效果', '评价', '讨论', '结论', '建议', '展望',
+    '参考文献', '致谢', '附录',
+))
+_TITLE_KEYWORD_PATTERN = re.compile('|'.join(sorted(map(re.escape, _TITLE_KEYWORDS), key=len, reverse=True)))
+
+# 标题的可能模式（对去除首尾空白后的整行使用fullmatch），在模块加载时编译一次；
+# 主体均为单个有界字符类，匹配时间与行长度呈线性关系
+_TITLE_PATTERNS = (
+    # 中文标题模式（可能包含数字编号）
+    re.compile(r'[一二三四五六七八九十0-9]{0,2}[、.\s]*([\u4e00-\u9fa5a-zA-Z0-9\s\-_]{1,100})'),
+    # 可能是标题的模式（较长的首行，末尾以外不含句号等段落结尾标点）；
+    # 它覆盖了原来"不含任何标点的较长首行"模式：对这类行两者给出相同的标题
+    re.compile(r'([\u4e00-\u9fa5a-zA-Z0-9\s\-_,，：:【】\[\]()（）]{8,100})[。！？.!?]*'),
+)
+_TRAILING_PUNCT_PATTERN = re.compile(r'[。！？.!?；;，,]*$')
+# 统计字母数量：纯ASCII行用bytes.translate删除英文字母，其余行用正则删除非字母字符
+_ASCII_LETTERS = b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_NON_LETTER_PATTERN = re.compile(r'[^\u4e00-\u9fa5a-zA-Z]+')
+# 作者、单位等信息中的关键词，合并为一个正则一次扫描
+_AUTHOR_INFO_PATTERN = re.compile('作者|单位|email|通讯|地址|邮编|电话', re.IGNORECASE)
+_PARAGRAPH_END_PUNCT = ('。', '！', '？', '.', '!', '?', '；', ';')
+_LIST_ITEM_PATTERN = re.compile(r'^\s*[0-9]+[.、]')
+# 章节标题（"第一章 绪论"、"第2节"、"Chapter 1"），是正文结构而不是论文标题
+_CHAPTER_HEADING_PATTERN = re.compile(r'^(?:第[一二三四五六七八九十百零〇0-9]+[章节篇部]|chapter\s*[0-9]+)', re.IGNORECASE)
+
+
+def _title_candidates(line: str):
+    """
+    按优先级依次给出一行文本中可能的标题
+
+    Args:
+        line: 已去除首尾空白的文本行
+
+    Yields:
+        候选标题
+    """
+    # 包含论文相关关键词的行取第一个关键词之前的文本作为标题
+    # （与原来 ^\s*(.*?)(关键词...).*?$ 的分组1相同；该模式不跨越换行）
+    match = _TITLE_KEYWORD_PATTERN.search(line)
+    if match and '\n' not in line:
+        yield line[:match.start()]
+
+    for pattern in _TITLE_PATTERNS:
+        match = pattern.fullmatch(line)
+        if match:
+            yield match.group(1).strip()
+
+
+def _looks_like_title(line: str) -> bool:
+    """
+    判断一行文本的中英文字符比例是否较高，且不以常见段落结束标点结尾
+
+    Args:
+        line: 已去除首尾空白的文本行
+
+    Returns:
+        是否可能是标题
+    """
+    # 去除所有空白后统计中英文字母数量
+    compact = ''.join(line.split())
+    total_chars = len(compact)
+    if total_chars == 0:
+        return False
+    if compact.isascii():
+        letter_chars = total_chars - len(compact.encode('ascii').translate(None, _ASCII_LETTERS))
+    else:
+        letter_chars = len(_NON_LETTER_PATTERN.sub('', compact))
+    return letter_chars / total_chars > 0.4 and not line.endswith(_PARAGRAPH_END_PUNCT)
+
+
+def _score_line(line, index: int) -> Optional[Tuple[int, str]]:
+    """
+    为一行文本评定作为标题的优先级
+
+    Args:
+        line: 原始文本行
+        index: 行在文档中的位置
+
+    Returns:
+        (优先级, 标题)，优先级越小越可信：0 = 符合标题模式（前10行），
+        1 = 前3行中字符比例较高且不像作者、单位等信息，2 = 前5行中字符比例较高；
+        都不满足时返回None
+    """
+    if not line or not isinstance(line, str):
+        return None
+    line = line.strip()
+    if not line:
+        return None
+
+    # 章节标题不是论文标题
+    if _CHAPTER_HEADING_PATTERN.match(line):
+        return None
+
+    # 检查是否符合标题模式（以句末标点结尾的正文句子除外）
+    candidates = () if line.endswith(_PARAGRAPH_END_PUNCT) else _title_candidates(line)
+    for title in candidates:
+        # 移除可能的标点符号
+        title = _TRAILING_PUNCT_PATTERN.sub('', title).strip()
+        if 4 <= len(title) <= 100:  # 标题长度合理
+            return 0, title
+
+    # 检查是否是较长的、包含中文或英文的行，但不包含句号等段落结束标点
+    if index >= 5 or not 8 <= len(line) <= 100 or not _looks_like_title(line):
+        return None
+
+    # 避免将表格内容、列表项或作者、单位等信息误认为标题
+    if (index < 3 and not _LIST_ITEM_PATTERN.match(line) and not line.startswith(('- ', '* '))
+            and not _AUTHOR_INFO_PATTERN.search(line)):
+        return 1, line
+    return 2, line
 
 
 def extract_title_from_content(content: list) -> Optional[str]:
@@ -19,70 +140,16 @@ def extract_title_from_content(content: list) -> Optional[str]:
     if not content:
         return None
 
-    # 定义标题的可能模式
-    title_patterns = [
-        # 包含论文相关关键词的标题
-        r'^\s*(.*?)(?:题目|标题|论文题目|研究题目|毕业论文|学位论文|硕士论文|博士论文|课程论文|开题报告|毕业设计|研究|分析|探讨|综述|调查报告|研究综述|实证研究|理论研究|实验研究|应用研究|系统设计|算法研究|模型构建|优化方法|解决方案|研究进展|发展现状|问题及对策|影响因素分析|比较研究|案例分析|实证分析|理论分析|文献综述|技术综述|综述报告|研究方法|研究方案|研究计划|研究背景|研究目的|研究意义|研究内容|研究方法|研究结果|研究结论|摘要|前言|引言|绪论|导论|背景|目的|意义|现状|发展|趋势|问题|对策|策略|方案|设计|实现|应用|效果|评价|分析|讨论|结论|建议|展望|参考文献|致谢|附录).*?$',
-        # 中文标题模式（可能包含数字编号）
-        r'^\s*[一二三四五六七八九十0-9]{0,2}[、.\s]*([\\u4e00-\\u9fa5a-zA-Z0-9\\s\\-_]+)$',
-        # 简单的标题模式（较长的首行，不含句号等标点）
-        r'^\s*([\\u4e00-\\u9fa5a-zA-Z0-9\\s\\-_,，：:【】\[\]()（）]{8,100})$',
-        # 可能是标题的模式（不含常见段落结尾标点）
-        r'^\s*([\\u4e00-\\u9fa5a-zA-Z0-9\\s\\-_,，：:【】\[\]()（）]{8,100})[。！？.!?]*$',
-    ]
-
-    # 检查文档的前几行，通常标题会在前面
-    for i, line in enumerate(content[:10]):  # 检查前10行
-        if line and isinstance(line, str):
-            line = line.strip()
-            if not line:
-                continue
-
-            # 检查是否符合标题模式
-            for pattern in title_patterns:
-                match = re.match(pattern, line, re.IGNORECASE)
-                if match:
-                    title = match.group(1).strip() if match.lastindex else line.strip()
-                    # 移除可能的标点符号
-                    title = re.sub(r'[。！？.!?；;，,]*$', '', title).strip()
-                    if 4 <= len(title) <= 100 and len(title) > 0:  # 标题长度合理
-                        return title
-
-    # 特别检查前3行，看是否有明显是标题的内容
-    for i, line in enumerate(content[:3]):
-        if line and isinstance(line, str):
-            line = line.strip()
-            if not line:
-                continue
-
-            # 检查是否是较长的、包含中文或英文的行，但不包含句号等段落结束标点
-            if 8 <= len(line) <= 100:
-                # 检查是否包含足够的中文或英文字符
-                chinese_chars = len(re.findall(r'[\u4e00-\u9fa5]', line))
-                english_chars = len(re.findall(r'[a-zA-Z]', line))
-                total_chars = len(re.sub(r'\s', '', line))
-
-                # 如果中文和英文字符比例较高，且不以常见段落结束标点结尾，则可能是标题
-                if (total_chars > 0 and (chinese_chars + english_chars) / total_chars > 0.4 and
-                    not line.endswith(('。', '！', '？', '.', '!', '?', '；', ';'))):
-                    # 避免将表格内容或列表项误认为标题
-                    if not re.match(r'^\s*[0-9]+[.、]', line) and not line.startswith('- ') and not line.startswith('* '):
-                        # 避免将作者、单位等信息误认为标题
-                        if not any(keyword in line.lower() for keyword in ['作者', '单位', 'email', '通讯', '地址', '邮编', '电话']):
-                            return line
-
-    # 如果没有找到明确的标题，返回第一个有意义的段落（但要确保不是其他内容）
-    for line in content[:5]:
-        if line and isinstance(line, str):
-            line = line.strip()
-            if 8 <= len(line) <= 100 and line:
-                # 检查是否包含足够的中文或英文字符
-                chinese_chars = len(re.findall(r'[\u4e00-\u9fa5]', line))
-                english_chars = len(re.findall(r'[a-zA-Z]', line))
-                total_chars = len(re.sub(r'\s', '', line))
-
-                if (total_chars > 0 and (chinese_chars + english_chars) / total_chars > 0.4 and
-                    not line.endswith(('。', '！', '？', '.', '!', '?', '；', ';'))):
-                    return line
-
-    return None
\ No newline at end of file
+    # 检查文档的前10行，符合标题模式的行立即返回，其余行记下优先级备用
+    best = None
+    for index, line in enumerate(content[:10]):
+        score = _score_line(line, index)
+        if score is None:
+            continue
+        if score[0] == 0:
+            return score[1]
+        if best is None or score[0] < best[0]:
+            best = score
+
+    # 没有符合标题模式的行时，返回前几行中最像标题的内容
+    return best[1] if best else None
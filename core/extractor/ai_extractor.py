@@ -3,217 +3,326 @@ AI增强的文档内容提取器
 包含从文档中提取引用、参考文献等的AI增强功能
 """
 
+import os
 import re
-from docx import Document
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from .fast_paragraphs import DocxSource, read_paragraph_texts
+from .citation_patterns import compile_alternation, author_year
+from typing import List, Dict, Any, Optional, Sequence, Union
 
 
-def extract_references_with_context(docx_path: str, config: Optional[Dict] = None) -> List[Dict[str, Any]]:
-    """提取文档中的作者年份格式引用及其上下文"""
-    # 多种引用格式的模式
-    patterns = [
-        # 格式1: 作者（年份） - 中文括号
-        (r'([A-Za-z\u4e00-\u9fa5&＆\s\.]+?)\s*[（(](\d{4})[)）]', 0),
-        # 格式2: (作者, 年份) - 英文括号
-        (r'[（(]([A-Za-z\u4e00-\u9fa5&＆\s\.]+?)\s*[,，]?\s*(\d{4})[)）]', 1),
+# 多种引用格式的模式，在模块加载时合并编译一次。
+# 作者部分的重复次数均设有上限（最多100个字符、10位作者），避免在畸形文本上大量回溯。
+# 可从任意位置开始匹配的宽松格式与以大写姓氏开头的英文格式分为两组，
+# 避免宽松格式从句首开始的长匹配吞掉其中更准确的英文作者
+_CITATION_PATTERNS = (
+    compile_alternation((
         # 格式3: 作者 et al.（年份）
-        (r'([A-Za-z\u4e00-\u9fa5\s]+?)\s+et al\.\s*[（(](\d{4})[)）]', 0),
+        r'([A-Za-z\u4e00-\u9fa5\s]{1,100}?)\s+et al\.\s*[（(](\d{4})[)）]',
         # 格式4: 作者等（年份）
-        (r'([A-Za-z\u4e00-\u9fa5\s]+?)\s+等\s*[（(](\d{4})[)）]', 0),
-        # 格式5: 作者, 首字母. (年份) - 英文格式
-        (r'([A-Z][a-z]+,\s*[A-Z]\.)\s*[（(](\d{4})[)）]', 0),
-        # 格式6: 作者, 首字母. (年份) - 可能有多个作者
-        (r'([A-Z][a-z]+,\s*[A-Z]\.(?:\s*&\s*[A-Z][a-z]+,\s*[A-Z]\.)*)\s*[（(](\d{4})[)）]', 0),
+        r'([A-Za-z\u4e00-\u9fa5\s]{1,100}?)\s+等\s*[（(](\d{4})[)）]',
+        # 格式2: (作者, 年份) - 英文括号
+        r'[（(]([A-Za-z\u4e00-\u9fa5&＆\s\.]{1,100}?)\s*[,，]?\s*(\d{4})[)）]',
+        # 格式1: 作者（年份） - 中文括号
+        r'([A-Za-z\u4e00-\u9fa5&＆\s\.]{1,100}?)\s*[（(](\d{4})[)）]',
+    )),
+    compile_alternation((
+        # 格式5/6: 作者, 首字母. (年份) - 英文格式，可能有多个作者
+        r'([A-Z][a-z]+,\s*[A-Z]\.(?:\s*&\s*[A-Z][a-z]+,\s*[A-Z]\.){0,9})\s*[（(](\d{4})[)）]',
         # 格式7: 作者 (年份) - 英文名+空格+括号
-        (r'([A-Z][a-z]+\s+[A-Z][a-z]+)\s*[（(](\d{4})[)）]', 0)
-    ]
-    
-    doc = Document(docx_path)
+        r'([A-Z][a-z]+\s+[A-Z][a-z]+)\s*[（(](\d{4})[)）]',
+    )),
+)
+
+# 西式引用格式（均以大写姓氏开头，合并为一个正则）
+_WESTERN_CITATION_PATTERN = compile_alternation((
+    # 共用姓氏前缀的三种格式（按原优先级依次尝试）：
+    # Lastname, F. (& Lastname, G.) (year) / Lastname and Lastname (year) / Lastname (year)
+    r'([A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*&\s*[A-Z][a-z]+,\s*[A-Z]\.){0,9}'
+    r'|\s+and\s+[A-Z][a-z]+)?)\s*\((\d{4})\)',
+))
+
+# 从文本中提取引用的模式（分组方式同 _CITATION_PATTERNS）
+_TEXT_CITATION_PATTERNS = (
+    compile_alternation((
+        # 等 格式
+        r'([\u4e00-\u9fa5\w\s]{1,100}?)\s+等[\s\u00a0]*[（(](\d{4})[）)]',
+        # 中文格式: 作者（年份）
+        r'([\u4e00-\u9fa5\w\s\.&＆,，]{1,100}?)\s*[（(](\d{4})[）)]',
+    )),
+    compile_alternation((
+        # 共用大写姓氏前缀的三种格式（按原优先级依次尝试，\s 已包含不换行空格）：
+        # et al. 格式 / 多作者格式: Johnson & Brown (2021) / 西文格式: Author (year)
+        r'([A-Z][a-z]+(?:\s+et\s+al\.'
+        r'|(?:\s*&\s*[A-Z][a-z]+){1,9}'
+        r'|(?:\s+[A-Z]\.)?(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z]\.)?)?))\s*[（(](\d{4})[）)]',
+        # 简单的年份格式: (Smith, 2020)
+        r'[（(]([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)?),?\s*(\d{4})[）)]',
+    )),
+)
+
+# 清理作者名称时去掉的首尾字符
+_AUTHOR_STRIP_CHARS = ' ,，'
+
+# 所有引用格式都包含括号和四位年份
+_YEAR_PATTERN = re.compile(r'\d{4}')
+
+
+def _may_contain_citation(text: str) -> bool:
+    """
+    快速判断文本中是否可能包含引用：先用字符串查找括号，再检查四位年份，
+    都不满足时无需运行引用正则
+    """
+    if '(' not in text and '（' not in text:
+        return False
+    return _YEAR_PATTERN.search(text) is not None
+
+
+def _first_contained_author(original_author: str, author_index: Dict[str, int],
+                            author_lengths: List[int]) -> Optional[int]:
+    """
+    在优化后引用的作者索引中，查找包含于原始作者内（含后缀）且在列表中最靠前的作者
+
+    Args:
+        original_author: 原始引用的作者部分
+        author_index: 优化后引用的作者部分 -> 首次出现的下标
+        author_lengths: 优化后引用作者部分的所有长度（升序）
+
+    Returns:
+        最靠前的优化引用下标，未找到时返回None
+    """
+    # 完全相同的作者是最常见的情况，下标为0时不可能有更靠前的结果
+    best_idx = author_index.get(original_author)
+    if best_idx == 0:
+        return best_idx
+
+    for length in author_lengths:
+        if length >= len(original_author):
+            break
+        for start in range(len(original_author) - length + 1):
+            idx = author_index.get(original_author[start:start + length])
+            if idx is not None and (best_idx is None or idx < best_idx):
+                best_idx = idx
+                if best_idx == 0:
+                    return best_idx
+    return best_idx
+
+
+def _apply_optimized_citations(references: List[Dict[str, Any]], optimized_citations: List[str]) -> List[Dict[str, Any]]:
+    """
+    用AI优化后的引用文本替换原始引用，保持上下文信息
+
+    先精确匹配；否则取作者部分为原始作者子串（含后缀）的优化引用中在列表里最靠前的一个。
+    优化后引用按作者部分建立哈希索引，只枚举原始作者中与某个优化作者等长的子串进行查找，
+    避免对每对引用做字符串比较；同一作者的查找结果只计算一次。
+
+    Args:
+        references: 带上下文的原始引用列表
+        optimized_citations: 优化后的引用文本列表
+
+    Returns:
+        更新后的引用列表；没有对应优化版本的引用保持原样
+    """
+    optimized_set = set(optimized_citations)
+    # 作者部分 -> 首次出现的下标
+    author_index = {}
+    for idx, opt_citation in enumerate(optimized_citations):
+        author_index.setdefault(opt_citation.split('（')[0], idx)
+    author_lengths = sorted({len(author) for author in author_index})
+    author_matches = {}
+
+    optimized_references = []
+    for ref in references:
+        original_citation = ref['citation']
+        optimized_citation = None
+        # 尝试精确匹配
+        if original_citation in optimized_set:
+            optimized_citation = original_citation
+        else:
+            # 模糊匹配：查找作者部分包含在原始作者中的优化引用
+            original_author = original_citation.split('（')[0]
+            if original_author in author_matches:
+                best_idx = author_matches[original_author]
+            else:
+                best_idx = _first_contained_author(original_author, author_index, author_lengths)
+                # 同一作者不同年份的引用共享查找结果
+                author_matches[original_author] = best_idx
+            if best_idx is not None:
+                optimized_citation = optimized_citations[best_idx]
+
+        if optimized_citation:
+            optimized_references.append({
+                'citation': optimized_citation,
+                'context': ref['context']
+            })
+        else:
+            optimized_references.append(ref)  # 如果没有优化版本，使用原始引用
+
+    return optimized_references
+
+
+def _collect_citations(paragraph_texts: Sequence[str], references_start_idx: Optional[int],
+                       patterns) -> List[Dict[str, Any]]:
+    """
+    在已读取的段落中查找引用及其上下文（按引用文本去重）
+
+    Args:
+        paragraph_texts: 文档所有段落的文本
+        references_start_idx: 参考文献部分的起始段落下标（未找到时为None）
+        patterns: 合并后的引用正则序列
+
+    Returns:
+        引用列表，每项包含 citation 和 context
+    """
     references = []
-    
+    seen = set()
+
     # 遍历所有段落，查找引用及其上下文
-    for para_idx, paragraph in enumerate(doc.paragraphs):
-        para_text = paragraph.text.strip()
-        if not para_text:
+    for para_idx, raw_text in enumerate(paragraph_texts):
+        para_text = raw_text.strip()
+        if not para_text or not _may_contain_citation(para_text):
             continue
-            
-        for pattern, group_type in patterns:
-            matches = list(re.finditer(pattern, para_text))
-            for match in matches:
-                # 处理不同模式的匹配组
-                if group_type == 0:  # 作者在前
-                    author, year = match.group(1), match.group(2)
-                else:  # 作者在括号内
-                    author, year = match.group(1), match.group(2)
-                
-                # 清理作者名称
-                author = author.strip()
-                author = re.sub(r'^\s*[,，]\s*', '', author)
-                author = re.sub(r'\s+', ' ', author)
-                author = re.sub(r'[，,]\s*$', '', author)
-                
+
+        for pattern in patterns:
+            for match in pattern.finditer(para_text):
+                author, year = author_year(match)
+
+                # 清理作者名称：合并空白，去掉首尾的逗号
+                author = ' '.join(author.split()).strip(_AUTHOR_STRIP_CHARS)
+
                 # 验证年份
                 if not year.isdigit() or len(year) != 4:
                     continue
-                    
-                # 验证作者
-                if len(author) >= 2 and not author.isdigit():
-                    reference = f"{author}（{year}）"
-                    
-                    # 提取上下文（当前段落及前后段落）
-                    context = extract_context_around_position(doc, para_idx, match.start(), match.end())
-                    
-                    references.append({
-                        'citation': reference,
-                        'context': context
-                    })
-
-    # 去重，保留上下文信息
-    unique_references = []
-    seen = set()
-    for ref in references:
-        if ref['citation'] not in seen:
-            seen.add(ref['citation'])
-            unique_references.append(ref)
-
-    # 提取引用文本用于AI优化
-    citation_texts = [ref['citation'] for ref in unique_references]
-    
-    # 使用AI优化引用列表（如果可用）
-    try:
-        from .ai_optimizer import optimize_citations_with_ai
-        optimized_citations = optimize_citations_with_ai(citation_texts, config)
-        
-        # 更新优化后的引用文本，保持上下文信息
-        optimized_references = []
-        for ref in unique_references:
-            original_citation = ref['citation']
-            # 查找优化后的对应引用
-            optimized_citation = None
-            # 尝试精确匹配
-            if original_citation in optimized_citations:
-                optimized_citation = original_citation
-            else:
-                # 如果没有精确匹配，尝试模糊匹配（检查优化后的引用是否与原始引用的作者部分相关）
-                original_author = original_citation.split('（')[0] if '（' in original_citation else original_citation
-                for opt_citation in optimized_citations:
-                    opt_author = opt_citation.split('（')[0] if '（' in opt_citation else opt_citation
-                    # 检查作者部分是否相似（去除前缀后）
-                    if original_author.endswith(opt_author) or opt_author in original_author:
-                        optimized_citation = opt_citation
-                        break
-        
-            if optimized_citation:
-                optimized_references.append({
-                    'citation': optimized_citation,
-                    'context': ref['context']
-                })
-            else:
-                optimized_references.append(ref)  # 如果没有优化版本，使用原始引用
-        
-        return optimized_references
-    except ImportError:
-        # 如果AI优化模块不可用，返回原始提取结果
-        return unique_references
 
+                # 验证作者
+                if len(author) < 2 or author.isdigit():
+                    continue
 
-def extract_western_references_with_context(docx_path: str, config: Optional[Dict] = None) -> List[Dict[str, Any]]:
-    """专门提取西式格式的引用及其上下文"""
-    # 西式引用格式
-    western_patterns = [
-        # 格式: Lastname, F. (year)
-        (r'([A-Z][a-z]+,\s*[A-Z]\.)\s*\((\d{4})\)', 0),
-        # 格式: Lastname, F. & Lastname, G. (year)
-        (r'([A-Z][a-z]+,\s*[A-Z]\.(?:\s*&\s*[A-Z][a-z]+,\s*[A-Z]\.)*)\s*\((\d{4})\)', 0),
-        # 格式: Lastname (year)
-        (r'([A-Z][a-z]+)\s*\((\d{4})\)', 0),
-        # 格式: Lastname and Lastname (year)
-        (r'([A-Z][a-z]+\s+and\s+[A-Z][a-z]+)\s*\((\d{4})\)', 0)
-    ]
-    
-    doc = Document(docx_path)
-    western_refs = []
-    
-    # 遍历所有段落，查找引用及其上下文
-    for para_idx, paragraph in enumerate(doc.paragraphs):
-        para_text = paragraph.text.strip()
-        if not para_text:
-            continue
-            
-        for pattern, group_type in western_patterns:
-            matches = list(re.finditer(pattern, para_text))
-            for match in matches:
-                author, year = match.group(1), match.group(2)
-                author = author.strip()
                 reference = f"{author}（{year}）"
-                
+                # 去重，保留首次出现的上下文信息
+                if reference in seen:
+                    continue
+                seen.add(reference)
+
                 # 提取上下文（当前段落及前后段落）
-                context = extract_context_around_position(doc, para_idx, match.start(), match.end())
-                
-                western_refs.append({
+                context = extract_context_around_position(
+                    paragraph_texts, references_start_idx, para_idx, match.start(), match.end())
+
+                references.append({
                     'citation': reference,
                     'context': context
                 })
 
+    return references
+
+
+def _optimize_references(references: List[Dict[str, Any]], config: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    """使用AI优化引用列表（如果可用），并保持上下文信息"""
     # 提取引用文本用于AI优化
-    citation_texts = [ref['citation'] for ref in western_refs]
-    
-    # 使用AI优化引用列表（如果可用）
+    citation_texts = [ref['citation'] for ref in references]
+
     try:
         from .ai_optimizer import optimize_citations_with_ai
         optimized_citations = optimize_citations_with_ai(citation_texts, config)
-        
+
         # 更新优化后的引用文本，保持上下文信息
-        optimized_references = []
-        for ref in western_refs:
-            original_citation = ref['citation']
-            # 查找优化后的对应引用
-            optimized_citation = None
-            # 尝试精确匹配
-            if original_citation in optimized_citations:
-                optimized_citation = original_citation
-            else:
-                # 如果没有精确匹配，尝试模糊匹配（检查优化后的引用是否与原始引用的作者部分相关）
-                original_author = original_citation.split('（')[0] if '（' in original_citation else original_citation
-                for opt_citation in optimized_citations:
-                    opt_author = opt_citation.split('（')[0] if '（' in opt_citation else opt_citation
-                    # 检查作者部分是否相似（去除前缀后）
-                    if original_author.endswith(opt_author) or opt_author in original_author:
-                        optimized_citation = opt_citation
-                        break
-        
-            if optimized_citation:
-                optimized_references.append({
-                    'citation': optimized_citation,
-                    'context': ref['context']
-                })
-            else:
-                optimized_references.append(ref)  # 如果没有优化版本，使用原始引用
-        
-        return optimized_references
+        return _apply_optimized_citations(references, optimized_citations)
     except ImportError:
         # 如果AI优化模块不可用，返回原始提取结果
-        return western_refs
+        return references
 
 
-def extract_context_around_position(doc: Document, para_idx: int, start_pos: int, end_pos: int, context_length: int = 100) -> str:
-    """提取指定位置周围的上下文"""
-    # 查找参考文献部分的开始位置
-    references_start_idx = None
-    for i, paragraph in enumerate(doc.paragraphs):
-        if '参考文献' in paragraph.text or 'References' in paragraph.text:
-            references_start_idx = i
-            break
+def extract_references_with_context(docx_path: str, config: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    """提取文档中的作者年份格式引用及其上下文"""
+    paragraph_texts, references_start_idx = _load_paragraph_texts(docx_path)
+    references = _collect_citations(paragraph_texts, references_start_idx, _CITATION_PATTERNS)
+    return _optimize_references(references, config)
+
+
+def extract_western_references_with_context(docx_path: str, config: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    """专门提取西式格式的引用及其上下文"""
+    paragraph_texts, references_start_idx = _load_paragraph_texts(docx_path)
+    western_refs = _collect_citations(paragraph_texts, references_start_idx, (_WESTERN_CITATION_PATTERN,))
+    return _optimize_references(western_refs, config)
 
+
+def extract_all_references_with_context(docx_path: Union[str, DocxSource],
+                                        config: Optional[Dict] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    同时提取作者年份格式和西式格式的引用及其上下文，文档只读取一次
+
+    Args:
+        docx_path: Word文档路径，或调用方已创建的DocxSource
+        config: AI优化配置
+
+    Returns:
+        {'references': 作者年份格式引用, 'western_references': 西式格式引用}
+    """
+    paragraph_texts, references_start_idx = _load_paragraph_texts(docx_path)
+    references = _collect_citations(paragraph_texts, references_start_idx, _CITATION_PATTERNS)
+    western_refs = _collect_citations(paragraph_texts, references_start_idx, (_WESTERN_CITATION_PATTERN,))
+    return {
+        'references': _optimize_references(references, config),
+        'western_references': _optimize_references(western_refs, config),
+    }
+
+
+def _index_paragraph_texts(docx_path: Union[str, DocxSource]):
+    """读取段落文本并定位参考文献部分的起始段落"""
+    paragraph_texts = tuple(read_paragraph_texts(docx_path))
+    references_start_idx = next(
+        (i for i, text in enumerate(paragraph_texts) if '参考文献' in text or 'References' in text),
+        None
+    )
+    return paragraph_texts, references_start_idx
+
+
+@lru_cache(maxsize=8)
+def _load_paragraph_texts_cached(docx_path: str, mtime_ns: int):
+    """按(路径, 修改时间)缓存的段落读取，文件被修改后自动重新读取"""
+    return _index_paragraph_texts(docx_path)
+
+
+def _load_paragraph_texts(docx_path: Union[str, DocxSource]):
+    """
+    读取文档所有段落的文本，并定位参考文献部分的起始段落
+
+    直接流式解析文档XML读取段落文本，避免python-docx每次访问 paragraph.text 都遍历XML；
+    同一文件在未修改时只解析一次，供各个提取入口共享
+
+    Args:
+        docx_path: Word文档路径，或调用方已创建的DocxSource（直接从其内存内容解析，不经过缓存）
+
+    Returns:
+        (段落文本元组, 参考文献起始段落下标；未找到时为None)
+    """
+    if isinstance(docx_path, DocxSource):
+        return _index_paragraph_texts(docx_path)
+    return _load_paragraph_texts_cached(os.path.abspath(docx_path), os.stat(docx_path).st_mtime_ns)
+
+
+def extract_context_around_position(paragraph_texts: Sequence[str], references_start_idx: Optional[int],
+                                    para_idx: int, start_pos: int, end_pos: int,
+                                    context_length: int = 100) -> str:
+    """
+    提取指定位置周围的上下文
+
+    Args:
+        paragraph_texts: 文档所有段落的文本
+        references_start_idx: 参考文献部分的起始段落下标（未找到时为None）
+        para_idx: 引用所在段落下标
+        start_pos: 引用在段落中的起始位置
+        end_pos: 引用在段落中的结束位置
+        context_length: 引用前后各保留的字符数
+
+    Returns:
+        上下文文本
+    """
     # 如果引用在参考文献部分，则不提取上下文
     if references_start_idx is not None and para_idx >= references_start_idx:
         return "引用出现在参考文献部分"
 
-    paragraph = doc.paragraphs[para_idx]
-    para_text = paragraph.text
-
-    # 获取引用在段落中的文本
-    citation_text = para_text[start_pos:end_pos]
+    para_text = paragraph_texts[para_idx]
 
     # 提取引用周围的上下文
     context_start = max(0, start_pos - context_length)
@@ -221,19 +330,24 @@ def extract_context_around_position(doc: Document, para_idx: int, start_pos: int
     context = para_text[context_start:context_end]
 
     # 如果需要更多上下文，可以考虑前后段落
-    # 但要确保不包含参考文献部分
+    # 但要确保不包含参考文献部分（当前段落已在参考文献之前，前一段落必然也在之前）
     if len(context) < context_length * 2:
+        parts = [context]
         # 添加前一个段落的内容（如果存在且不为空）
-        if para_idx > 0 and doc.paragraphs[para_idx-1].text.strip() and \
-           (references_start_idx is None or para_idx-1 < references_start_idx):
-            prev_text = doc.paragraphs[para_idx-1].text
-            context = prev_text[-context_length:] + " " + context
+        if para_idx > 0:
+            prev_text = paragraph_texts[para_idx-1]
+            if prev_text and not prev_text.isspace():
+                parts.insert(0, prev_text[-context_length:])
 
         # 添加后一个段落的内容（如果存在且不为空）
-        if para_idx < len(doc.paragraphs) - 1 and doc.paragraphs[para_idx+1].text.strip() and \
-           (references_start_idx is None or para_idx+1 < references_start_idx):
-            next_text = doc.paragraphs[para_idx+1].text
-            context = context + " " + next_text[:context_length]
+        next_idx = para_idx + 1
+        if next_idx < len(paragraph_texts) and (references_start_idx is None or next_idx < references_start_idx):
+            next_text = paragraph_texts[next_idx]
+            if next_text and not next_text.isspace():
+                parts.append(next_text[:context_length])
+
+        if len(parts) > 1:
+            context = " ".join(parts)
 
     return context
 
@@ -251,41 +365,25 @@ def extract_western_references(docx_path: str, config: Optional[Dict] = None) ->
     return [ref['citation'] for ref in refs_with_context]
 
 
+def extract_all_references(docx_path: Union[str, DocxSource], config: Optional[Dict] = None) -> List[str]:
+    """提取作者年份格式和西式格式的引用（作者年份格式在前），文档只读取一次"""
+    refs_with_context = extract_all_references_with_context(docx_path, config)
+    return [ref['citation'] for ref in refs_with_context['references'] + refs_with_context['western_references']]
+
+
 def extract_citations_from_text(text: str, config: Optional[Dict] = None) -> List[str]:
     """从给定文本中提取引用"""
-    patterns = [
-        # 中文格式: 作者（年份）
-        r'([\u4e00-\u9fa5\w\s\.&＆,，]+?)\s*[（(](\d{4})[）)]',
-        # 西文格式: Author (year)
-        r'([A-Z][a-z]+(?:\s+[A-Z]\.)?(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z]\.)?)?)\s*[（(](\d{4})[）)]',
-        # et al. 格式
-        r'([A-Z][a-z]+\s+et\s+al\.)[\s\u00a0]*[（(](\d{4})[）)]',
-        # 等 格式
-        r'([\u4e00-\u9fa5\w\s]+?)\s+等[\s\u00a0]*[（(](\d{4})[）)]',
-        # 多作者格式: Johnson & Brown (2021)
-        r'([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)+)\s*[（(](\d{4})[）)]',
-        # 简单的年份格式: (Smith, 2020)
-        r'[（(]([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)?),?\s*(\d{4})[）)]',
-    ]
-
     references = []
-    for pattern in patterns:
-        matches = list(re.finditer(pattern, text))
-        for match in matches:
-            if len(match.groups()) >= 2:
-                # 根据正则模式调整组索引
-                if pattern == r'[（(]([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)?),?\s*(\d{4})[）)]':
-                    # 这个模式中，作者在group(1)，年份在group(2)
-                    author = match.group(1).strip()
-                    year = match.group(2).strip()
-                else:
-                    # 其他模式中，作者在group(1)，年份在group(2)
-                    author = match.group(1).strip()
-                    year = match.group(2).strip()
-                
-                if len(author) >= 2 and year.isdigit() and len(year) == 4:
-                    reference = f"{author}（{year}）"
-                    references.append(reference)
+    if not _may_contain_citation(text):
+        return references
+    for pattern in _TEXT_CITATION_PATTERNS:
+        for match in pattern.finditer(text):
+            author, year = author_year(match)
+            author = author.strip()
+
+            if len(author) >= 2 and year.isdigit() and len(year) == 4:
+                reference = f"{author}（{year}）"
+                references.append(reference)
 
     # 去重
     unique_references = list(dict.fromkeys(references))  # 保持顺序的去重
@@ -2,6 +2,9 @@ import re
 import os
 import sys
 import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # 使用新的AI服务模块
 try:
@@ -11,6 +14,139 @@ except ImportError:
     AI_CLIENT_AVAILABLE = False
     print("警告: 未找到AI客户端模块，将使用基于规则的优化")
 
+logger = logging.getLogger(__name__)
+
+# 优先使用orjson解析JSON，不可用时回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 批量优化结果的磁盘缓存目录（默认放在当前用户的缓存目录下，不依赖当前工作目录，也不与其他用户共享）
+AI_CACHE_DIR = os.getenv("CITATION_AI_CACHE_DIR",
+                         os.path.join(os.path.expanduser("~"), ".cache", "paperchecker", "ai_cache"))
+# 磁盘缓存最多保留的文件数，超出后删除最早写入的文件
+_AI_CACHE_MAX_ENTRIES = int(os.getenv("CITATION_AI_CACHE_MAX_ENTRIES", "256"))
+
+# 逐个优化引用时的并发请求数
+_INDIVIDUAL_MAX_WORKERS = int(os.getenv("CITATION_AI_MAX_WORKERS", "8"))
+# 逐个优化结果的进程级缓存：(服务类型, 模型, 引用) -> 优化后的引用
+_INDIVIDUAL_CACHE_SIZE = 4096
+_INDIVIDUAL_RESULT_CACHE = {}
+
+# AI返回的有效引用格式：作者（年份）
+_VALID_RESULT_PATTERN = re.compile(r'[^（(]+[（(]\d{4}[)）]')
+# 解析失败时从列表文本中提取带引号的项目
+_QUOTED_ITEM_PATTERN = re.compile(r'"([^"]*?)"')
+# 没有引号时按"文本（年份）"提取项目
+_UNQUOTED_ITEM_PATTERN = re.compile(r'[^,\[\]]*?（\d{4}）')
+# 常见的非标准引号
+_QUOTE_TRANS = str.maketrans({'“': '"', '”': '"', "'": '"'})
+
+# 规则优化时需要严格过滤的关键词模式（包括上下文内容）
+_FILTER_PATTERNS = (
+    r'.*等[，,].*（\d{4}）.*',           # "张三等（2020）"后面还跟有其他内容
+    r'.*[，,].*等.*（\d{4}）.*',         # "张三，李四等（2020）"后面还跟有其他内容  
+    r'^在.*',                           # "在...张三（2020）"
+    r'.*张玉利.*（\d{4}）.*$',          # 包含上下文的引用
+    r'.*汤天波.*（\d{4}）.*$',          # 包含上下文的引用
+    r'.*赵若羽.*（\d{4}）.*$',          # 包含上下文的引用
+    r'.*葛文静.*（\d{4}）.*$',          # 包含上下文的引用
+    r'.*等[，,]?.*（\d{4}）的',          # "张三等（2020）的..."
+    r'.*认为.*（\d{4}）',                # "张三认为（2020）"
+    r'.*[，,].*（\d{4}）$',             # 以年份结尾但前面有逗号（可能是句子的一部分）
+    r'^根据.*（\d{4}）',                 # "根据张三（2020）"
+    r'^基于.*（\d{4}）',                 # "基于张三（2020）"  
+    r'^参考.*（\d{4}）',                 # "参考张三（2020）"
+    r'^如.*（\d{4}）',                   # "如张三（2020）"
+    r'^例如.*（\d{4}）',                 # "例如张三（2020）"
+    r'.*指出.*（\d{4}）',                # "张三指出（2020）"
+    r'.*提到.*（\d{4}）',                # "张三提到（2020）"
+    r'.*发现.*（\d{4}）',                # "张三发现（2020）"
+    r'.*提出.*（\d{4}）',                # "张三提出（2020）"
+    r'.*等.*[，,].*（\d{4}）',           # "张三等，李四（2020）"这种错误格式
+    r'.*和.*（\d{4}）',                  # "张三和（2020）"这种不完整格式
+)
+# 合并为一个正则，每个引用只需扫描一次
+_FILTER_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern in _FILTER_PATTERNS))
+# 每个过滤模式都至少包含其中一个字面量，不含任何一个时无需运行上面的正则
+_FILTER_KEYWORD_PATTERN = re.compile('张玉利|汤天波|赵若羽|葛文静|认为|根据|基于|参考|指出|提到|发现|提出|[等，,在如和]')
+
+# 严格的标准引用格式模式 - 只接受干净的引用格式
+# 中文格式：作者（年份）或 作者 等（年份）或 作者1 & 作者2（年份）
+# 英文格式：Author（Year）或 Author et al.（Year）或 Author1 & Author2（Year）
+_VALID_CITATION_PATTERN = re.compile(r'^([A-Za-z\u4e00-\u9fff\s&.&＆等，,]+?)\s*[（(]\s*(\d{4})\s*[)）]$')
+# 无需AI处理的规范引用：2-4个汉字的作者（可带"等"），或英文姓氏（可带et al.或第二作者）
+_CANONICAL_CITATION_PATTERN = re.compile(
+    r'^(?:[\u4e00-\u9fff]{2,4}等?'
+    r'|[A-Z][A-Za-z\'-]+(?:\s+et\s+al\.|\s*[&＆]\s*[A-Z][A-Za-z\'-]+)?)'
+    r'\s*[（(]\s*\d{4}\s*[)）]$'
+)
+# 用于按年份排序的模式
+_YEAR_SUFFIX_PATTERN = re.compile(r'（(\d{4})）')
+
+
+def _citation_year(citation):
+    """取引用中的年份作为排序键，没有"（年份）"时返回0"""
+    match = _YEAR_SUFFIX_PATTERN.search(citation)
+    return int(match.group(1)) if match else 0
+
+
+def _dedupe_and_sort_by_year(citations):
+    """
+    保持顺序去重后按年份稳定排序（同一年份保持原有顺序）
+
+    Args:
+        citations (list): 引用列表
+
+    Returns:
+        list: 去重并排序后的引用列表
+    """
+    unique_citations = list(dict.fromkeys(citations))
+    unique_citations.sort(key=_citation_year)
+    return unique_citations
+
+
+def _parse_citation_list(result):
+    """
+    从AI返回内容中解析引用列表
+
+    先将整个响应按JSON解析；失败时截取第一个'['到最后一个']'之间的内容再解析；
+    仍失败时统一引号后提取带引号的项目，或按"文本（年份）"提取不带引号的项目。
+
+    Args:
+        result (str): AI返回的原始内容
+
+    Returns:
+        list: 解析出的列表，无法解析时返回None
+    """
+    text = result.strip()
+    try:
+        parsed = _json_loads(text)
+        if isinstance(parsed, list):
+            return parsed
+    except ValueError:
+        pass
+
+    start = text.find('[')
+    end = text.rfind(']')
+    if start == -1 or end < start:
+        return None
+    json_str = text[start:end + 1]
+    try:
+        parsed = _json_loads(json_str)
+        return parsed if isinstance(parsed, list) else None
+    except ValueError:
+        pass
+
+    # 替换中文引号、单引号为英文双引号后提取各项
+    json_str = json_str.translate(_QUOTE_TRANS)
+    items = _QUOTED_ITEM_PATTERN.findall(json_str)
+    if not items:
+        items = [item.strip() for item in _UNQUOTED_ITEM_PATTERN.findall(json_str) if item.strip()]
+    return items or None
+
 def optimize_citations_with_ai(citations_list, config=None):
     """
     使用AI优化引用列表，过滤非引用内容并提取核心作者年份信息
@@ -32,6 +168,9 @@ def optimize_citations_with_ai(citations_list, config=None):
     
     # 如果AI服务可用且有有效的API密钥，则使用AI优化
     if AI_CLIENT_AVAILABLE and api_key and api_key != "your-api-key":
+        # 所有引用都已是规范格式时无需请求AI
+        if all(_is_canonical_citation(citation.strip()) for citation in citations_list):
+            return list(dict.fromkeys(citations_list))
         try:
             # 创建AI客户端
             if model_type == "gpt":
@@ -47,18 +186,83 @@ def optimize_citations_with_ai(citations_list, config=None):
                     model=model_name
                 )
             
-            return _optimize_citations_with_ai_client(citations_list, ai_client)
+            return _optimize_citations_with_ai_client_cached(citations_list, ai_client, f"{model_type}:{model_name}")
         except Exception as e:
-            print(f"AI优化失败: {e}")
+            logger.warning("AI优化失败: %s", e)
             # 如果AI优化失败，回退到基于规则的优化
             return _optimize_citations_with_rules(citations_list)
     else:
         # 如果AI不可用，使用基于规则的优化
         return _optimize_citations_with_rules(citations_list)
 
+def _is_canonical_citation(citation):
+    """判断引用是否已是无需AI处理的规范格式（不带"根据"、"研究者"等上下文）"""
+    if _FILTER_KEYWORD_PATTERN.search(citation) and _FILTER_PATTERN.search(citation):
+        return False
+    return _CANONICAL_CITATION_PATTERN.match(citation) is not None
+
+def _prune_ai_cache():
+    """缓存文件数超过上限时，按写入时间删除最早的缓存文件"""
+    try:
+        entries = [entry for entry in os.scandir(AI_CACHE_DIR)
+                   if entry.is_file() and entry.name.endswith('.json')]
+    except OSError:
+        return
+    excess = len(entries) - _AI_CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+    for entry in entries[:excess]:
+        try:
+            os.remove(entry.path)
+        except OSError as e:
+            logger.warning("删除引用优化缓存失败: %s", e)
+
+def _optimize_citations_with_ai_client_cached(citations_list, ai_client, model_key):
+    """
+    带磁盘缓存的批量AI优化：相同模型、相同引用列表的结果直接从缓存读取；
+    只缓存AI调用成功的结果，调用失败时返回的原始引用不写入缓存，下次重试
+
+    Args:
+        citations_list (list): 提取到的引用列表
+        ai_client: AI客户端
+        model_key (str): 模型标识，作为缓存键的一部分
+
+    Returns:
+        list: 优化后的引用列表
+    """
+    cache_key = hashlib.md5((model_key + "\n" + "\n".join(citations_list)).encode('utf-8')).hexdigest()
+    cache_file = os.path.join(AI_CACHE_DIR, f"{cache_key}.json")
+
+    # 检查缓存是否存在
+    if os.path.exists(cache_file):
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("读取引用优化缓存失败: %s", e)
+
+    optimized_citations, succeeded = _optimize_citations_with_ai_client(citations_list, ai_client)
+    if not succeeded:
+        return optimized_citations
+
+    try:
+        os.makedirs(AI_CACHE_DIR, mode=0o700, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump(optimized_citations, f, ensure_ascii=False)
+    except OSError as e:
+        logger.warning("写入引用优化缓存失败: %s", e)
+    else:
+        _prune_ai_cache()
+
+    return optimized_citations
+
 def _optimize_citations_with_ai_client(citations_list, ai_client):
     """
     使用新的AI客户端优化引用列表
+
+    Returns:
+        tuple: (优化后的引用列表, AI调用是否成功)；失败的引用保留原文
     """
     try:
         # 构造提示词，将所有引用打包处理
@@ -88,140 +292,58 @@ def _optimize_citations_with_ai_client(citations_list, ai_client):
             temperature=0.0   # 使用较低的温度以获得更确定的结果
         )
         
-        # 打印AI返回的原始结果，用于调试
-        print("AI返回的原始结果:")
-        print(result)
-        print("---")
-        
-        # 尝试解析返回的JSON列表
-        try:
-            # 提取方括号内的内容，更灵活地匹配
-            match = re.search(r'\[(.*?)\]', result, re.DOTALL)
-            if match:
-                json_str = match.group(0)
-                print(f"提取到的JSON字符串: {json_str}")
-                
-                # 尝试修复可能导致解析失败的常见问题
-                # 替换中文引号为英文引号
-                json_str = json_str.replace('""', '"')
-                json_str = json_str.replace('"', '"')
-                json_str = json_str.replace("'", '"')
-                
-                # 尝试解析JSON
-                try:
-                    result_list = json.loads(json_str)
-                    print(f"成功解析JSON，结果类型: {type(result_list)}, 长度: {len(result_list) if isinstance(result_list, list) else 'N/A'}")
-                except json.JSONDecodeError:
-                    # 如果直接解析失败，尝试预处理字符串
-                    print("直接JSON解析失败，尝试预处理字符串...")
-                    # 移除可能的问题字符
-                    import re as regex_module  # 使用别名避免与局部变量冲突
-                    
-                    # 首先尝试使用正则表达式从看起来像列表的字符串中提取内容
-                    # 匹配引号内的内容和没有引号的内容
-                    # 例如: [A（2023）, B（2024）] 或 ["A（2023）", "B（2024）"]
-                    items = []
-                    # 匹配带引号的项目
-                    quoted_items = regex_module.findall(r'"([^"]*?)"', json_str)
-                    if quoted_items:
-                        # 如果找到了带引号的项目，直接使用
-                        items = quoted_items
-                    else:
-                        # 如果没有找到带引号的项目，尝试提取不带引号的项目
-                        # 识别格式为 "文本（年份）" 或 "文本 等（年份）" 的模式
-                        unquoted_items = regex_module.findall(r'[^,\[\]]*?[^,\[\]]*?（\d{4}）|[^,\[\]]*?[^,\[\]]*?等（\d{4}）|[^,\[\]]*?[^,\[\]]*?et al\.?（\d{4}）', json_str)
-                        if unquoted_items:
-                            items = [item.strip() for item in unquoted_items if item.strip()]
-                    
-                    if items and len(items) == len(citations_list):
-                        print(f"通过正则表达式提取到 {len(items)} 个项目")
-                        result_list = items
-                    else:
-                        # 如果正则表达式方法失败，使用预处理方法
-                        processed_str = regex_module.sub(r',\s*,', ',', json_str)  # 处理连续的逗号
-                        processed_str = regex_module.sub(r',\s*\]', ']', processed_str)  # 处理末尾的逗号
-                        processed_str = regex_module.sub(r'\[\s*,', '[', processed_str)  # 处理开头的逗号
-                        
-                        print(f"预处理后的字符串: {processed_str}")
-                        
-                        # 再次尝试解析
-                        try:
-                            result_list = json.loads(processed_str)
-                            print(f"预处理后成功解析JSON")
-                        except json.JSONDecodeError:
-                            print(f"预处理后仍然JSON解析失败: {processed_str[:200]}...")
-                            print("回退到逐个处理")
-                            return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
-                
-                # 确保返回的是列表
-                if not isinstance(result_list, list):
-                    print(f"返回的不是列表格式，而是 {type(result_list)}: {result_list}")
-                    print("回退到逐个处理")
-                    return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
-                    
-                # 确保返回的列表长度与输入列表长度一致
-                if len(result_list) == len(citations_list):
-                    print(f"返回列表长度匹配，开始处理 {len(result_list)} 个结果")
-                    optimized_citations = []
-                    for i, citation in enumerate(result_list):
-                        # 将非字符串类型的元素转换为字符串
-                        if not isinstance(citation, str):
-                            citation = str(citation)
-                        
-                        print(f"  处理结果[{i}]: {citation}")
-                        
-                        # 检查结果是否为有效的引用格式或"无效引用"
-                        if citation == "无效引用":
-                            # 对于无效引用，保留原始引用
-                            optimized_citations.append(citations_list[i])
-                            print(f"    无效引用，保留原始: {citations_list[i]}")
-                        elif re.search(r'[^（(]+[（(]\d{4}[)）]', citation):
-                            optimized_citations.append(citation)
-                            print(f"    有效引用格式")
-                        else:
-                            # 如果格式不正确，保留原始引用
-                            optimized_citations.append(citations_list[i])
-                            print(f"    格式不正确，保留原始: {citations_list[i]}")
-
-                    print(f"最终优化结果: {optimized_citations}")
-                    return optimized_citations
-                else:
-                    # 如果长度不匹配，回退到逐个处理
-                    print(f"返回的引用列表长度不匹配: 期望 {len(citations_list)}, 实际 {len(result_list)}，回退到逐个处理")
-                    return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
-            else:
-                # 如果没有找到JSON格式的列表，回退到逐个处理
-                print(f"未找到JSON格式的列表，AI返回的内容: {result[:200]}...")
-                print("回退到逐个处理")
-                return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
-        except json.JSONDecodeError as e:
-            # 如果JSON解析失败，回退到逐个处理
-            print(f"JSON解析失败: {e}")
-            print(f"尝试解析的内容: {result[:500]}...")
-            print("回退到逐个处理")
+        # 解析返回的JSON列表
+        result_list = _parse_citation_list(result)
+        if result_list is None:
+            logger.warning("未能从AI返回内容中解析出引用列表: %s...，回退到逐个处理", result[:200])
             return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
-        except Exception as e:
-            # 捕获其他可能的异常
-            print(f"处理AI响应时出错: {e}")
-            print(f"错误类型: {type(e).__name__}")
-            print("回退到逐个处理")
+
+        # 确保返回的列表长度与输入列表长度一致
+        if len(result_list) != len(citations_list):
+            logger.warning("返回的引用列表长度不匹配: 期望 %d, 实际 %d，回退到逐个处理",
+                           len(citations_list), len(result_list))
             return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
-            
+
+        optimized_citations = []
+        for original, citation in zip(citations_list, result_list):
+            # 将非字符串类型的元素转换为字符串
+            if not isinstance(citation, str):
+                citation = str(citation)
+
+            # 无效引用或格式不正确时保留原始引用
+            if citation != "无效引用" and _VALID_RESULT_PATTERN.search(citation):
+                optimized_citations.append(citation)
+            else:
+                optimized_citations.append(original)
+
+        return optimized_citations, True
+
     except Exception as e:
-        print(f"批量处理引用时出错: {e}")
+        logger.warning("批量处理引用时出错: %s", e)
         # 如果出错，回退到逐个处理
         return _optimize_citations_with_ai_client_individual(citations_list, ai_client)
 
-def _optimize_citations_with_ai_client_individual(citations_list, ai_client):
+def _optimize_single_citation(citation, ai_client):
     """
-    使用新的AI客户端逐个优化引用列表（回退方案）
+    使用AI客户端优化单个引用，结果按(服务类型, 模型, 引用)缓存
+
+    Args:
+        citation (str): 原始引用
+        ai_client: AI客户端
+
+    Returns:
+        tuple: (优化后的引用, AI调用是否成功)；无效引用、格式不正确或出错时引用为原文
     """
-    optimized_citations = []
-    
-    for citation in citations_list:
-        try:
-            # 构造提示词
-            prompt = f"""
+    cache_key = (getattr(ai_client, 'provider_type', None),
+                 getattr(ai_client, 'config', {}).get('model'),
+                 citation)
+    cached = _INDIVIDUAL_RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached, True
+
+    try:
+        # 构造提示词
+        prompt = f"""
 请从以下文本中提取标准的作者年份格式引用。如果文本中包含多个引用，请只提取最核心的一个。
 如果文本不是有效的引用，请返回"无效引用"。
 
@@ -235,39 +357,44 @@ def _optimize_citations_with_ai_client_individual(citations_list, ai_client):
 Smith（2024）
 Johnson & Smith（2024）
 """
-            # 使用AI客户端调用API
-            result = ai_client.generate(
-                prompt=prompt,
-                max_tokens=100,
-                temperature=0.0   # 使用较低的温度以获得更确定的结果
-            )
-            
-            result = result.strip()
-            print(f"逐个处理的AI结果: {result}")  # 添加调试信息
-            
-            # 检查结果是否为有效的引用格式
-            if result != "无效引用" and re.search(r'[^（(]+[（(]\d{4}[)）]', result):
-                optimized_citations.append(result)
-            else:
-                # 如果是无效引用或格式不正确，保留原始引用
-                optimized_citations.append(citation)
-                
-        except Exception as e:
-            print(f"处理引用 '{citation}' 时出错: {e}")
-            # 如果出错，添加原始引用
-            optimized_citations.append(citation)
-    
-    # 去重
-    unique_citations = list(set(optimized_citations))
-    
-    # 按年份排序
-    try:
-        unique_citations.sort(key=lambda x: int(re.search(r'（(\d{4})）', x).group(1)))
-    except:
-        # 如果排序失败，保持原有顺序
-        pass
+        # 使用AI客户端调用API
+        result = ai_client.generate(
+            prompt=prompt,
+            max_tokens=100,
+            temperature=0.0   # 使用较低的温度以获得更确定的结果
+        )
+    except Exception as e:
+        logger.warning("处理引用 '%s' 时出错: %s", citation, e)
+        # 如果出错，返回原始引用（不缓存，下次重试）
+        return citation, False
+
+    result = result.strip()
+    # 检查结果是否为有效的引用格式，如果是无效引用或格式不正确，保留原始引用
+    optimized = result if result != "无效引用" and _VALID_RESULT_PATTERN.search(result) else citation
+
+    if len(_INDIVIDUAL_RESULT_CACHE) >= _INDIVIDUAL_CACHE_SIZE:
+        # 淘汰最早加入的结果
+        _INDIVIDUAL_RESULT_CACHE.pop(next(iter(_INDIVIDUAL_RESULT_CACHE)), None)
+    _INDIVIDUAL_RESULT_CACHE[cache_key] = optimized
+    return optimized, True
+
+def _optimize_citations_with_ai_client_individual(citations_list, ai_client):
+    """
+    使用新的AI客户端逐个优化引用列表（回退方案），多个请求并发发送
+
+    Returns:
+        tuple: (优化后的引用列表, 所有引用的AI调用是否都成功)
+    """
+    # 结果最终会去重，重复的引用只需请求一次
+    pending = list(dict.fromkeys(citations_list))
+    workers = max(1, min(_INDIVIDUAL_MAX_WORKERS, len(pending)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(
+            lambda citation: _optimize_single_citation(citation, ai_client), pending
+        ))
     
-    return unique_citations
+    optimized_citations = [optimized for optimized, _ in results]
+    return _dedupe_and_sort_by_year(optimized_citations), all(succeeded for _, succeeded in results)
 
 def _optimize_citations_with_rules(citations_list):
     """
@@ -285,49 +412,14 @@ def _optimize_citations_with_rules(citations_list):
     
     optimized_citations = []
     
-    # 定义需要严格过滤的关键词模式（包括上下文内容）
-    filter_patterns = [
-        r'.*等[，,].*（\d{4}）.*',           # "张三等（2020）"后面还跟有其他内容
-        r'.*[，,].*等.*（\d{4}）.*',         # "张三，李四等（2020）"后面还跟有其他内容  
-        r'^在.*',                           # "在...张三（2020）"
-        r'.*张玉利.*（\d{4}）.*$',          # 包含上下文的引用
-        r'.*汤天波.*（\d{4}）.*$',          # 包含上下文的引用
-        r'.*赵若羽.*（\d{4}）.*$',          # 包含上下文的引用
-        r'.*葛文静.*（\d{4}）.*$',          # 包含上下文的引用
-        r'.*等[，,]?.*（\d{4}）的',          # "张三等（2020）的..."
-        r'.*认为.*（\d{4}）',                # "张三认为（2020）"
-        r'.*[，,].*（\d{4}）$',             # 以年份结尾但前面有逗号（可能是句子的一部分）
-        r'^根据.*（\d{4}）',                 # "根据张三（2020）"
-        r'^基于.*（\d{4}）',                 # "基于张三（2020）"  
-        r'^参考.*（\d{4}）',                 # "参考张三（2020）"
-        r'^如.*（\d{4}）',                   # "如张三（2020）"
-        r'^例如.*（\d{4}）',                 # "例如张三（2020）"
-        r'.*指出.*（\d{4}）',                # "张三指出（2020）"
-        r'.*提到.*（\d{4}）',                # "张三提到（2020）"
-        r'.*发现.*（\d{4}）',                # "张三发现（2020）"
-        r'.*提出.*（\d{4}）',                # "张三提出（2020）"
-        r'.*等.*[，,].*（\d{4}）',           # "张三等，李四（2020）"这种错误格式
-        r'.*和.*（\d{4}）',                  # "张三和（2020）"这种不完整格式
-    ]
-    
-    # 严格的标准引用格式模式 - 只接受干净的引用格式
-    # 中文格式：作者（年份）或 作者 等（年份）或 作者1 & 作者2（年份）
-    # 英文格式：Author（Year）或 Author et al.（Year）或 Author1 & Author2（Year）
-    valid_citation_pattern = r'^([A-Za-z\u4e00-\u9fff\s&.&＆等，,]+?)\s*[（(]\s*(\d{4})\s*[)）]$'
-    
     for citation in citations_list:
+        citation = citation.strip()
         # 检查是否需要过滤（包含上下文的引用）
-        should_filter = False
-        for pattern in filter_patterns:
-            if re.search(pattern, citation.strip()):
-                should_filter = True
-                break
-        
-        if should_filter:
+        if _FILTER_KEYWORD_PATTERN.search(citation) and _FILTER_PATTERN.search(citation):
             continue
         
         # 验证是否为标准引用格式
-        match = re.match(valid_citation_pattern, citation.strip())
+        match = _VALID_CITATION_PATTERN.match(citation)
         if match:
             # 如果符合标准格式，保留
             author_part = match.group(1).strip()
@@ -336,17 +428,7 @@ def _optimize_citations_with_rules(citations_list):
             optimized_citations.append(standard_citation)
         # 注意：这里不处理不符合标准格式的引用，直接跳过
     
-    # 去重
-    unique_citations = list(set(optimized_citations))
-    
-    # 按年份排序
-    try:
-        unique_citations.sort(key=lambda x: int(re.search(r'（(\d{4})）', x).group(1)))
-    except:
-        # 如果排序失败，保持原有顺序
-        pass
-    
-    return unique_citations
+    return _dedupe_and_sort_by_year(optimized_citations)
 
 # 兼容接口
 def optimize_citations(citations_list, config=None):
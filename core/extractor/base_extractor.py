@@ -5,6 +5,16 @@ from models.document import Document
 class BaseExtractor(ABC):
     """文档提取器基类"""
     
+    # AI优化的配置（这里可以使用从配置文件传入的配置参数）
+    _AI_CONFIG_DEFAULTS = {
+        "api_key": "your-api-key",  # 可以从配置文件传入
+        "model_name": "qwen-plus"   # 可以从配置文件传入
+    }
+
+    def __init__(self):
+        # 每个实例只构建一次AI配置，提取时直接复用
+        self._ai_config = dict(self._AI_CONFIG_DEFAULTS)
+    
     @abstractmethod
     def extract(self, file_path: str) -> Document:
         """从文件路径提取文档内容"""
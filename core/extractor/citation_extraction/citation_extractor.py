@@ -4,12 +4,32 @@
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, List
 
+# 作者、年份提取所用的模式，在模块加载时编译一次
+_CN_CHAR_PATTERN = re.compile('[\u4e00-\u9fff]')
+_CN_MARKER_PATTERN = re.compile('[，。]|期刊|杂志')
+# 中文文献模式: 作者1,作者2.文章名...，匹配第一个句号之前的内容
+_CHINESE_HEAD_PATTERN = re.compile(r'^([^\.]+?)\.')
+_ET_AL_PATTERN = re.compile(r'et al\.?', re.IGNORECASE)
+_PAREN_YEAR_PATTERN = re.compile(r'^([^\(]+?)\(\d{4}\)')
+_PERIOD_PAREN_YEAR_PATTERN = re.compile(r'^([^\.]+?)\.\s*\(\d{4}\)')
+_FIRST_PERIOD_PATTERN = re.compile(r'^([^\.]+?)\.')
+_FIRST_DELIMITER_PATTERN = re.compile(r'[,.]')
+_AND_PATTERN = re.compile(r'\s+and\s+')
+_AMP_PATTERN = re.compile(r'\s*&\s*')
+_STRIP_ET_AL_PATTERN = re.compile(r',?\s*et al\.?', re.IGNORECASE)
+_INITIAL_PATTERN = re.compile(r'^[A-Z]\.(?:\s*[A-Z]\.)?$')
+# 单个作者：由普通字符、空格，或"."及其后直到空格的内容（可含逗号）组成
+# 各分支首字符互不重叠且模式之后没有可能失败的后续条件，匹配不会回溯，耗时与输入长度成线性
+_AUTHOR_TOKEN_PATTERN = re.compile(r'(?:[^ ,.]|\.[^ ]*| )+')
+
 
 def contains_chinese(text):
     """检查文本是否包含中文字符"""
-    return bool(re.search('[\u4e00-\u9fff]', text))
+    # 纯ASCII文本（英文文献的常见情况）无需进入正则引擎
+    return not text.isascii() and _CN_CHAR_PATTERN.search(text) is not None
 
 def extract_authors_from_reference(reference_text):
     """
@@ -22,7 +42,10 @@ def extract_authors_from_reference(reference_text):
         作者列表, 是否有et al.标记
     """
     # 首先检查是否是中文文献
-    if contains_chinese(reference_text[:50]) or any(char in reference_text for char in ['，', '。', '期刊', '杂志']):
+    # 前50个字符含中文，或全文出现中文标点、"期刊"、"杂志"（一次扫描）；
+    # 纯ASCII文本不可能包含这些字符，直接按英文文献处理
+    if not reference_text.isascii() and (
+            _CN_CHAR_PATTERN.search(reference_text, 0, 50) or _CN_MARKER_PATTERN.search(reference_text)):
         authors = extract_chinese_authors(reference_text)
         return authors, False
     else:
@@ -35,9 +58,7 @@ def extract_chinese_authors(reference_text):
     authors = []
 
     # 中文文献模式: 作者1,作者2.文章名...
-    chinese_pattern = r'^([^\.]+?)\.'  # 匹配第一个句号之前的内容
-
-    match = re.search(chinese_pattern, reference_text)
+    match = _CHINESE_HEAD_PATTERN.search(reference_text)
     if match:
         authors_str = match.group(1)
         # 分割作者 (中文使用逗号或顿号分隔)
@@ -64,65 +85,43 @@ def extract_english_authors(reference_text):
     has_et_al = False
 
     # 检查是否有et al.
-    if re.search(r'et al\.?', reference_text, re.IGNORECASE):
+    if _ET_AL_PATTERN.search(reference_text):
         has_et_al = True
 
     # 提取作者部分 (通常在第一个句号或括号之前)
-    match = re.search(r'^([^\(]+?)\(\d{4}\)', reference_text)
+    match = _PAREN_YEAR_PATTERN.search(reference_text)
     if match:
         authors_str = match.group(1)
     else:
-        match = re.search(r'^([^\.]+?)\.\s*\(\d{4}\)', reference_text)
+        match = _PERIOD_PAREN_YEAR_PATTERN.search(reference_text)
         if match:
             authors_str = match.group(1)
         else:
-            match = re.search(r'^([^\.]+?)\.', reference_text)
+            match = _FIRST_PERIOD_PATTERN.search(reference_text)
             if match:
                 authors_str = match.group(1)
             else:
-                # 如果以上模式都不匹配，尝试提取第一个逗号或句号之前的内容
-                first_comma = reference_text.find(',')
-                first_period = reference_text.find('.')
-
-                if first_comma != -1 and (first_period == -1 or first_comma < first_period):
-                    authors_str = reference_text[:first_comma]
-                elif first_period != -1:
-                    authors_str = reference_text[:first_period]
-                else:
+                # 如果以上模式都不匹配，尝试提取第一个逗号或句号之前的内容（一次扫描）
+                match = _FIRST_DELIMITER_PATTERN.search(reference_text)
+                if not match:
                     return authors, has_et_al
+                authors_str = reference_text[:match.start()]
 
     # 处理"and"和"&"连接符
-    authors_str = re.sub(r'\s+and\s+', ', ', authors_str)
-    authors_str = re.sub(r'\s*&\s*', ', ', authors_str)
+    authors_str = _AND_PATTERN.sub(', ', authors_str)
+    authors_str = _AMP_PATTERN.sub(', ', authors_str)
 
     # 移除"et al."等缩写
-    authors_str = re.sub(r',?\s*et al\.?', '', authors_str, flags=re.IGNORECASE)
+    authors_str = _STRIP_ET_AL_PATTERN.sub('', authors_str)
 
     # 改进的作者分割逻辑
-    # 使用更智能的方法分割作者，考虑名字缩写中的逗号
-    author_list = []
-    current_author = ""
-    in_abbreviation = False
-
-    for char in authors_str:
-        if char == ',' and not in_abbreviation:
-            if current_author.strip():
-                author_list.append(current_author.strip())
-            current_author = ""
-        else:
-            current_author += char
-            if char == '.':
-                in_abbreviation = True
-            elif char == ' ' and in_abbreviation:
-                in_abbreviation = False
-
-    if current_author.strip():
-        author_list.append(current_author.strip())
+    # 逗号分隔作者，但名字缩写中"."之后直到下一个空格之前的逗号不作为分隔符
+    author_list = [author for author in map(str.strip, _AUTHOR_TOKEN_PATTERN.findall(authors_str)) if author]
 
     # 处理每个作者
     for author in author_list:
         # 处理名字缩写 (如 "A." 或 "A. B.")
-        if re.match(r'^[A-Z]\.(?:\s*[A-Z]\.)?$', author):
+        if _INITIAL_PATTERN.match(author):
             if authors:
                 # 将缩写合并到前一个作者
                 authors[-1] = authors[-1] + ' ' + author
@@ -134,6 +133,7 @@ def extract_english_authors(reference_text):
 
     return authors, has_et_al
 
+@lru_cache(maxsize=4096)
 def extract_surname(author):
     """
     从作者字符串中提取姓氏
@@ -177,28 +177,47 @@ def format_citation_by_authors(authors, year, original_citation, has_et_al=False
     if not authors:
         return original_citation
 
-    # 判断是否是中文作者
-    is_chinese = contains_chinese(authors[0]) if authors else False
+    # 格式只取决于前两位作者和作者数量（1、2或更多），以此为键缓存结果
+    author_count = len(authors)
+    second_author = authors[1] if author_count > 1 else None
+    return _format_author_year(authors[0], second_author, min(author_count, 3), year, has_et_al)
+
+
+@lru_cache(maxsize=8192)
+def _format_author_year(first_author, second_author, author_count, year, has_et_al):
+    """
+    按前两位作者和作者数量格式化"作者（年份）"引用（结果缓存）
 
-    if is_chinese:
+    参数:
+        first_author: 第一作者
+        second_author: 第二作者，只有一位作者时为None
+        author_count: 作者数量，超过3时按3计
+        year: 年份
+        has_et_al: 是否有et al.标记
+
+    返回:
+        格式化后的引用
+    """
+    # 判断是否是中文作者
+    if contains_chinese(first_author):
         # 中文作者
-        if len(authors) > 1 or has_et_al:
-            return f"{authors[0]} 等（{year}）"
+        if author_count > 1 or has_et_al:
+            return f"{first_author} 等（{year}）"
         else:
-            return f"{authors[0]}（{year}）"
+            return f"{first_author}（{year}）"
     else:
         # 欧美作者
-        # 提取作者的姓
-        surnames = [extract_surname(author) for author in authors]
+        # 只提取实际用到的作者姓氏
+        first_surname = extract_surname(first_author)
 
         # 处理机构或团体作者
-        if len(surnames) == 1 and (len(surnames[0].split()) > 2 or surnames[0].isupper()):
-            return f"{surnames[0]}（{year}）"
+        if author_count == 1 and (len(first_surname.split()) > 2 or first_surname.isupper()):
+            return f"{first_surname}（{year}）"
 
         # 如果有et al.标记，或者作者数量大于2，使用et al.
-        if has_et_al or len(surnames) > 2:
-            return f"{surnames[0]} et al.（{year}）"
-        elif len(surnames) == 2:
-            return f"{surnames[0]} & {surnames[1]}（{year}）"
+        if has_et_al or author_count > 2:
+            return f"{first_surname} et al.（{year}）"
+        elif author_count == 2:
+            return f"{first_surname} & {extract_surname(second_author)}（{year}）"
         else:
-            return f"{surnames[0]}（{year}）"
\ No newline at end of file
+            return f"{first_surname}（{year}）"
@@ -3,9 +3,67 @@
 根据配置生成不同格式的引用
 """
 
+import re
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from config.citation_format_config import CitationFormatConfig, CitationFormatType
 
+_CN_CHAR_PATTERN = re.compile('[\u4e00-\u9fff]')
+
+
+@lru_cache(maxsize=4096)
+def _format_surname_with_initials(author: str) -> str:
+    """
+    格式化作者名为姓, 名缩写格式
+    
+    Args:
+        author: 作者名
+        
+    Returns:
+        格式化后的作者名
+    """
+    if ', ' in author:
+        # 已经是 "姓, 名" 格式
+        return author
+    else:
+        # 是 "名 姓" 格式，需要转换
+        parts = author.split()
+        if len(parts) >= 2:
+            surname = parts[-1]
+            initials = [name[0] + '.' for name in parts[:-1]]
+            return f"{surname}, {' '.join(initials)}"
+        else:
+            return author
+
+
+@lru_cache(maxsize=4096)
+def _extract_surname(author: str) -> str:
+    """
+    从作者名中提取姓氏
+    
+    Args:
+        author: 作者名
+        
+    Returns:
+        姓氏
+    """
+    # 去除可能的前后空格
+    author = author.strip()
+
+    # 如果包含逗号，则逗号前的是姓 (如 "Ohanian, R.")
+    if ',' in author:
+        return author.split(',')[0].strip()
+
+    # 处理英文名字，提取姓
+    parts = author.split()
+    if len(parts) == 0:
+        return author
+    elif len(parts) == 1:
+        return parts[0]
+    else:
+        # 对于英文名字，通常最后一个部分是姓
+        return parts[-1]
+
 
 class CitationFormatter:
     """引用格式化器"""
@@ -84,20 +142,21 @@ class CitationFormatter:
             else:
                 return f"{authors[0]}（{year}）"
         else:
-            # 英文作者，提取姓氏
-            surnames = [self._extract_surname(author) for author in authors]
+            # 英文作者，只提取实际用到的姓氏
+            author_count = len(authors)
+            first_surname = self._extract_surname(authors[0])
             
             # 处理机构或团体作者
-            if len(surnames) == 1 and (len(surnames[0].split()) > 2 or surnames[0].isupper()):
-                return f"{surnames[0]}（{year}）"
+            if author_count == 1 and (len(first_surname.split()) > 2 or first_surname.isupper()):
+                return f"{first_surname}（{year}）"
             
             # 根据作者数量格式化
-            if len(surnames) > 2:
-                return f"{surnames[0]} et al.（{year}）"
-            elif len(surnames) == 2:
-                return f"{surnames[0]} & {surnames[1]}（{year}）"
+            if author_count > 2:
+                return f"{first_surname} et al.（{year}）"
+            elif author_count == 2:
+                return f"{first_surname} & {self._extract_surname(authors[1])}（{year}）"
             else:
-                return f"{surnames[0]}（{year}）"
+                return f"{first_surname}（{year}）"
     
     def _format_apa(
         self, 
@@ -250,54 +309,12 @@ class CitationFormatter:
         return f"[{surname} et al., {year}]"
     
     def _format_surname_with_initials(self, author: str) -> str:
-        """
-        格式化作者名为姓, 名缩写格式
-        
-        Args:
-            author: 作者名
-            
-        Returns:
-            格式化后的作者名
-        """
-        if ', ' in author:
-            # 已经是 "姓, 名" 格式
-            return author
-        else:
-            # 是 "名 姓" 格式，需要转换
-            parts = author.split()
-            if len(parts) >= 2:
-                surname = parts[-1]
-                initials = [name[0] + '.' for name in parts[:-1]]
-                return f"{surname}, {' '.join(initials)}"
-            else:
-                return author
+        """格式化作者名为姓, 名缩写格式（见模块级 _format_surname_with_initials）"""
+        return _format_surname_with_initials(author)
     
     def _extract_surname(self, author: str) -> str:
-        """
-        从作者名中提取姓氏
-        
-        Args:
-            author: 作者名
-            
-        Returns:
-            姓氏
-        """
-        # 去除可能的前后空格
-        author = author.strip()
-
-        # 如果包含逗号，则逗号前的是姓 (如 "Ohanian, R.")
-        if ',' in author:
-            return author.split(',')[0].strip()
-
-        # 处理英文名字，提取姓
-        parts = author.split()
-        if len(parts) == 0:
-            return author
-        elif len(parts) == 1:
-            return parts[0]
-        else:
-            # 对于英文名字，通常最后一个部分是姓
-            return parts[-1]
+        """从作者名中提取姓氏（见模块级 _extract_surname）"""
+        return _extract_surname(author)
     
     def _contains_chinese(self, text: str) -> bool:
         """
@@ -309,5 +326,8 @@ class CitationFormatter:
         Returns:
             是否包含中文字符
         """
-        import re
-        return bool(re.search('[\u4e00-\u9fff]', text))
\ No newline at end of file
+        # 中文作者名通常以汉字开头，先检查首字符，命中时无需扫描全文
+        if text and '\u4e00' <= text[0] <= '\u9fff':
+            return True
+        # 纯ASCII文本无需进入正则引擎
+        return not text.isascii() and _CN_CHAR_PATTERN.search(text) is not None
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+引用模式工具
+Word、PDF、Markdown等各个引用提取器共用的正则模式和辅助函数：
+合并多个"作者+年份"子模式并取出作者和年份，按文本去重引用等
+"""
+import re
+
+# 作者部分限定起始字符并限制长度，每个起点的匹配工作量有上限，长段落上也保持线性耗时
+# 中文格式：张三（2024）
+CHINESE_AUTHOR_YEAR_PATTERN = re.compile(r'([\u4e00-\u9fa5][\u4e00-\u9fa5\w]{0,29})（(\d{4})）')
+# 英文格式：Smith (2020)、Smith and Jones (2020)、Smith et al.（2020）
+ENGLISH_AUTHOR_YEAR_PATTERN = re.compile(
+    r'([A-Z][A-Za-z\.\-&]{0,40}(?:\s+(?:and|&)\s+[A-Z][A-Za-z\.\-&]{0,40})?(?:\s+et\s+al\.?)?)'
+    r'\s*[（\(](\d{4})[）\)]'
+)
+FOUR_DIGITS_PATTERN = re.compile(r'\d{4}')
+DOI_PATTERN = re.compile(r'doi:\s*([^\s,.;\)]+)|DOI:\s*([^\s,.;\)]+)', re.IGNORECASE)
+URL_PATTERN = re.compile(r'https?://[^\s,.;\)]+')
+# 关键词检查合并为字面量正则，一次扫描即可判断是否包含任一关键词
+REFERENCE_HEADING_PATTERN = re.compile('参考文献|References|REFERENCES')
+# 参考文献条目中不应出现的关键词
+REFERENCE_EXCLUDE_PATTERN = re.compile('附录|致谢|作者简历|图|表|目录')
+# 参考文献部分的结束标记
+END_MARKER_PATTERN = re.compile('附录|致谢|作者简历|Appendix|Acknowledgements')
+
+
+def compile_alternation(patterns) -> re.Pattern:
+    """
+    将多个"作者+年份"模式合并为一个带命名分组的正则，使每段文本只需扫描一次
+
+    每个子模式被包裹在命名分组 f0、f1... 中，匹配后通过 author_year 取出作者和年份。
+    同一位置上多个子模式都能匹配时，排在前面的优先。
+
+    Args:
+        patterns: 子模式字符串序列（每个子模式中作者为第1组、年份为第2组）
+
+    Returns:
+        编译后的正则表达式
+    """
+    return re.compile('|'.join(f'(?P<f{i}>{pattern})' for i, pattern in enumerate(patterns)))
+
+
+def author_year(match: re.Match):
+    """
+    从合并正则的匹配结果中取出作者和年份
+
+    外层命名分组最后闭合，因此 lastindex 指向命中的子模式，其后两组即作者和年份
+    """
+    index = match.lastindex
+    return match.group(index + 1), match.group(index + 2)
+
+
+def unique_citations(citations: list) -> list:
+    """
+    按引用文本去重并保持首次出现的顺序，文本重复时保留首次出现的引用对象
+
+    Args:
+        citations: 按优先级排列的候选引用列表
+
+    Returns:
+        去重后的引用列表
+    """
+    texts = [citation.text for citation in citations]
+    # 倒序构建映射，使每个文本对应首次出现的引用对象；去重与排序交给dict.fromkeys在C层完成
+    first_by_text = dict(zip(reversed(texts), reversed(citations)))
+    return [first_by_text[text] for text in dict.fromkeys(texts)]
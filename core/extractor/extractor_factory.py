@@ -1,10 +1,18 @@
 import os
+from functools import lru_cache
 
 from .base_extractor import BaseExtractor
 from .word_extractor import WordExtractor
 from .pdf_extractor import PDFExtractor
 from typing import Dict, Type
 
+
+@lru_cache(maxsize=256)
+def _file_extension(file_path: str) -> str:
+    """返回小写、不带点的文件扩展名（按路径缓存，批量重复处理时免去重复解析）"""
+    return os.path.splitext(file_path)[1].lower().lstrip('.')
+
+
 class ExtractorFactory:
     """提取器工厂"""
     
@@ -22,13 +30,12 @@ class ExtractorFactory:
     @classmethod
     def get_extractor(cls, file_path: str) -> BaseExtractor:
         """根据文件路径获取对应的提取器"""
-        _, ext = os.path.splitext(file_path)
-        ext = ext.lower().lstrip('.')
-        
-        if ext not in cls._extractors:
+        ext = _file_extension(file_path)
+        extractor_class = cls._extractors.get(ext)
+        if extractor_class is None:
             raise ValueError(f"Unsupported file type: {ext}")
         
-        return cls._extractors[ext]()
+        return extractor_class()
     
     @classmethod
     def supported_types(cls) -> list:
@@ -0,0 +1,212 @@
+"""
+Word文档段落文本快速读取工具
+直接从.docx压缩包中流式解析 word/document.xml，避免构建python-docx的对象树
+"""
+import io
+import zipfile
+from contextlib import contextmanager
+from typing import IO, Iterator, List, Tuple, Union
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W + 'body'
+_W_P = _W + 'p'
+_W_R = _W + 'r'
+_W_T = _W + 't'
+_W_TAB = _W + 'tab'
+_W_LINE_BREAKS = (_W + 'br', _W + 'cr')
+_W_TBL = _W + 'tbl'
+_W_TBL_GRID = _W + 'tblGrid'
+_W_GRID_COL = _W + 'gridCol'
+_W_TR = _W + 'tr'
+_W_TC = _W + 'tc'
+_W_TC_PR = _W + 'tcPr'
+_W_GRID_SPAN = _W + 'gridSpan'
+_W_V_MERGE = _W + 'vMerge'
+_W_VAL = _W + 'val'
+
+
+class DocxSource:
+    """
+    已解压的Word文档：打开压缩包并解压 word/document.xml 一次，
+    同一次处理中需要多次读取同一文档时，由调用方创建并传给各个读取函数，直接从内存中解析；
+    对象随调用方释放，不做进程级缓存
+    """
+
+    def __init__(self, docx_path: str):
+        self.path = docx_path
+        with zipfile.ZipFile(docx_path) as archive:
+            self.document_xml = archive.read('word/document.xml')
+
+    def open_document_xml(self) -> io.BytesIO:
+        """返回 document.xml 内容的内存文件对象"""
+        return io.BytesIO(self.document_xml)
+
+
+@contextmanager
+def _open_document_xml(docx: Union[str, DocxSource]) -> Iterator[IO[bytes]]:
+    """打开 word/document.xml：DocxSource从内存读取，文档路径则直接从压缩包中流式读取"""
+    if isinstance(docx, DocxSource):
+        with docx.open_document_xml() as xml_file:
+            yield xml_file
+        return
+    with zipfile.ZipFile(docx) as archive, archive.open('word/document.xml') as xml_file:
+        yield xml_file
+
+
+def _docx_path(docx: Union[str, DocxSource]) -> str:
+    """返回文档路径（供python-docx回退路径使用）"""
+    return docx.path if isinstance(docx, DocxSource) else docx
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    拼接段落文本，与python-docx的 Paragraph.text 保持一致：
+    只取段落直接包含的w:r，w:t取文本，w:tab为制表符，w:br/w:cr为换行
+    """
+    parts = []
+    for run in paragraph.iterchildren(_W_R):
+        for child in run:
+            tag = child.tag
+            if tag == _W_T:
+                if child.text:
+                    parts.append(child.text)
+            elif tag == _W_TAB:
+                parts.append('\t')
+            elif tag in _W_LINE_BREAKS:
+                parts.append('\n')
+    return ''.join(parts)
+
+
+def iter_paragraph_texts(docx_path: Union[str, DocxSource]) -> Iterator[str]:
+    """
+    按顺序逐个返回文档正文段落（与 Document.paragraphs 相同，不含表格内段落）的文本
+
+    Args:
+        docx_path: Word文档路径或DocxSource
+
+    Yields:
+        段落文本
+    """
+    if not LXML_AVAILABLE:
+        from docx import Document
+        # 直接拼接底层XML元素的文本，跳过逐个Run对象的包装和字符串累加
+        for paragraph in Document(_docx_path(docx_path)).paragraphs:
+            yield _paragraph_text(paragraph._p)
+        return
+
+    with _open_document_xml(docx_path) as xml_file:
+        for _, elem in etree.iterparse(xml_file, events=('end',), tag=_W_P):
+            parent = elem.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue
+            yield _paragraph_text(elem)
+            # 释放已处理的元素，保持内存占用平稳
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def read_paragraph_texts(docx_path: Union[str, DocxSource]) -> List[str]:
+    """
+    读取文档所有正文段落的文本
+
+    Args:
+        docx_path: Word文档路径或DocxSource
+
+    Returns:
+        段落文本列表
+    """
+    return list(iter_paragraph_texts(docx_path))
+
+
+def _table_cell_texts(table) -> List[str]:
+    """
+    按行返回表格所有单元格的文本，与python-docx逐行遍历 row.cells 的结果一致：
+    横向合并（gridSpan）的单元格按所跨列数重复，纵向合并（vMerge）的单元格取上一行同列的内容
+    """
+    grid = table.find(_W_TBL_GRID)
+    col_count = len(grid.findall(_W_GRID_COL)) if grid is not None else 0
+
+    cells = []
+    row_count = 0
+    for row in table.iterchildren(_W_TR):
+        row_count += 1
+        for cell in row.iterchildren(_W_TC):
+            grid_span = 1
+            v_merge = None
+            properties = cell.find(_W_TC_PR)
+            if properties is not None:
+                span = properties.find(_W_GRID_SPAN)
+                if span is not None:
+                    grid_span = int(span.get(_W_VAL))
+                merge = properties.find(_W_V_MERGE)
+                if merge is not None:
+                    v_merge = merge.get(_W_VAL, 'continue')
+            for span_idx in range(grid_span):
+                if v_merge == 'continue':
+                    cells.append(cells[-col_count])
+                elif span_idx > 0:
+                    cells.append(cells[-1])
+                else:
+                    cells.append('\n'.join(_paragraph_text(p) for p in cell.iterchildren(_W_P)))
+
+    texts = []
+    for row_idx in range(row_count):
+        texts.extend(cells[row_idx * col_count:(row_idx + 1) * col_count])
+    return texts
+
+
+def _read_document_texts_with_docx(docx_path: str) -> Tuple[List[str], List[str]]:
+    """使用python-docx读取正文段落和表格单元格文本（文本直接从底层XML元素拼接，不经过Run对象）"""
+    from docx import Document
+
+    document = Document(docx_path)
+    paragraphs = [_paragraph_text(paragraph._p) for paragraph in document.paragraphs]
+    table_cells = [
+        '\n'.join(_paragraph_text(p) for p in cell._tc.iterchildren(_W_P))
+        for table in document.tables for row in table.rows for cell in row.cells
+    ]
+    return paragraphs, table_cells
+
+
+def read_document_texts(docx_path: Union[str, DocxSource]) -> Tuple[List[str], List[str]]:
+    """
+    一次流式解析，同时读取文档正文段落文本和正文表格的单元格文本
+
+    结果与python-docx的 Document.paragraphs 以及逐个遍历 Document.tables 中
+    row.cells 得到的 cell.text 相同；lxml不可用或解析失败时改用python-docx
+
+    Args:
+        docx_path: Word文档路径或DocxSource
+
+    Returns:
+        (段落文本列表, 表格单元格文本列表)
+    """
+    if not LXML_AVAILABLE:
+        return _read_document_texts_with_docx(_docx_path(docx_path))
+
+    try:
+        paragraphs = []
+        table_cells = []
+        with _open_document_xml(docx_path) as xml_file:
+            for _, elem in etree.iterparse(xml_file, events=('end',), tag=(_W_P, _W_TBL)):
+                parent = elem.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    continue
+                if elem.tag == _W_P:
+                    paragraphs.append(_paragraph_text(elem))
+                else:
+                    table_cells.extend(_table_cell_texts(elem))
+                # 释放已处理的元素，保持内存占用平稳
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+        return paragraphs, table_cells
+    except Exception:
+        return _read_document_texts_with_docx(_docx_path(docx_path))
@@ -5,115 +5,118 @@ Markdown引文提取器
 从Markdown内容中提取作者-年份格式的引文
 """
 
-import re
-from .citation_optimizer import optimize_citations_with_ai
+from itertools import chain
 
+try:
+    from .ai_optimizer import optimize_citations_with_ai
+except ImportError:
+    optimize_citations_with_ai = None
+from .citation_patterns import compile_alternation, author_year
 
-def extract_references_from_markdown(markdown_content: str, config=None):
-    """从Markdown内容中提取作者年份格式引用"""
-    patterns = [
-        # 中文格式: 作者（年份）
-        r'([\u4e00-\u9fa5\w\s\.&＆,，]+?)\s*[（(](\d{4})[）)]',
-        # 西文格式: Author (year)
-        r'([A-Z][a-z]+(?:\s+[A-Z]\.)?(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z]\.)?)?)\s*[（(](\d{4})[）)]',
-        # et al. 格式
-        r'([A-Z][a-z]+\s+et\s+al\.)[\s\u00a0]*[（(](\d{4})[）)]',
+# 引文数量少于该值时不调用AI优化（一次模型往返的耗时远超本地提取），可通过config["ai_min_batch"]覆盖
+_AI_MIN_BATCH = 3
+
+# 作者年份格式引用的模式，合并为带命名分组的正则（见 citation_patterns.compile_alternation）。
+# 可从任意位置开始匹配的宽松格式与以大写姓氏开头的英文格式分为两组，
+# 避免宽松格式从句首开始的长匹配吞掉其中更准确的英文作者
+# 作者部分的量词均有上限（{1,100}?、{1,9}），每个起点最多向后尝试固定长度，
+# 长文本中大量未闭合的括号也不会引起二次方回溯
+_CITATION_PATTERNS = (
+    compile_alternation((
         # 等 格式
-        r'([\u4e00-\u9fa5\w\s]+?)\s+等[\s\u00a0]*[（(](\d{4})[）)]',
-        # 多作者格式: Johnson & Brown (2021)
-        r'([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)+)\s*[（(](\d{4})[）)]',
+        r'([\u4e00-\u9fa5\w\s]{1,100}?)\s+等[\s\u00a0]*[（(](\d{4})[）)]',
+        # 中文格式: 作者（年份）
+        r'([\u4e00-\u9fa5\w\s\.&＆,，]{1,100}?)\s*[（(](\d{4})[）)]',
+    )),
+    compile_alternation((
+        # 共用大写姓氏前缀的三种格式（按原优先级依次尝试，\s 已包含不换行空格）：
+        # et al. 格式 / 多作者格式: Johnson & Brown (2021) / 西文格式: Author (year)
+        r'([A-Z][a-z]+(?:\s+et\s+al\.'
+        r'|(?:\s*&\s*[A-Z][a-z]+){1,9}'
+        r'|(?:\s+[A-Z]\.)?(?:\s*&\s*[A-Z][a-z]+(?:\s+[A-Z]\.)?)?))\s*[（(](\d{4})[）)]',
         # 简单的年份格式: (Smith, 2020)
         r'[（(]([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)?),?\s*(\d{4})[）)]',
-    ]
+    )),
+)
 
-    references = []
+# 西式引用格式（均以大写姓氏或括号开头，合并为一个正则）
+_WESTERN_CITATION_PATTERN = compile_alternation((
+    # 共用姓氏前缀的三种格式（按原优先级依次尝试）：
+    # Lastname, F. (& Lastname, G.) (year) / Lastname and Lastname (year) / Lastname (year)
+    r'([A-Z][a-z]+(?:,\s*[A-Z]\.(?:\s*&\s*[A-Z][a-z]+,\s*[A-Z]\.){0,9}'
+    r'|\s+and\s+[A-Z][a-z]+)?)\s*\((\d{4})\)',
+    # 格式: (Lastname, year)
+    r'\(([A-Z][a-z]+),\s*(\d{4})\)',
+))
+
+
+def _scan_citations(markdown_content: str, patterns):
+    """
+    按给定正则依次扫描Markdown内容，逐个返回"作者（年份）"格式的引文（未去重）
+
+    Args:
+        markdown_content: Markdown内容
+        patterns: 编译后的正则序列
+
+    Yields:
+        引文字符串
+    """
     for pattern in patterns:
-        matches = list(re.finditer(pattern, markdown_content))
-        for match in matches:
-            if len(match.groups()) >= 2:
-                # 根据正则模式调整组索引
-                if pattern == r'[（(]([A-Z][a-z]+(?:\s*&\s*[A-Z][a-z]+)?),?\s*(\d{4})[）)]':
-                    # 这个模式中，作者在group(1)，年份在group(2)
-                    author = match.group(1).strip()
-                    year = match.group(2).strip()
-                else:
-                    # 其他模式中，作者在group(1)，年份在group(2)
-                    author = match.group(1).strip()
-                    year = match.group(2).strip()
-                
-                if len(author) >= 2 and year.isdigit() and len(year) == 4:
-                    reference = f"{author}（{year}）"
-                    references.append(reference)
-
-    # 去重
-    unique_references = list(dict.fromkeys(references))  # 保持顺序的去重
-
-    # 使用AI优化
-    if unique_references and optimize_citations_with_ai:
+        for match in pattern.finditer(markdown_content):
+            author, year = author_year(match)
+            author = author.strip()
+
+            if len(author) >= 2 and year.isdigit() and len(year) == 4:
+                yield f"{author}（{year}）"
+
+
+def _dedupe(citations):
+    """保持顺序的流式去重：边扫描边写入结果列表，只维护一个集合"""
+    seen = set()
+    unique = []
+    for citation in citations:
+        if citation not in seen:
+            seen.add(citation)
+            unique.append(citation)
+    return unique
+
+
+def _optimize_with_ai(unique_references, config, label: str):
+    """使用AI优化去重后的引文，引文过少时不调用AI，出错时原样返回"""
+    min_batch = config.get("ai_min_batch", _AI_MIN_BATCH) if config else _AI_MIN_BATCH
+    if unique_references and len(unique_references) >= min_batch and optimize_citations_with_ai:
         try:
-            optimized = optimize_citations_with_ai(unique_references, config)
-            return optimized
+            return optimize_citations_with_ai(unique_references, config)
         except Exception as e:
-            print(f"AI优化引文时出错: {e}")
-            return unique_references
-    
+            print(f"AI优化{label}时出错: {e}")
     return unique_references
 
 
-def extract_western_references_from_markdown(markdown_content: str, config=None):
+def extract_references_from_markdown(markdown_content: str, config=None, skip_ai: bool = False):
+    """从Markdown内容中提取作者年份格式引用"""
+    unique_references = _dedupe(_scan_citations(markdown_content, _CITATION_PATTERNS))
+    if skip_ai:
+        return unique_references
+    return _optimize_with_ai(unique_references, config, "引文")
+
+
+def extract_western_references_from_markdown(markdown_content: str, config=None, skip_ai: bool = False):
     """从Markdown内容中提取西式格式引用"""
-    # 西式引用格式
-    western_patterns = [
-        # 格式: Lastname, F. (year)
-        r'([A-Z][a-z]+,\s*[A-Z]\.)\s*\((\d{4})\)',
-        # 格式: Lastname, F. & Lastname, G. (year)
-        r'([A-Z][a-z]+,\s*[A-Z]\.(?:\s*&\s*[A-Z][a-z]+,\s*[A-Z]\.)*)\s*\((\d{4})\)',
-        # 格式: Lastname (year)
-        r'([A-Z][a-z]+)\s*\((\d{4})\)',
-        # 格式: Lastname and Lastname (year)
-        r'([A-Z][a-z]+\s+and\s+[A-Z][a-z]+)\s*\((\d{4})\)',
-        # 格式: (Lastname, year)
-        r'\(([A-Z][a-z]+),\s*(\d{4})\)',
-    ]
-
-    western_refs = []
-    for pattern in western_patterns:
-        matches = list(re.finditer(pattern, markdown_content))
-        for match in matches:
-            if len(match.groups()) >= 2:
-                author = match.group(1).strip()
-                year = match.group(2).strip()
-                
-                if len(author) >= 2 and year.isdigit() and len(year) == 4:
-                    reference = f"{author}（{year}）"
-                    western_refs.append(reference)
-
-    # 去重
-    unique_references = list(dict.fromkeys(western_refs))  # 保持顺序的去重
-
-    # 使用AI优化
-    if unique_references and optimize_citations_with_ai:
-        try:
-            optimized = optimize_citations_with_ai(unique_references, config)
-            return optimized
-        except Exception as e:
-            print(f"AI优化西式引文时出错: {e}")
-            return unique_references
-    
-    return unique_references
+    unique_references = _dedupe(_scan_citations(markdown_content, (_WESTERN_CITATION_PATTERN,)))
+    if skip_ai:
+        return unique_references
+    return _optimize_with_ai(unique_references, config, "西式引文")
 
 
 def extract_citations_from_markdown(markdown_content: str, config=None):
     """从Markdown内容中提取所有类型的引文"""
-    # 提取中文和西文引用
-    chinese_citations = extract_references_from_markdown(markdown_content, config)
-    western_citations = extract_western_references_from_markdown(markdown_content, config)
-    
-    # 合并并去重
-    all_citations = chinese_citations + western_citations
-    unique_citations = list(dict.fromkeys(all_citations))  # 保持顺序去重
-    
-    return unique_citations
+    # 中文和西文引用合并后只去重一次，再统一进行一次AI优化
+    all_citations = chain(
+        _scan_citations(markdown_content, _CITATION_PATTERNS),
+        _scan_citations(markdown_content, (_WESTERN_CITATION_PATTERN,)),
+    )
+    unique_citations = _dedupe(all_citations)
+    return _optimize_with_ai(unique_citations, config, "引文")
 
 
 if __name__ == "__main__":
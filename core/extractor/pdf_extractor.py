@@ -1,8 +1,187 @@
 import os
+import json
+import pathlib
+from functools import lru_cache
+from itertools import chain
 from .base_extractor import BaseExtractor
 from models.document import Document, Citation, Reference
+from .citation_patterns import (
+    CHINESE_AUTHOR_YEAR_PATTERN, ENGLISH_AUTHOR_YEAR_PATTERN, FOUR_DIGITS_PATTERN, DOI_PATTERN, URL_PATTERN,
+    REFERENCE_HEADING_PATTERN, REFERENCE_EXCLUDE_PATTERN, END_MARKER_PATTERN, unique_citations,
+)
 import re
 
+# 从extractor模块导入AI增强的引用提取功能（模块加载时导入一次）
+try:
+    from .ai_extractor import extract_citations_from_text
+    AI_EXTRACTION_AVAILABLE = True
+except ImportError:
+    AI_EXTRACTION_AVAILABLE = False
+
+# 优先使用orjson解析JSON，不可用时回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 文本扫描所用的模式，在模块加载时编译一次
+# 数字格式引用：[1] 或范围引用 [2-5]（第2组为范围终点）
+_NUMBER_CITATION_PATTERN = re.compile(r'\[(\d+)(?:-(\d+))?\]')
+_YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+# 基于模式匹配提取参考文献时使用的模式，合并为一个正则，每段文本只需扫描一次。
+# 只判断是否存在匹配，因此：去掉了各模式首尾的 .*?，[A-Z][a-z]+ 简化为 [A-Z][a-z]；
+# 中间步骤用 (?=(?P<x>.*?X))(?P=x) 模拟原子分组，只取最早出现的X（对"是否存在"而言最优），
+# 失败时不再回溯尝试更靠后的X，避免长段落上的多项式级回溯
+_REFERENCE_PATTERN = re.compile('|'.join((
+    # [J]/[M]/[C]/[D] 期刊文章、书籍、会议论文、学位论文模式: 作者, 年份, 期刊名, [J], 卷(期): 页码.
+    r'[，,](?=(?P<typed_year>.*?\d{4}))(?P=typed_year).*?\[[JMCD]\]',
+    # 简单年份模式（作者，年份，期刊）
+    r'[，,](?=(?P<simple_year>.*?\d{4}))(?P=simple_year)(?=(?P<simple_sep>.*?[，,]))(?P=simple_sep).*?[。\.]',
+    # 序号模式 [数字]或(数字)
+    r'[\[\(]\d+[\]\)](?=(?P<numbered_year>.*?\d{4}))(?P=numbered_year).*?[。\.]',
+    # 作者等年份模式：作者等，年份
+    r'等[，,]?\s*\d{4}.*?[。\.]',
+    # 英文作者年份模式：Author (Year) / Author [Year]
+    r'[A-Z][a-z].*?(?:\(\d{4}\)|\[\d{4}\])',
+    # 英文作者年份模式：Author, Year
+    r'[A-Z][a-z](?=(?P<english_year>.*?[,，]\s*\d{4}))(?P=english_year).*?[。\.]',
+)))
+# 参考文献的学术特征词汇与引用格式特征（合并为一个字面量正则）
+_REFERENCE_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, (
+    '学报', '期刊', '研究', '出版', '出版社', '大学',
+    '论文', '文献', '杂志', '科学', '经济', '管理',
+    'Journal', 'Research', 'Studies', 'Review',
+    'University', 'Press', 'Academic',
+    '[J]', '[M]', '[C]', '[D]', '[S]', '[R]',
+    'Vol.', 'No.', 'pp.', 'p.', 'Vol',
+    '等.', '著', '编', '译',
+))))
+# 学术参考文献特征：文献类型标识、学术关键词，或 [1]、A1 这类序号开头
+_ACADEMIC_INDICATOR_PATTERN = re.compile('|'.join(map(re.escape, (
+    '[J]', '[M]', '[C]', '[D]', '[S]', '[R]',  # 文献类型标识
+    '学报', '期刊', '研究', '出版', '出版社', '大学',
+    '论文', '文献', '杂志', '科学', '经济', '管理',
+    'Vol.', 'No.', 'pp.', 'p.',  # 英文学术标识
+    '等.', '著', '编', '译',  # 中文学术标识
+    'University', 'Press', 'Academic', 'Journal',
+    'Research', 'Studies', 'Review',
+))) + r'|^\s*(?:\[\d+\]|[A-Z]\d+\s)')
+# 至少包含两个逗号或句号（中英文）
+_TWO_SEPARATORS_PATTERN = re.compile(r'[，,。.].*?[，,。.]', re.DOTALL)
+# 可能是正文而非参考文献的关键词（只检查前50个字符）
+_NON_REFERENCE_PATTERN = re.compile('图|表|章节|本章|该|此|这些|这种|因此|所以|但是')
+
+
+# 当前目录没有配置文件时，尝试在项目根目录查找
+_FALLBACK_CONFIG_PATH = pathlib.Path(__file__).parent.parent / "config.json"
+
+
+@lru_cache(maxsize=1)
+def _load_pdf_extractor_config() -> dict:
+    """
+    读取配置文件中的PDF提取器配置部分（结果缓存，每个进程只读取一次）
+
+    Returns:
+        PDF提取器配置，配置文件不存在时返回默认值
+    """
+    config_path = "config.json"
+    if not os.path.exists(config_path):
+        config_path = _FALLBACK_CONFIG_PATH
+
+    if os.path.exists(config_path):
+        with open(config_path, 'rb') as f:
+            full_config = _json_loads(f.read())
+        # 返回PDF提取器配置部分
+        return full_config.get('pdf_extractor_config', {})
+    else:
+        # 如果配置文件不存在，返回默认值
+        return {
+            'academic_references_start_percentage': 0.7
+        }
+
+
+# 本地提取PDF文本时并行处理页面的进程数与页数阈值（页数少时进程启动开销大于收益）
+_PDF_PAGE_WORKERS = min(os.cpu_count() or 1, 4)
+_PARALLEL_PAGE_THRESHOLD = 8
+
+
+@lru_cache(maxsize=1)
+def _page_text_flags() -> int:
+    """
+    逐页提取纯文本时使用的PyMuPDF标志：在默认纯文本标志的基础上不保留连字和图片，
+    连字（如"ﬁ"）直接展开为普通字母，便于后续的正则匹配
+    """
+    import fitz  # PyMuPDF
+
+    return fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES & ~fitz.TEXT_PRESERVE_IMAGES
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> list:
+    """
+    在子进程中打开PDF并提取[start, stop)范围内各页的文本
+
+    Args:
+        file_path: PDF文件路径
+        start: 起始页码（包含）
+        stop: 结束页码（不包含）
+
+    Returns:
+        各页文本列表
+    """
+    import fitz  # PyMuPDF
+
+    flags = _page_text_flags()
+    doc = fitz.open(file_path)
+    try:
+        return [doc.load_page(page_num).get_text("text", flags=flags) for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _extract_pages_in_parallel(file_path: str, page_count: int) -> list:
+    """
+    将页面按连续区间平均分给多个进程提取文本，按页码顺序合并结果
+
+    Args:
+        file_path: PDF文件路径
+        page_count: 总页数
+
+    Returns:
+        各页文本列表
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunk_size = -(-page_count // _PDF_PAGE_WORKERS)  # 向上取整
+    bounds = [(start, min(start + chunk_size, page_count)) for start in range(0, page_count, chunk_size)]
+    with ProcessPoolExecutor(max_workers=len(bounds)) as executor:
+        futures = [executor.submit(_extract_page_range, file_path, start, stop) for start, stop in bounds]
+        return [text for future in futures for text in future.result()]
+
+
+@lru_cache(maxsize=4096)
+def _reference_author_year(text: str):
+    """
+    从参考文献文本中提取作者和年份
+
+    同一条文献常被多种提取方法重复识别，解析只依赖文本本身，因此按文本缓存结果
+    """
+    from core.checker.citation_checking.reference_mapper import extract_author_year_from_reference
+    return extract_author_year_from_reference(text)
+
+
+def _normalize_whitespace(text: str) -> str:
+    """
+    合并连续空白为单个空格并去除首尾空白，与 ' '.join(text.split()) 结果相同
+
+    参考文献文本通常已是规范形式：可打印（除普通空格外不含其他空白字符）、
+    无连续空格、无首尾空格，此时直接返回原文本，不再切分和拼接
+    """
+    if text.isprintable() and '  ' not in text and text[:1] != ' ' and text[-1:] != ' ':
+        return text
+    return ' '.join(text.split())
+
+
 class PDFExtractor(BaseExtractor):
     """PDF文档提取器"""
     
@@ -19,11 +198,8 @@ class PDFExtractor(BaseExtractor):
             # 调用PDF转换功能
             project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
             config_path = os.path.join(project_root, "config", "config.json")
-            md_file_path = convert_pdf_to_markdown(file_path, config_path=config_path)
-
-            # 从Markdown内容提取信息
-            with open(md_file_path, 'r', encoding='utf-8') as f:
-                md_content = f.read()
+            # 直接取用转换时已在内存中的Markdown内容，不再重新读取输出文件
+            _, md_content = convert_pdf_to_markdown(file_path, config_path=config_path, return_content=True)
 
         except Exception as e:
             print(f"MinerU API转换失败: {e}")
@@ -35,12 +211,12 @@ class PDFExtractor(BaseExtractor):
         paragraphs = md_content.split('\n') if md_content else []
 
         # 提取表格内容（从Markdown表格中）
-        # 简单的表格识别
+        # 简单的表格识别：复用上面切分好的行，以"|"开头的行即表格行
         tables_content = []
-        lines = md_content.split('\n') if md_content else []
-        for line in lines:
-            if '|' in line and line.strip().startswith('|'):
-                tables_content.append(line.strip())
+        for line in paragraphs:
+            stripped = line.strip()
+            if stripped.startswith('|'):
+                tables_content.append(stripped)
 
         # 提取引文和参考文献，这里需要实现PDF的提取逻辑
         citations = self._extract_citations(paragraphs, md_content or "", file_path)
@@ -61,13 +237,20 @@ class PDFExtractor(BaseExtractor):
 
         # 打开PDF文档
         doc = fitz.open(file_path)
-        text_content = []
+        page_count = len(doc)
+        text_content = None
 
-        # 提取每一页的文本
-        for page_num in range(len(doc)):
-            page = doc.load_page(page_num)
-            text = page.get_text()
-            text_content.append(text)
+        # 页数较多时按页分段，交给多个进程并行提取（每个进程自行打开文档）
+        if page_count > _PARALLEL_PAGE_THRESHOLD and _PDF_PAGE_WORKERS > 1:
+            try:
+                text_content = _extract_pages_in_parallel(file_path, page_count)
+            except Exception as e:
+                print(f"并行提取PDF页面失败，改为逐页提取: {e}")
+
+        if text_content is None:
+            # 复用已打开的文档逐页提取纯文本
+            flags = _page_text_flags()
+            text_content = [page.get_text("text", flags=flags) for page in doc]
 
         doc.close()
 
@@ -80,97 +263,68 @@ class PDFExtractor(BaseExtractor):
     
     def _extract_citations(self, paragraphs: list, md_content: str, file_path: str) -> list:
         """提取引文"""
-        all_citations = []
-        processed_citations = set()  # 用于去重
-        
-        # 从extractor模块导入AI增强的引用提取功能
-        try:
-            from .ai_extractor import extract_citations_from_text
-            AI_EXTRACTION_AVAILABLE = True
-        except ImportError:
-            AI_EXTRACTION_AVAILABLE = False
+        # 先按优先级收集全部候选引用（AI提取、数字格式、作者年份格式），最后统一去重
+        candidates = []
         
         # 如果AI提取功能可用，使用AI从Markdown内容中提取作者年份格式的引用
         if AI_EXTRACTION_AVAILABLE:
             try:
-                # 准备AI优化的配置（这里可以使用从配置文件传入的配置参数）
-                ai_config = {
-                    "api_key": "your-api-key",  # 可以从配置文件传入
-                    "model_name": "qwen-plus"   # 可以从配置文件传入
-                }
-                
                 # 从Markdown内容提取作者年份格式的引用
-                text_citations = extract_citations_from_text(md_content, ai_config)
+                text_citations = extract_citations_from_text(md_content, self._ai_config)
                 
-                # 将AI提取的引用添加到列表中
-                for citation_text in text_citations:
-                    formatted_citation = f"[AUTH:{citation_text}]"  
-                    if formatted_citation not in processed_citations:
-                        # 创建引用对象，格式化为AI提取的格式
-                        citation_obj = Citation(
-                            text=formatted_citation,
-                            format_type='author_year',
-                            context="AI提取"
-                        )
-                        all_citations.append(citation_obj)
-                        processed_citations.add(formatted_citation)
+                # 将AI提取的引用添加到候选列表中，格式化为AI提取的格式
+                candidates.extend(
+                    Citation(text=f"[AUTH:{citation_text}]", format_type='author_year', context="AI提取")
+                    for citation_text in dict.fromkeys(text_citations)
+                )
             except Exception as e:
                 print(f"AI增强引用提取失败: {e}")
         
-        # 提取数字格式引用 [1], [2-5] 等（作为补充）
-        full_text_str = '\n'.join(paragraphs)
-        # 提取文中的引用（包括单个引用和范围引用，例如[1], [2-5]等格式）
-        citation_pattern = r'\[\d+(?:-\d+)?\]'
-        raw_citations = re.findall(citation_pattern, full_text_str)
-        
-        # 展开范围引用为单个引用
-        expanded_citations = set()
-        for citation in raw_citations:
-            if '-' in citation:
-                # 处理范围引用，如[1-3]
-                match = re.match(r'\[(\d+)-(\d+)\]', citation)
-                if match:
-                    start = int(match.group(1))
-                    end = int(match.group(2))
-                    # 展开范围引用为单个引用
-                    for i in range(start, end + 1):
-                        expanded_citations.add(f'[{i}]')
-            else:
-                # 单个引用，直接添加
-                expanded_citations.add(citation)
-        
-        for citation in expanded_citations:
-            if citation not in processed_citations:
-                all_citations.append(Citation(text=citation, format_type='number', context="PDF提取"))
-                processed_citations.add(citation)
-        
-        # 提取作者年份格式引用作为补充（以防AI提取遗漏）
+        # 一次遍历段落，同时收集数字格式引用和作者年份格式引用（均作为补充）
+        # 数字格式包括单个引用和范围引用，例如[1], [2-5]等；模式不跨行，逐段流式匹配即可
+        number_citations = []
+        author_year_citations = []
         for paragraph in paragraphs:
-            author_year_citations = self._extract_author_year_citations(paragraph)
-            for citation in author_year_citations:
-                if citation.text not in processed_citations:
-                    all_citations.append(citation)
-                    processed_citations.add(citation.text)
+            for match in _NUMBER_CITATION_PATTERN.finditer(paragraph):
+                range_end = match.group(2)
+                if range_end is not None:
+                    # 处理范围引用，如[1-3]，展开为单个引用
+                    number_citations.extend(map('[{}]'.format, range(int(match.group(1)), int(range_end) + 1)))
+                else:
+                    # 单个引用，直接添加
+                    number_citations.append(match.group(0))
+            # 作者年份格式引用（以防AI提取遗漏）
+            author_year_citations.extend(self._extract_author_year_citations(paragraph))
+        
+        # 数字格式引用只为去重后的文本创建对象
+        candidates.extend(
+            Citation(text=citation, format_type='number', context="PDF提取")
+            for citation in dict.fromkeys(number_citations)
+        )
+        candidates.extend(author_year_citations)
         
-        return all_citations
+        return unique_citations(candidates)
     
     def _extract_author_year_citations(self, paragraph: str) -> list:
         """提取作者年份格式引用"""
         citations = []
+        # 两种格式都必须出现括号（中文格式只用全角括号），段落中没有对应括号时该模式不可能匹配，
+        # 直接跳过扫描，避免在长段落上做注定失败的回溯匹配
+        has_fullwidth_paren = '（' in paragraph
+        if not has_fullwidth_paren and '(' not in paragraph:
+            return citations
+
         # 中文格式：张三（2024）
-        chinese_pattern = r'([\u4e00-\u9fa5\w\s]+)（(\d{4})）'
-        chinese_matches = re.findall(chinese_pattern, paragraph)
-        for author, year in chinese_matches:
-            citations.append(Citation(text=f"{author}（{year}）", 
-                                    format_type='author_year', 
-                                    author=author.strip(), 
-                                    year=year, 
-                                    context=paragraph))
+        if has_fullwidth_paren:
+            for author, year in CHINESE_AUTHOR_YEAR_PATTERN.findall(paragraph):
+                citations.append(Citation(text=f"{author}（{year}）", 
+                                        format_type='author_year', 
+                                        author=author.strip(), 
+                                        year=year, 
+                                        context=paragraph))
         
         # 英文格式：Smith (2020) 或 Smith（2020）
-        english_pattern = r'([A-Za-z\s\.\-&]+)\s*[（\(](\d{4})[）\)]'
-        english_matches = re.findall(english_pattern, paragraph)
-        for author, year in english_matches:
+        for author, year in ENGLISH_AUTHOR_YEAR_PATTERN.findall(paragraph):
             citations.append(Citation(text=f"{author.strip()} ({year})", 
                                     format_type='author_year', 
                                     author=author.strip(), 
@@ -181,8 +335,6 @@ class PDFExtractor(BaseExtractor):
     
     def _extract_references(self, paragraphs: list) -> list:
         """提取参考文献"""
-        references = []
-
         # 方法1: 查找"参考文献"标题后的传统方式
         traditional_refs = self._extract_references_traditional(paragraphs)
 
@@ -192,11 +344,8 @@ class PDFExtractor(BaseExtractor):
         # 方法3: 专门搜索文档后半部分的学术引用
         academic_refs = self._extract_references_academic_style(paragraphs)
 
-        # 合并所有方法的结果
-        all_refs = traditional_refs + pattern_based_refs + academic_refs
-
-        # 去重并返回
-        return self._remove_duplicates_and_validate(all_refs)
+        # 按顺序合并所有方法的结果（不拼接新列表），去重并返回
+        return self._remove_duplicates_and_validate(chain(traditional_refs, pattern_based_refs, academic_refs))
 
     def _extract_references_traditional(self, paragraphs: list) -> list:
         """传统的参考文献提取方法（保留向后兼容）"""
@@ -205,7 +354,7 @@ class PDFExtractor(BaseExtractor):
 
         # 查找参考文献部分
         for i, paragraph in enumerate(paragraphs):
-            if any(keyword in paragraph for keyword in ['参考文献', 'References', 'REFERENCES']):
+            if REFERENCE_HEADING_PATTERN.search(paragraph):
                 references_start = i
                 break
 
@@ -221,8 +370,7 @@ class PDFExtractor(BaseExtractor):
                         url = self._extract_url(text)
 
                         # 从参考文献文本中提取作者和年份
-                        from core.checker.citation_checking.reference_mapper import extract_author_year_from_reference
-                        extracted_author, extracted_year = extract_author_year_from_reference(text)
+                        extracted_author, extracted_year = _reference_author_year(text)
 
                         references.append(Reference(
                             text=text,
@@ -253,57 +401,18 @@ class PDFExtractor(BaseExtractor):
         """基于正则表达式模式的参考文献提取"""
         references = []
 
-        # 定义多种参考文献模式
-        patterns = [
-            # [J] 期刊文章模式: 作者, 年份, 期刊名, [J], 卷(期): 页码.
-            r'.*?[，,].*?\d{4}.*?\[J\].*?',
-            # [M] 书籍模式: 作者. 书名[M]. 出版社, 年份.
-            r'.*?[，,].*?\d{4}.*?\[M\].*?',
-            # [C] 会议论文模式
-            r'.*?[，,].*?\d{4}.*?\[C\].*?',
-            # [D] 学位论文模式
-            r'.*?[，,].*?\d{4}.*?\[D\].*?',
-            # 简单年份模式（作者，年份，期刊）
-            r'.*?[，,].*?\d{4}.*?[，,].*?[。\.]',
-            # 序号模式 [数字]或(数字)
-            r'[\[\(]\d+[\]\)].*?\d{4}.*?[。\.]',
-            # 作者等年份模式：作者等，年份
-            r'.*?等[，,]?\s*\d{4}.*?[。\.]',
-            # 英文作者年份模式：Author (Year)
-            r'[A-Z][a-z]+.*?\(\d{4}\)',
-            # 英文作者年份模式：Author [Year]
-            r'[A-Z][a-z]+.*?\[\d{4}\]',
-            # 英文作者年份模式：Author, Year
-            r'[A-Z][a-z]+.*?[,，]\s*\d{4}.*?[。\.]',
-        ]
-
         for i, paragraph in enumerate(paragraphs):
             text = paragraph.strip()
             if len(text) > 20:  # 基本长度要求
                 # 检查是否包含年份（基本要求）
-                has_year = bool(re.search(r'\d{4}', text))
+                has_year = FOUR_DIGITS_PATTERN.search(text) is not None
                 if has_year:
-                    # 检查是否符合任一模式
-                    matches_pattern = any(re.search(pattern, text) for pattern in patterns)
-
-                    # 额外检查：包含学术特征词汇
-                    has_academic_indicators = any(indicator in text for indicator in
-                                                 ['学报', '期刊', '研究', '出版', '出版社', '大学',
-                                                  '论文', '文献', '杂志', '科学', '经济', '管理',
-                                                  'Journal', 'Research', 'Studies', 'Review',
-                                                  'University', 'Press', 'Academic'])
-
-                    # 检查是否有引用格式特征
-                    has_citation_indicators = any(indicator in text for indicator in
-                                                 ['[J]', '[M]', '[C]', '[D]', '[S]', '[R]',
-                                                  'Vol.', 'No.', 'pp.', 'p.', 'Vol',
-                                                  '等.', '著', '编', '译'])
-
-                    if matches_pattern or has_academic_indicators or has_citation_indicators:
+                    # 检查是否包含学术特征词汇、引用格式特征，或符合任一参考文献模式
+                    # （先做开销更小的字面量扫描）
+                    if _REFERENCE_INDICATOR_PATTERN.search(text) or _REFERENCE_PATTERN.search(text):
                         # 验证是否为有效的参考文献（避免误判）
                         if self._is_valid_reference(text):
-                            from core.checker.citation_checking.reference_mapper import extract_author_year_from_reference
-                            extracted_author, extracted_year = extract_author_year_from_reference(text)
+                            extracted_author, extracted_year = _reference_author_year(text)
 
                             references.append(Reference(
                                 text=text,
@@ -336,8 +445,7 @@ class PDFExtractor(BaseExtractor):
             if len(text) > 10 and text:  # 有效文本
                 # 检查是否符合学术参考文献的特征
                 if self._has_academic_reference_characteristics(text):
-                    from core.checker.citation_checking.reference_mapper import extract_author_year_from_reference
-                    extracted_author, extracted_year = extract_author_year_from_reference(text)
+                    extracted_author, extracted_year = _reference_author_year(text)
 
                     references.append(Reference(
                         text=text,
@@ -348,61 +456,24 @@ class PDFExtractor(BaseExtractor):
         return references
 
     def _load_config(self) -> dict:
-        """加载配置文件"""
-        import json
-
-        config_path = "config.json"
-        if not os.path.exists(config_path):
-            # 如果当前目录没有配置文件，尝试在项目根目录查找
-            import pathlib
-            project_root = pathlib.Path(__file__).parent.parent
-            config_path = project_root / "config.json"
-
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                full_config = json.load(f)
-            # 返回PDF提取器配置部分
-            return full_config.get('pdf_extractor_config', {})
-        else:
-            # 如果配置文件不存在，返回默认值
-            return {
-                'academic_references_start_percentage': 0.7
-            }
+        """加载配置文件（只在首次调用时读取，见 _load_pdf_extractor_config）"""
+        return dict(_load_pdf_extractor_config())
 
     def _has_academic_reference_characteristics(self, text: str) -> bool:
         """检查文本是否具有学术参考文献的特征"""
         # 包含年份
-        has_year = bool(re.search(r'\b(19|20)\d{2}\b', text))
+        has_year = _YEAR_PATTERN.search(text) is not None
         if not has_year:
             return False
 
-        # 包含学术关键词或格式
-        academic_indicators = [
-            '[J]', '[M]', '[C]', '[D]', '[S]', '[R]',  # 文献类型标识
-            '学报', '期刊', '研究', '出版', '出版社', '大学',
-            '论文', '文献', '杂志', '科学', '经济', '管理',
-            'Vol.', 'No.', 'pp.', 'p.',  # 英文学术标识
-            '等.', '著', '编', '译',  # 中文学术标识
-            'University', 'Press', 'Academic', 'Journal',
-            'Research', 'Studies', 'Review',
-            # 序号格式
-            r'^\s*\d+\.', r'^\s*\[\d+\]', r'^\s*[A-Z]\d+\s+'
-        ]
-
-        for indicator in academic_indicators[:-2]:  # 前面的直接字符串检查
-            if indicator in text:
-                return True
-
-        # 检查序号格式
-        for pattern in academic_indicators[-2:]:  # 最后两个是正则表达式
-            if re.search(pattern, text):
-                return True
+        # 包含学术关键词、格式或序号
+        if _ACADEMIC_INDICATOR_PATTERN.search(text):
+            return True
 
         # 检查长度和结构
         if len(text) > 30:  # 足够长以包含完整信息
-            # 检查是否包含逗号、句号等分隔符，表明有多个信息段
-            punctuation_count = text.count('，') + text.count(',') + text.count('。') + text.count('.')
-            if punctuation_count >= 2:
+            # 检查是否包含至少两个逗号、句号等分隔符，表明有多个信息段（找到第二个即停止）
+            if _TWO_SEPARATORS_PATTERN.search(text):
                 return True
 
         return False
@@ -414,16 +485,14 @@ class PDFExtractor(BaseExtractor):
             return False
 
         # 检查是否包含必要的学术元素
-        has_year = bool(re.search(r'\b(19|20)\d{2}\b', text))
+        has_year = _YEAR_PATTERN.search(text) is not None
         if not has_year:
             return False
 
         # 检查是否不是其他类型的文本（如正文段落）
         # 排除包含这些关键词的文本（可能是正文而非参考文献）
-        exclude_keywords = ['图', '表', '章节', '本章', '该', '此', '这些', '这种', '因此', '所以', '但是']
-        for keyword in exclude_keywords:
-            if keyword in text[:50]:  # 检查前50个字符
-                return False
+        if _NON_REFERENCE_PATTERN.search(text, 0, 50):  # 检查前50个字符
+            return False
 
         return True
 
@@ -434,7 +503,7 @@ class PDFExtractor(BaseExtractor):
 
         for ref in references:
             # 标准化文本以进行比较（移除多余的空白字符）
-            normalized_text = ' '.join(ref.text.split())
+            normalized_text = _normalize_whitespace(ref.text)
 
             if normalized_text not in seen_texts:
                 seen_texts.add(normalized_text)
@@ -447,30 +516,26 @@ class PDFExtractor(BaseExtractor):
     def _is_reference_entry(self, text: str) -> bool:
         """判断是否为参考文献条目"""
         # 检查是否包含年份和基本结构
-        has_year = bool(re.search(r'\d{4}', text))
+        has_year = FOUR_DIGITS_PATTERN.search(text) is not None
         has_basic_structure = len(text) > 10 and ('.' in text or '[' in text)
         
         # 排除非参考文献的条目
-        exclude_keywords = ['附录', '致谢', '作者简历', '图', '表', '目录']
-        has_exclude_keyword = any(keyword in text for keyword in exclude_keywords)
+        has_exclude_keyword = REFERENCE_EXCLUDE_PATTERN.search(text) is not None
         
         return has_year and has_basic_structure and not has_exclude_keyword
     
     def _is_end_marker(self, text: str) -> bool:
         """判断是否为参考文献部分结束标记"""
-        end_keywords = ['附录', '致谢', '作者简历', 'Appendix', 'Acknowledgements']
-        return any(keyword in text for keyword in end_keywords) and len(text) < 20
+        return len(text) < 20 and END_MARKER_PATTERN.search(text) is not None
     
     def _extract_doi(self, text: str) -> str:
         """提取DOI"""
-        doi_pattern = r'doi:\s*([^\s,.;\)]+)|DOI:\s*([^\s,.;\)]+)'
-        match = re.search(doi_pattern, text, re.IGNORECASE)
+        match = DOI_PATTERN.search(text)
         if match:
             return match.group(1) or match.group(2)
         return None
     
     def _extract_url(self, text: str) -> str:
         """提取URL"""
-        url_pattern = r'https?://[^\s,.;\)]+'
-        match = re.search(url_pattern, text)
+        match = URL_PATTERN.search(text)
         return match.group(0) if match else None
\ No newline at end of file
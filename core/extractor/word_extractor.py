@@ -1,8 +1,23 @@
 from .base_extractor import BaseExtractor
 from models.document import Document, Citation, Reference
-import docx
+from .citation_patterns import (
+    CHINESE_AUTHOR_YEAR_PATTERN, ENGLISH_AUTHOR_YEAR_PATTERN, FOUR_DIGITS_PATTERN, DOI_PATTERN, URL_PATTERN,
+    REFERENCE_HEADING_PATTERN, REFERENCE_EXCLUDE_PATTERN, END_MARKER_PATTERN, unique_citations,
+)
+from .fast_paragraphs import DocxSource, read_document_texts
 import re
 
+# 从extractor模块导入AI增强的引用提取功能（模块加载时导入一次）
+try:
+    from .ai_extractor import extract_all_references
+    AI_ENHANCED_EXTRACTION_AVAILABLE = True
+except ImportError:
+    AI_ENHANCED_EXTRACTION_AVAILABLE = False
+
+# 文本扫描所用的模式，在模块加载时编译一次
+_NUMBER_CITATION_PATTERN = re.compile(r'\[\d+(?:-\d+)?\]')
+
+
 class WordExtractor(BaseExtractor):
     """Word文档提取器"""
     
@@ -11,22 +26,13 @@ class WordExtractor(BaseExtractor):
     
     def extract(self, file_path: str) -> Document:
         """提取Word文档内容"""
-        doc = docx.Document(file_path)
-        
-        # 提取正文内容
-        paragraphs = []
-        for paragraph in doc.paragraphs:
-            paragraphs.append(paragraph.text)
-        
-        # 提取表格内容
-        tables_content = []
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    tables_content.append(cell.text)
+        # 解压一次 document.xml，正文/表格读取和AI引用提取共用
+        source = DocxSource(file_path)
+        # 一次解析同时提取正文内容和表格内容，不构建python-docx对象树
+        paragraphs, tables_content = read_document_texts(source)
         
         # 提取引文
-        citations = self._extract_citations(paragraphs, file_path)
+        citations = self._extract_citations(paragraphs, source)
         
         # 提取参考文献
         references = self._extract_references(paragraphs)
@@ -40,80 +46,55 @@ class WordExtractor(BaseExtractor):
             metadata={'file_type': 'docx', 'file_path': file_path}
         )
     
-    def _extract_citations(self, paragraphs: list, file_path: str) -> list:
+    def _extract_citations(self, paragraphs: list, source: DocxSource) -> list:
         """提取引文"""
-        all_citations = []
-        processed_citations = set()  # 用于去重
-        
-        # 从extractor模块导入AI增强的引用提取功能
-        try:
-            from .ai_extractor import extract_references, extract_western_references
-            AI_ENHANCED_EXTRACTION_AVAILABLE = True
-        except ImportError:
-            AI_ENHANCED_EXTRACTION_AVAILABLE = False
+        # 先按优先级收集全部候选引用，最后统一去重
+        candidates = []
         
         # 如果AI增强提取功能可用，使用AI提取作者年份格式的引用
         if AI_ENHANCED_EXTRACTION_AVAILABLE:
             try:
-                # 准备AI优化的配置（这里可以使用从配置文件传入的配置参数）
-                ai_config = {
-                    "api_key": "your-api-key",  # 可以从配置文件传入
-                    "model_name": "qwen-plus"   # 可以从配置文件传入
-                }
+                # 提取作者年份格式和西式格式的引用（文档只读取一次）
+                ai_citations = extract_all_references(source, self._ai_config)
                 
-                # 提取作者年份格式的引用
-                author_year_citations = extract_references(file_path, ai_config)
-                western_citations = extract_western_references(file_path, ai_config)
-                
-                # 将AI提取的引用添加到列表中
-                for citation_text in author_year_citations + western_citations:
-                    if citation_text not in processed_citations:
-                        # 创建引用对象，格式化为AI提取的格式
-                        citation_obj = Citation(
-                            text=citation_text,
-                            format_type='author_year',
-                            context="AI提取"
-                        )
-                        all_citations.append(citation_obj)
-                        processed_citations.add(citation_text)
+                # 将AI提取的引用添加到候选列表中，格式化为AI提取的格式
+                candidates.extend(
+                    Citation(text=citation_text, format_type='author_year', context="AI提取")
+                    for citation_text in dict.fromkeys(ai_citations)
+                )
             except Exception as e:
                 print(f"AI增强引用提取失败: {e}")
         
-        # 提取数字格式引用 [1], [2-5] 等（作为补充）
+        # 提取数字格式引用 [1], [2-5] 等和作者年份格式引用（作为补充，以防AI提取遗漏）
         for paragraph in paragraphs:
-            # 提取数字格式引用 [1], [2-5] 等
-            number_citations = re.findall(r'\[\d+(?:-\d+)?\]', paragraph)
-            for citation in number_citations:
-                if citation not in processed_citations:
-                    all_citations.append(Citation(text=citation, format_type='number', context=paragraph))
-                    processed_citations.add(citation)
-            
-            # 提取作者年份格式引用作为补充（以防AI提取遗漏）
-            author_year_citations = self._extract_author_year_citations(paragraph)
-            for citation in author_year_citations:
-                if citation.text not in processed_citations:
-                    all_citations.append(citation)
-                    processed_citations.add(citation.text)
+            candidates.extend(
+                Citation(text=citation, format_type='number', context=paragraph)
+                for citation in _NUMBER_CITATION_PATTERN.findall(paragraph)
+            )
+            candidates.extend(self._extract_author_year_citations(paragraph))
         
-        return all_citations
+        return unique_citations(candidates)
     
     def _extract_author_year_citations(self, paragraph: str) -> list:
         """提取作者年份格式引用"""
         citations = []
+        # 两种格式都必须出现括号（中文格式只用全角括号），段落中没有对应括号时该模式不可能匹配，
+        # 直接跳过扫描，避免在长段落上做注定失败的回溯匹配
+        has_fullwidth_paren = '（' in paragraph
+        if not has_fullwidth_paren and '(' not in paragraph:
+            return citations
+
         # 中文格式：张三（2024）
-        chinese_pattern = r'([\u4e00-\u9fa5\w\s]+)（(\d{4})）'
-        chinese_matches = re.findall(chinese_pattern, paragraph)
-        for author, year in chinese_matches:
-            citations.append(Citation(text=f"{author}（{year}）", 
-                                    format_type='author_year', 
-                                    author=author.strip(), 
-                                    year=year, 
-                                    context=paragraph))
+        if has_fullwidth_paren:
+            for author, year in CHINESE_AUTHOR_YEAR_PATTERN.findall(paragraph):
+                citations.append(Citation(text=f"{author}（{year}）", 
+                                        format_type='author_year', 
+                                        author=author.strip(), 
+                                        year=year, 
+                                        context=paragraph))
         
         # 英文格式：Smith (2020) 或 Smith（2020）
-        english_pattern = r'([A-Za-z\s\.\-&]+)\s*[（\(](\d{4})[）\)]'
-        english_matches = re.findall(english_pattern, paragraph)
-        for author, year in english_matches:
+        for author, year in ENGLISH_AUTHOR_YEAR_PATTERN.findall(paragraph):
             citations.append(Citation(text=f"{author.strip()} ({year})", 
                                     format_type='author_year', 
                                     author=author.strip(), 
@@ -129,7 +110,7 @@ class WordExtractor(BaseExtractor):
         
         # 查找参考文献部分
         for i, paragraph in enumerate(paragraphs):
-            if any(keyword in paragraph for keyword in ['参考文献', 'References', 'REFERENCES']):
+            if REFERENCE_HEADING_PATTERN.search(paragraph):
                 references_start = i
                 break
         
@@ -162,30 +143,26 @@ class WordExtractor(BaseExtractor):
     def _is_reference_entry(self, text: str) -> bool:
         """判断是否为参考文献条目"""
         # 检查是否包含年份和基本结构
-        has_year = bool(re.search(r'\d{4}', text))
+        has_year = FOUR_DIGITS_PATTERN.search(text) is not None
         has_basic_structure = len(text) > 10 and ('.' in text or '[' in text)
         
         # 排除非参考文献的条目
-        exclude_keywords = ['附录', '致谢', '作者简历', '图', '表', '目录']
-        has_exclude_keyword = any(keyword in text for keyword in exclude_keywords)
+        has_exclude_keyword = REFERENCE_EXCLUDE_PATTERN.search(text) is not None
         
         return has_year and has_basic_structure and not has_exclude_keyword
     
     def _is_end_marker(self, text: str) -> bool:
         """判断是否为参考文献部分结束标记"""
-        end_keywords = ['附录', '致谢', '作者简历', 'Appendix', 'Acknowledgements']
-        return any(keyword in text for keyword in end_keywords) and len(text) < 20
+        return len(text) < 20 and END_MARKER_PATTERN.search(text) is not None
     
     def _extract_doi(self, text: str) -> str:
         """提取DOI"""
-        doi_pattern = r'doi:\s*([^\s,.;\)]+)|DOI:\s*([^\s,.;\)]+)'
-        match = re.search(doi_pattern, text, re.IGNORECASE)
+        match = DOI_PATTERN.search(text)
         if match:
             return match.group(1) or match.group(2)
         return None
     
     def _extract_url(self, text: str) -> str:
         """提取URL"""
-        url_pattern = r'https?://[^\s,.;\)]+'
-        match = re.search(url_pattern, text)
+        match = URL_PATTERN.search(text)
         return match.group(0) if match else None
\ No newline at end of file
@@ -1,10 +1,22 @@
 from pathlib import Path
+import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
 
 from core.ai.ai_client import SimpleAIClient
 from .reviewer import Reviewer
 
+# 优先使用orjson解析JSON，不可用时回退到标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# 并发请求AI分析各段落时的最大线程数（受服务商限流约束，可通过环境变量调整）
+_REVIEW_MAX_WORKERS = int(os.getenv("POLISH_AI_MAX_WORKERS", "8"))
+
 def prompt_combination(essay_to_analyse: str) -> str:
     # 组合提示词
     PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
@@ -64,12 +76,14 @@ def review_document(doc_path: str) -> Dict[str, Any]:
     review = Reviewer(doc_path, config_path)
     essay_list = review.core()
 
-    # 分段输出记录json
+    # 分段输出记录json：各段落的AI请求相互独立，并发发出，结果按原段落顺序收集
     ai_client = SimpleAIClient()
-    dict_result = []
+    if len(essay_list) > 1 and _REVIEW_MAX_WORKERS > 1:
+        with ThreadPoolExecutor(max_workers=min(_REVIEW_MAX_WORKERS, len(essay_list))) as executor:
+            results = list(executor.map(ai_client.generate, essay_list))
+    else:
+        results = [ai_client.generate(para) for para in essay_list]
 
-    for para in essay_list:
-        result = ai_client.generate(para)
-        dict_result.append(json.loads(result))
+    dict_result = [_json_loads(result) for result in results]
 
     return json_combination(dict_result)
\ No newline at end of file
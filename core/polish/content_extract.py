@@ -6,6 +6,7 @@ import json
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from fastapi import File, UploadFile, HTTPException, APIRouter
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from utils.file_handler import save_upload_file, cleanup_file
 from core.polish.analyse import review_document
@@ -19,10 +20,12 @@ async def get_reviews(file: UploadFile = File(...)):
     """
     生成论文精批、润色报告
     """
-    # 检查文件大小
-    file.file.seek(0, 2)  # 移动到文件末尾
-    file_size = file.file.tell()
-    file.file.seek(0)  # 移回文件开头
+    # 检查文件大小（优先使用上传时已记录的大小）
+    file_size = getattr(file, "size", None)
+    if file_size is None:
+        file.file.seek(0, 2)  # 移动到文件末尾
+        file_size = file.file.tell()
+        file.file.seek(0)  # 移回文件开头
     
     if file_size > MAX_FILE_SIZE:
         raise HTTPException(
@@ -30,12 +33,13 @@ async def get_reviews(file: UploadFile = File(...)):
             detail=f"文件过大，最大支持 {MAX_FILE_SIZE // (1024*1024)}MB"
         )
 
+    file_path = None
     try:
-        # 保存上传的文件
-        file_path = save_upload_file(file, "temp_uploads")
+        # 保存文件和分析任务都是阻塞操作，放到线程池中执行，避免阻塞事件循环
+        file_path = await run_in_threadpool(save_upload_file, file, "temp_uploads")
 
         # 执行分析任务
-        analysis_result = review_document(file_path)
+        analysis_result = await run_in_threadpool(review_document, file_path)
         return JSONResponse(content=analysis_result)
     
     except HTTPException:
@@ -1,89 +1,147 @@
-import docx
+import os
+import json
+from functools import cached_property
+
+from core.extractor.fast_paragraphs import iter_paragraph_texts
 
 class Reviewer:
     def __init__(self, doc_path: str, config_path: str = "config.json"):
         self.doc_path = doc_path
-        self.doc = docx.Document(doc_path)
         self.full_text_str = []
+        # 配置和语言模型都在首次访问时才初始化，只提取文本的调用方无需承担这部分开销
+        self._config_path = config_path
+        self.llm = None
+        
+        # 初始化进度跟踪
+        self.total_citations = 0
+        self.processed_citations = 0
+        self.progress_file = "analysis_progress.json"
 
-        # 读取配置文件
+    @staticmethod
+    def _resolve_config_path(config_path: str):
+        """
+        查找配置文件：依次直接尝试打开候选路径（相对路径再尝试项目config子目录），
+        返回第一个能打开的路径，都不存在时返回None
+        """
+        candidates = [config_path]
+        if not os.path.isabs(config_path):
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            candidates.append(os.path.join(project_root, "config", config_path))
+        for candidate in candidates:
+            try:
+                with open(candidate, 'rb'):
+                    return candidate
+            except OSError:
+                continue
+        return None
+
+    @cached_property
+    def _config_state(self) -> tuple:
+        """读取配置文件，返回 (config_manager, config)"""
+        config_path = self._config_path
         try:
             from config.config_manager import ConfigManager
-            # 确保配置路径正确，处理相对路径和绝对路径
-
-            original_config_path = config_path  # 保存原始路径用于错误消息
-            config_manager_initialized = False
-            
-            if not os.path.isabs(config_path):
-                # 如果是相对路径，尝试在当前目录和config目录中查找
-                if not os.path.exists(config_path):
-                    # 尝试在项目根目录的config子目录中查找
-                    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                    config_in_config_dir = os.path.join(project_root, "config", config_path)
-                    if os.path.exists(config_in_config_dir):
-                        config_path = config_in_config_dir
-                    else:
-                        # 如果配置文件不存在，使用默认配置
-                        print(f"配置文件不存在: {original_config_path}, 使用默认配置")
-                        self.config = self._get_default_config(config_path)
-                        self.config_manager = None
-                        config_manager_initialized = False
-                else:
-                    config_manager_initialized = True
-                    self.config_manager = ConfigManager(config_path)
-                    self.config = self.config_manager.get_config()
-                    
-                # 如果在config目录中找到了文件
-                if os.path.exists(config_path) and not config_manager_initialized:
-                    config_manager_initialized = True
-                    self.config_manager = ConfigManager(config_path)
-                    self.config = self.config_manager.get_config()
-            else:
-                # 绝对路径
-                config_manager_initialized = True
-                self.config_manager = ConfigManager(config_path)
-                self.config = self.config_manager.get_config()
-                
-            # 如果config_manager没有初始化，使用默认配置
-            if not config_manager_initialized:
-                self.config = self._get_default_config(original_config_path)
-                self.config_manager = None
+
+            resolved_path = self._resolve_config_path(config_path)
+            if resolved_path is None:
+                # 如果配置文件不存在，使用默认配置
+                print(f"配置文件不存在: {config_path}, 使用默认配置")
+                return None, self._get_default_config(config_path)
+
+            config_manager = ConfigManager(resolved_path)
+            return config_manager, config_manager.get_config()
         except Exception as e:
             print(f"配置管理器初始化失败: {e}")
             import traceback
             traceback.print_exc()
             # 如果config_manager不可用，使用默认配置
-            self.config = self._get_default_config(config_path)
-            self.config_manager = None
+            return None, self._get_default_config(config_path)
 
-        # 初始化LLM
-        self.llm = None
-        self.model_type = None
-        self._initialize_llm()
-        
-        # 配置文献获取参数
-        self.download_timeout = self.config.get("download_timeout", 60)
-        self.max_retries = self.config.get("max_retries", 3)
-        self.retry_delay_min = self.config.get("retry_delay_min", 4)
-        self.retry_delay_max = self.config.get("retry_delay_max", 10)
+    @property
+    def config_manager(self):
+        return self._config_state[0]
+
+    @property
+    def config(self) -> dict:
+        return self._config_state[1]
+
+    # 配置文献获取参数
+    @property
+    def download_timeout(self):
+        return self.config.get("download_timeout", 60)
+
+    @property
+    def max_retries(self):
+        return self.config.get("max_retries", 3)
+
+    @property
+    def retry_delay_min(self):
+        return self.config.get("retry_delay_min", 4)
+
+    @property
+    def retry_delay_max(self):
+        return self.config.get("retry_delay_max", 10)
+
+    # 配置分析模式
+    @property
+    def analysis_mode(self):
+        return self.config.get("analysis_mode", "full")  # "full" or "quick" or "subjective"
+
+    def _get_default_config(self, config_path):
+        """当config_manager不可用时，提供默认配置"""
+        default_config = {
+            "model": "qwen",
+            "api_key": "your-api-key",
+            "model_name": "qwen-plus",
+            "api_url": None,
+            "download_timeout": 60,
+            "max_retries": 3,
+            "retry_delay_min": 4,
+            "retry_delay_max": 10,
+            "analysis_mode": "subjective",  # 默认使用主观分析模式
+            "use_advanced_extraction": True
+        }
         
-        # 配置分析模式
-        self.analysis_mode = self.config.get("analysis_mode", "full")  # "full" or "quick" or "subjective"
+        # 尝试从文件加载配置
+        if os.path.exists(config_path):
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    file_config = json.load(f)
+                    default_config.update(file_config)
+            except Exception as e:
+                print(f"警告: 无法加载配置文件 {config_path}: {e}")
         
-        # 初始化进度跟踪
-        self.total_citations = 0
-        self.processed_citations = 0
-        self.progress_file = "analysis_progress.json"
+        return default_config
+
+    @cached_property
+    def _llm_state(self) -> dict:
+        """首次访问AI相关属性时才初始化语言模型"""
+        return self._initialize_llm()
+
+    @property
+    def ai_client(self):
+        return self._llm_state["ai_client"]
+
+    @property
+    def model_type(self):
+        return self._llm_state["model_type"]
+
+    @property
+    def model_name(self):
+        return self._llm_state["model_name"]
 
-    # 提取文本
+    # 提取文本：只需要段落文本，流式解析document.xml，不构建python-docx的完整对象树
     def core(self) -> list:
-        for para in self.doc.paragraphs:
-            self.full_text_str.append(para.text)
+        self.full_text_str.extend(iter_paragraph_texts(self.doc_path))
         return self.full_text_str
     
     # 初始化大语言模型
-    def _initialize_llm(self):
-        """初始化语言模型 - 使用新的AI服务模块"""
+    def _initialize_llm(self) -> dict:
+        """初始化语言模型 - 使用新的AI服务模块，返回AI客户端、模型类型和模型名称"""
+        state = {"ai_client": None, "model_type": None, "model_name": None}
+        # 快速模式不使用大语言模型，直接跳过AI服务模块的导入和客户端创建
+        if self.analysis_mode == "quick":
+            return state
         # 从ai模块导入AIClient
         try:
             from ai.ai_client import AIClient
@@ -91,31 +149,28 @@ class Reviewer:
             if self.config["model"] == "gpt":
                 if not self.config.get("api_key") or self.config.get("api_key") == "your-api-key":
                     print("警告：未设置有效的GPT_API_KEY，将跳过AI相关性分析")
-                    self.ai_client = None
                 else:
-                    self.ai_client = AIClient(
+                    state["ai_client"] = AIClient(
                         provider_type="openai",
                         api_key=self.config.get("api_key"),
                         model=self.config.get("model_name", "gpt-3.5-turbo"),
                         base_url=self.config.get("api_url", "https://api.openai.com/v1")
                     )
-                    self.model_type = "gpt"
-                    self.model_name = self.config.get("model_name", "gpt-3.5-turbo")
+                    state["model_type"] = "gpt"
+                    state["model_name"] = self.config.get("model_name", "gpt-3.5-turbo")
             elif self.config["model"] == "qwen":
                 if not self.config.get("api_key") or self.config.get("api_key") == "your-api-key":
                     print("警告：未设置有效的QWEN_API_KEY，将跳过AI相关性分析")
-                    self.ai_client = None
                 else:
-                    self.ai_client = AIClient(
+                    state["ai_client"] = AIClient(
                         provider_type="dashscope",
                         api_key=self.config.get("api_key"),
                         model=self.config.get("model_name", "qwen-plus")
                     )
-                    self.model_type = "qwen"
-                    self.model_name = self.config.get("model_name", "qwen-plus")
+                    state["model_type"] = "qwen"
+                    state["model_name"] = self.config.get("model_name", "qwen-plus")
         except ImportError:
             print("警告：无法导入AI服务模块，将跳过AI相关性分析")
-            self.ai_client = None
         except Exception as e:
             print(f"警告：AI客户端初始化失败: {e}")
-            self.ai_client = None
+        return state
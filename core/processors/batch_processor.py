@@ -1,17 +1,35 @@
 from .base_processor import BaseProcessor
 from .citation_processor import CitationProcessor
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import concurrent.futures
 import logging
+import os
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+
+def _process_single_document(file_path: str, config: Dict = None) -> Dict[str, Any]:
+    """
+    处理单个文档（在子进程中执行，定义为模块级函数以便序列化）
+
+    Args:
+        file_path: 文档路径
+        config: 处理配置
+
+    Returns:
+        单个文档的处理结果
+    """
+    processor = CitationProcessor(config=config)
+    return processor.process(file_path)
+
+
 class BatchProcessor(BaseProcessor):
     """批量处理器 - 支持并发处理多个文档"""
     
-    def __init__(self, max_workers: int = 4):
-        self.max_workers = max_workers
+    def __init__(self, max_workers: Optional[int] = None):
+        # 默认按CPU核数开启进程
+        self.max_workers = max_workers or os.cpu_count() or 1
     
     def process(self, file_paths: List[str], config: Dict = None) -> Dict[str, Any]:
         """批量处理文档 - 并发执行"""
@@ -20,11 +38,11 @@ class BatchProcessor(BaseProcessor):
         results = []
         failed_files = []
         
-        # 使用线程池并发处理文档
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        # 文档解析和引用匹配是CPU密集型任务，使用进程池绕开GIL，各文档真正并行处理
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
             # 提交所有任务
             future_to_path = {
-                executor.submit(self._process_single_document, file_path, config): file_path 
+                executor.submit(_process_single_document, file_path, config): file_path 
                 for file_path in file_paths
             }
             
@@ -60,6 +78,5 @@ class BatchProcessor(BaseProcessor):
         }
     
     def _process_single_document(self, file_path: str, config: Dict = None) -> Dict[str, Any]:
-        """处理单个文档（用于并发执行）"""
-        processor = CitationProcessor(config=config)
-        return processor.process(file_path)
\ No newline at end of file
+        """处理单个文档（保留的兼容接口，实际逻辑见模块级函数）"""
+        return _process_single_document(file_path, config)
\ No newline at end of file
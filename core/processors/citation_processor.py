@@ -1,6 +1,9 @@
 from .base_processor import BaseProcessor
 from core.extractor.extractor_factory import ExtractorFactory
 from core.checker.checker_factory import CheckerFactory
+from .doc_cache import extract_document
+from .compliance_processor import ComplianceProcessor
+from models.compliance import CheckType
 from models.document import Document
 from typing import Dict, Any, Optional
 from datetime import datetime
@@ -13,8 +16,9 @@ class CitationProcessor(BaseProcessor):
     
     def __init__(self, config: Optional[Dict] = None):
         self.config = config or {}
-        self.extractor_factory = ExtractorFactory()
-        self.checker_factory = CheckerFactory()
+        # 工厂只提供类方法并共享类级注册表，直接引用工厂类即可，无需每次创建实例
+        self.extractor_factory = ExtractorFactory
+        self.checker_factory = CheckerFactory
     
     def process(self, file_path: str) -> Dict[str, Any]:
         """
@@ -25,20 +29,17 @@ class CitationProcessor(BaseProcessor):
         start_time = datetime.now()
         
         try:
-            # 步骤1: 使用Extractor提取文档内容
-            extractor = self.extractor_factory.get_extractor(file_path)
+            # 步骤1: 使用Extractor提取文档内容（同一文件未变化时复用缓存结果）
             logger.info(f"开始提取文档: {file_path}")
-            document = extractor.extract(file_path)
+            document = extract_document(file_path)
             logger.info(f"文档提取完成，共提取 {len(document.citations)} 个引用，{len(document.references)} 个参考文献")
             
             # 步骤2: 使用Checker执行引用分析
-            from core.processors.compliance_processor import ComplianceProcessor
-            from models.compliance import CheckType
             checker = self.checker_factory.get_checker(CheckType.CITATIONS)
             compliance_processor = ComplianceProcessor([checker])
             
-            # 使用合规性处理器进行检查
-            analysis_result = compliance_processor.process(file_path)
+            # 使用合规性处理器进行检查（直接传入已提取的文档，避免重复解析）
+            analysis_result = compliance_processor.process(document)
             
             logger.info("引用处理完成")
             return analysis_result  # 直接返回合规性处理器的结果
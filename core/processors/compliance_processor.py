@@ -1,7 +1,9 @@
-from typing import List
+from datetime import datetime
+from typing import List, Union
 from models.document import Document
 from core.checker.base_checker import BaseChecker
 from models.compliance import ComplianceResult, CheckType
+from .doc_cache import extract_document
 
 class ComplianceProcessor:
     """合规性处理器 - 协调Extractor和Checker"""
@@ -13,20 +15,23 @@ class ComplianceProcessor:
         """添加检查器"""
         self.checkers.append(checker)
     
-    def process(self, file_path: str) -> dict:  # 返回兼容格式的字典
+    def process(self, document_or_path: Union[Document, str]) -> dict:  # 返回兼容格式的字典
         """
         处理文档的合规性检查
         
         Args:
-            file_path: 文档文件路径
+            document_or_path: 已提取的文档对象，或文档文件路径
             
         Returns:
             dict: 兼容前端的检查结果字典
         """
-        # 1. 使用Extractor提取文档内容
-        from core.extractor.extractor_factory import ExtractorFactory
-        extractor = ExtractorFactory.get_extractor(file_path)
-        document = extractor.extract(file_path)
+        # 1. 传入的已是提取好的文档时直接使用，否则使用Extractor提取文档内容
+        if isinstance(document_or_path, Document):
+            document = document_or_path
+            file_path = document.metadata.get('file_path', '')
+        else:
+            file_path = document_or_path
+            document = extract_document(file_path)
         
         # 2. 运行引用检查器并获取兼容输出
         for checker in self.checkers:
@@ -37,7 +42,7 @@ class ComplianceProcessor:
         
         # 如果没有找到引用检查器，返回空结果
         return {
-            "test_date": __import__('datetime').datetime.now().isoformat(),
+            "test_date": datetime.now().isoformat(),
             "document": file_path,
             "total_citations": 0,
             "total_references": 0,
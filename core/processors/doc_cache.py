@@ -0,0 +1,38 @@
+"""
+文档提取结果缓存
+同一进程内多次检查同一文件时复用已提取的Document，避免重复解析；
+缓存键包含文件的修改时间和大小，文件被修改或替换后自动失效
+"""
+import os
+from functools import lru_cache
+
+from core.extractor.extractor_factory import ExtractorFactory
+from models.document import Document
+
+
+@lru_cache(maxsize=32)
+def _extract(file_path: str, mtime_ns: int, size: int) -> Document:
+    """提取文档内容（mtime_ns和size只参与缓存键）"""
+    extractor = ExtractorFactory.get_extractor(file_path)
+    return extractor.extract(file_path)
+
+
+def extract_document(file_path: str) -> Document:
+    """
+    提取文档内容，文件未变化时直接返回缓存的结果
+
+    Args:
+        file_path: 文档文件路径
+
+    Returns:
+        提取得到的文档对象。CitationProcessor、ComplianceProcessor等多个调用方共享同一对象，
+        不应修改其内容、引用和参考文献；RelevanceChecker写入的 _cached_title 和 full_text
+        是完全由该文档推导出的备忘字段，文件变化后缓存失效会得到新对象，因此可以共享
+    """
+    stat = os.stat(file_path)
+    return _extract(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def clear_document_cache():
+    """清空文档提取缓存"""
+    _extract.cache_clear()
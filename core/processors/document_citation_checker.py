@@ -9,8 +9,8 @@ from typing import List, Dict, Any
 import os
 import json
 from models.document import Document, Citation, Reference
-from core.extractor.extractor_factory import ExtractorFactory
 from core.checker.checker_factory import CheckerFactory
+from .doc_cache import extract_document
 
 
 class DocumentCitationChecker:
@@ -29,11 +29,8 @@ class DocumentCitationChecker:
         """
         从文档中提取内容（引用、参考文献等）
         """
-        # 使用Extractor工厂获取适当的提取器
-        extractor = ExtractorFactory.get_extractor(self.doc_path)
-        
-        # 提取文档内容
-        self.document = extractor.extract(self.doc_path)
+        # 使用Extractor工厂获取适当的提取器并提取文档内容（同一文件未变化时复用缓存结果）
+        self.document = extract_document(self.doc_path)
         
         return self.document
     
@@ -59,26 +56,27 @@ class DocumentCitationChecker:
         if not self.check_results:
             self.check_citations()
         
-        # 生成格式化的报告
-        report = []
-        report.append("<h1>论文引用合规性检查报告</h1>\n")
-        
-        report.append(f"<p>文档: {self.doc_path}</p>\n")
-        report.append(f"<p>总引用数: {self.check_results['total_citations']}</p>\n")
-        report.append(f"<p>总参考文献数: {self.check_results['total_references']}</p>\n")
-        report.append(f"<p>匹配数: {self.check_results['matched_count']}</p>\n")
-        report.append(f"<p>未匹配数: {self.check_results['unmatched_count']}</p>\n")
-        report.append(f"<p>匹配率: {self.check_results['match_rate']}</p>\n")
-        
-        # 添加详细结果
-        report.append("<h2>详细结果</h2>\n")
-        for result in self.check_results['results']:
-            if result['matched']:
-                report.append(f"<p><strong>✓</strong> {result['original_citation']} -> {result['reference_text'][:100]}...</p>\n")
-            else:
-                report.append(f"<p><strong>✗</strong> {result['original_citation']} (未匹配)</p>\n")
+        # 生成格式化的报告：概要部分用一个模板一次生成，详细结果由生成器一次拼接
+        check_results = self.check_results
+        header = (
+            "<h1>论文引用合规性检查报告</h1>\n"
+            f"<p>文档: {self.doc_path}</p>\n"
+            f"<p>总引用数: {check_results['total_citations']}</p>\n"
+            f"<p>总参考文献数: {check_results['total_references']}</p>\n"
+            f"<p>匹配数: {check_results['matched_count']}</p>\n"
+            f"<p>未匹配数: {check_results['unmatched_count']}</p>\n"
+            f"<p>匹配率: {check_results['match_rate']}</p>\n"
+            # 添加详细结果
+            "<h2>详细结果</h2>\n"
+        )
+        details = "".join(
+            f"<p><strong>✓</strong> {result['original_citation']} -> {result['reference_text'][:100]}...</p>\n"
+            if result['matched'] else
+            f"<p><strong>✗</strong> {result['original_citation']} (未匹配)</p>\n"
+            for result in check_results['results']
+        )
         
-        return "".join(report)
+        return header + details
 
 
 def create_standalone_checker(doc_path: str, config_path: str = "config.json"):
@@ -1,8 +1,11 @@
 from .base_processor import BaseProcessor
 from .citation_processor import CitationProcessor
+from .batch_processor import _process_single_document
 from core.extractor.extractor_factory import ExtractorFactory
 from typing import Dict, Any, List
+import concurrent.futures
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +13,8 @@ class DocumentProcessor(BaseProcessor):
     """文档处理器 - 处理单个或多个文档的完整流程"""
     
     def __init__(self):
-        self.extractor_factory = ExtractorFactory()
+        # 工厂只提供类方法并共享类级注册表，直接引用工厂类即可，无需每次创建实例
+        self.extractor_factory = ExtractorFactory
     
     def process(self, file_path: str) -> Dict[str, Any]:
         """处理单个文档"""
@@ -19,20 +23,24 @@ class DocumentProcessor(BaseProcessor):
         return processor.process(file_path)
     
     def process_batch(self, file_paths: List[str], config: Dict = None) -> List[Dict[str, Any]]:
-        """批量处理多个文档"""
+        """批量处理多个文档（多进程并发执行，结果按输入顺序返回）"""
         results = []
+        if not file_paths:
+            return results
         
-        for file_path in file_paths:
-            try:
-                logger.info(f"处理文档: {file_path}")
-                result = self.process(file_path)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"处理文档 {file_path} 时发生错误: {str(e)}")
-                results.append({
-                    "document": file_path,
-                    "error": str(e),
-                    "status": "failed"
-                })
+        max_workers = min(len(file_paths), os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_process_single_document, file_path) for file_path in file_paths]
+            for file_path, future in zip(file_paths, futures):
+                try:
+                    logger.info(f"处理文档: {file_path}")
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"处理文档 {file_path} 时发生错误: {str(e)}")
+                    results.append({
+                        "document": file_path,
+                        "error": str(e),
+                        "status": "failed"
+                    })
         
         return results
\ No newline at end of file
@@ -16,7 +16,7 @@ import tempfile
 
 # 尝试导入AI增强引用提取模块 - 使用新的模块路径
 try:
-    from ..extractor.ai_extractor import extract_references, extract_western_references
+    from ..extractor.ai_extractor import extract_all_references
     AI_ENHANCED_EXTRACTION_AVAILABLE = True
 except ImportError:
     AI_ENHANCED_EXTRACTION_AVAILABLE = False
@@ -339,12 +339,11 @@ class CitationChecker:
                         "model_name": self.config.get("model_name", "qwen-plus")
                     }
                     
-                    # 提取作者年份格式的引用
-                    author_year_citations = extract_references(self.doc_path, ai_config)
-                    western_citations = extract_western_references(self.doc_path, ai_config)
+                    # 提取作者年份格式和西式格式的引用（文档只读取一次）
+                    ai_citations = extract_all_references(self.doc_path, ai_config)
                     
                     # 将提取到的引用添加到引用列表中（使用特殊标识）
-                    for citation in author_year_citations + western_citations:
+                    for citation in ai_citations:
                         formatted_citation = f"[AUTH:{citation}]"
                         expanded_citations.add(formatted_citation)
                 except Exception as e:
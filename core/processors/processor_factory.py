@@ -14,7 +14,7 @@ class ProcessorFactory:
         elif processor_type == 'document':
             return DocumentProcessor()
         elif processor_type == 'batch':
-            return BatchProcessor(max_workers=kwargs.get('max_workers', 4))
+            return BatchProcessor(max_workers=kwargs.get('max_workers'))
         else:
             raise ValueError(f"Unknown processor type: {processor_type}")
     
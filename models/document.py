@@ -1,6 +1,11 @@
+import sys
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
+# 引文和参考文献对象数量很多，Python 3.10+ 上使用 __slots__ 去掉每个实例的 __dict__，
+# 减少内存占用并加快创建；更早的版本 dataclass 不支持 slots 参数，保持普通类
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 @dataclass
 class Document:
     """文档数据模型"""
@@ -10,7 +15,7 @@ class Document:
     references: List['Reference']  # 参考文献列表
     metadata: Dict[str, Any]  # 文档元数据
 
-@dataclass
+@dataclass(**_SLOTS)
 class Citation:
     """引文数据模型"""
     text: str
@@ -19,7 +24,7 @@ class Citation:
     author: Optional[str] = None
     year: Optional[str] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class Reference:
     """参考文献数据模型"""
     text: str
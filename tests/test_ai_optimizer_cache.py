@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+引用优化磁盘缓存测试
+验证只有AI调用成功的结果才会写入缓存，调用失败时不留下缓存文件
+"""
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.extractor import ai_optimizer
+
+
+class _RaisingClient:
+    """每次调用都抛出异常的AI客户端（模拟网络中断或密钥缺失）"""
+    provider_type = "test"
+    config = {"model": "raising"}
+
+    def generate(self, prompt, **kwargs):
+        raise ConnectionError("network down")
+
+
+class _EchoClient:
+    """按原样返回引用列表的AI客户端"""
+    provider_type = "test"
+    config = {"model": "echo"}
+
+    def __init__(self, citations):
+        self.citations = citations
+
+    def generate(self, prompt, **kwargs):
+        return '[' + ', '.join(f'"{citation}"' for citation in self.citations) + ']'
+
+
+def test_failed_ai_call_is_not_cached(tmp_path, monkeypatch):
+    """AI调用失败时返回原始引用，且不写入缓存文件"""
+    monkeypatch.setattr(ai_optimizer, "AI_CACHE_DIR", str(tmp_path))
+    citations = ["根据张三（2020）", "李四等（2019）的研究"]
+
+    result = ai_optimizer._optimize_citations_with_ai_client_cached(citations, _RaisingClient(), "test:raising")
+
+    assert sorted(result) == sorted(citations)
+    assert os.listdir(tmp_path) == []
+
+
+def test_successful_ai_call_is_cached(tmp_path, monkeypatch):
+    """AI调用成功的结果写入缓存，再次请求时直接读取"""
+    monkeypatch.setattr(ai_optimizer, "AI_CACHE_DIR", str(tmp_path))
+    citations = ["张三（2020）", "李四（2019）"]
+
+    first = ai_optimizer._optimize_citations_with_ai_client_cached(citations, _EchoClient(citations), "test:echo")
+    assert first == citations
+    assert len(os.listdir(tmp_path)) == 1
+
+    second = ai_optimizer._optimize_citations_with_ai_client_cached(citations, _RaisingClient(), "test:echo")
+    assert second == citations
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+作者年份引用并行匹配测试
+验证进程池分块匹配的结果与顺序匹配完全一致（包括顺序）
+"""
+import concurrent.futures
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.checker import citation_checker
+
+
+_REFERENCE_DICTS = [
+    {'text': '张三, 李四. 深度学习研究[J]. 计算机学报, 2020, 43(1): 1-10.', 'author': '张三', 'year': '2020'},
+    {'text': '王五. 图像识别方法[M]. 北京: 科学出版社, 2019.', 'author': '王五', 'year': '2019'},
+    {'text': 'Smith J, Jones K. Neural networks[J]. Nature, 2018, 1: 1-2.', 'author': 'Smith', 'year': '2018'},
+    {'text': 'Brown A. Computer vision[M]. Springer, 2017.', 'author': 'Brown', 'year': '2017'},
+]
+_CITATIONS = ['张三（2020）', '王五（2019）', 'Smith（2018）', '赵六（1999）', 'Brown（2017）', '张三等（2020）']
+
+
+def test_parallel_match_equals_sequential(monkeypatch, caplog):
+    """强制走并行路径时，结果与顺序匹配相同且保持原顺序"""
+    citation_texts = [_CITATIONS[i % len(_CITATIONS)] for i in range(50)]
+    expected = citation_checker._match_citation_chunk(citation_texts, _REFERENCE_DICTS)
+    assert any(match is not None for match in expected)
+    assert any(match is None for match in expected)
+
+    pools = []
+
+    class _CountingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            pools.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(citation_checker, '_PARALLEL_CITATION_THRESHOLD', 4)
+    monkeypatch.setattr(citation_checker, '_CITATION_CHUNK_SIZE', 7)
+    monkeypatch.setattr(citation_checker.os, 'cpu_count', lambda: 2)
+    monkeypatch.setattr(citation_checker.concurrent.futures, 'ProcessPoolExecutor', _CountingPool)
+
+    actual = citation_checker._match_author_year_citations(citation_texts, _REFERENCE_DICTS)
+
+    # 进程池确实被使用，且没有因失败回退到顺序匹配
+    assert len(pools) == 1
+    assert not any('并行匹配引用失败' in record.getMessage() for record in caplog.records)
+    assert actual == expected
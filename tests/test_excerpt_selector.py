@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文献摘录选择测试
+验证摘录总长度不超过预算，以及句向量不可用时按关键词挑选片段
+"""
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.checker.relevance_checking import excerpt_selector
+from core.checker.relevance_checking.excerpt_selector import select_relevant_chunks
+
+
+def test_single_long_paragraph_respects_budget():
+    """没有换行的超长文本也按片段切分，摘录不超过 k * chunk_chars"""
+    full_content = 'lorem ipsum dolor sit amet ' * 2000
+    excerpt = select_relevant_chunks(full_content, 'dolor', k=4, chunk_chars=500)
+    assert 0 < len(excerpt) <= 4 * 500
+
+
+def test_few_chunks_respect_budget():
+    """片段数不超过k时也不返回超出预算的全文"""
+    full_content = '\n'.join(['alpha ' * 150] * 3) + '\n' * 2000
+    excerpt = select_relevant_chunks(full_content, 'alpha', k=4, chunk_chars=1000)
+    assert len(full_content) > 4 * 1000
+    assert len(excerpt) <= 4 * 1000
+    assert 'alpha' in excerpt
+
+
+def test_keyword_fallback_selects_matching_chunk(monkeypatch):
+    """句向量未启用时，按关键词覆盖率选出包含目标关键词的片段"""
+    monkeypatch.setattr(excerpt_selector, "EMBEDDINGS_ENABLED", False)
+    paragraphs = [f'filler paragraph number {i} ' * 30 for i in range(20)]
+    paragraphs[13] = 'graph neural networks for molecule property prediction ' * 10
+    full_content = '\n'.join(paragraphs)
+
+    excerpt = select_relevant_chunks(full_content, 'graph neural networks molecule', k=1, chunk_chars=800)
+    assert 'graph neural networks' in excerpt
+    assert len(excerpt) <= 800
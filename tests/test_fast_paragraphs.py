@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Word文档快速读取测试
+验证直接解析 document.xml 得到的段落和表格文本与python-docx的结果一致，
+以及文档提取缓存在处理器之间共享、文件变化后失效
+"""
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from docx.enum.text import WD_BREAK
+
+from core.extractor.fast_paragraphs import DocxSource, read_document_texts, read_paragraph_texts
+from core.processors.doc_cache import clear_document_cache, extract_document
+
+
+def _build_sample_docx(path):
+    """构建包含合并单元格、制表符、换行和嵌套表格的示例文档"""
+    document = Document()
+    document.add_paragraph('第一章 引言')
+    paragraph = document.add_paragraph('张三（2020）')
+    run = paragraph.add_run('指出')
+    run.add_tab()
+    run.add_text('制表符之后')
+    run.add_break()
+    run.add_text('换行之后')
+    run.add_break(WD_BREAK.PAGE)
+
+    table = document.add_table(rows=3, cols=3)
+    for row_idx, row in enumerate(table.rows):
+        for col_idx, cell in enumerate(row.cells):
+            cell.text = f'R{row_idx}C{col_idx}'
+    # 横向合并（gridSpan）
+    table.cell(0, 0).merge(table.cell(0, 1))
+    # 纵向合并（vMerge）
+    table.cell(1, 2).merge(table.cell(2, 2))
+    # 嵌套表格
+    nested = table.cell(2, 0).add_table(rows=1, cols=2)
+    nested.cell(0, 0).text = '嵌套A'
+    nested.cell(0, 1).text = '嵌套B'
+    table.cell(2, 1).paragraphs[0].add_run('\t多段').add_break()
+    table.cell(2, 1).add_paragraph('第二段')
+
+    document.add_paragraph('参考文献')
+    document.add_paragraph('张三. 论文题目[J]. 期刊, 2020.')
+    document.save(path)
+
+
+def _expected_texts(path):
+    """python-docx读取的段落文本和逐行遍历 row.cells 的单元格文本"""
+    document = Document(path)
+    paragraphs = [paragraph.text for paragraph in document.paragraphs]
+    table_cells = [cell.text for table in document.tables for row in table.rows for cell in row.cells]
+    return paragraphs, table_cells
+
+
+def test_read_document_texts_matches_python_docx(tmp_path):
+    """read_document_texts的结果与python-docx一致（路径和DocxSource两种输入）"""
+    path = str(tmp_path / 'sample.docx')
+    _build_sample_docx(path)
+    expected = _expected_texts(path)
+
+    assert read_document_texts(path) == expected
+    assert read_document_texts(DocxSource(path)) == expected
+    assert read_paragraph_texts(path) == expected[0]
+
+
+def test_extract_document_invalidated_on_change(tmp_path):
+    """文件修改时间或大小变化后，extract_document重新提取文档"""
+    clear_document_cache()
+    path = str(tmp_path / 'cached.docx')
+
+    document = Document()
+    document.add_paragraph('原始内容')
+    document.save(path)
+    first = extract_document(path)
+    assert extract_document(path) is first
+    assert first.content == ['原始内容']
+
+    document = Document()
+    document.add_paragraph('修改后的内容')
+    document.add_paragraph('新增段落')
+    document.save(path)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = extract_document(path)
+    assert second is not first
+    assert second.content == ['修改后的内容', '新增段落']
+    clear_document_cache()
+
+
+class _RecordingChecker:
+    """记录收到的文档对象的引用检查器"""
+
+    def __init__(self, seen):
+        self.seen = seen
+
+    def get_check_type(self):
+        from models.compliance import CheckType
+        return CheckType.CITATIONS
+
+    def check(self, document):
+        self.seen.append(document)
+
+        class _Result:
+            metadata = {"compatibility_output": {}}
+        return _Result()
+
+
+def test_cached_document_shared_between_processors(tmp_path, monkeypatch):
+    """CitationProcessor和ComplianceProcessor共享同一个提取结果，标题备忘字段不改变文档内容"""
+    from core.checker.checker_factory import CheckerFactory
+    from core.checker.relevance_checker import RelevanceChecker
+    from core.processors.citation_processor import CitationProcessor
+    from core.processors.compliance_processor import ComplianceProcessor
+
+    clear_document_cache()
+    path = str(tmp_path / 'shared.docx')
+    _build_sample_docx(path)
+
+    seen = []
+    monkeypatch.setattr(CheckerFactory, 'get_checker', classmethod(lambda cls, check_type: _RecordingChecker(seen)))
+    CitationProcessor().process(path)
+    ComplianceProcessor([_RecordingChecker(seen)]).process(path)
+
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+
+    shared = seen[0]
+    content = list(shared.content)
+    citations = [citation.text for citation in shared.citations]
+    RelevanceChecker()._resolve_document_title(shared)
+    assert shared.content == content
+    assert [citation.text for citation in shared.citations] == citations
+    clear_document_cache()
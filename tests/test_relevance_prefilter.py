@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+相关性预筛选测试
+验证基础文本匹配预筛选不会把未分词的中文文本误判为明显无关
+"""
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.checker import relevance_checker
+from core.checker.relevance_checker import RelevanceChecker
+
+
+def test_chinese_pair_not_rejected_without_jieba():
+    """没有jieba时，相关的中文标题和内容不应被预筛选判定为无关"""
+    original = relevance_checker.JIEBA_AVAILABLE
+    relevance_checker.JIEBA_AVAILABLE = False
+    try:
+        checker = RelevanceChecker()
+        result = checker._prefilter("深度学习在图像识别中的应用研究",
+                                    "本文研究了深度学习方法在图像识别任务中的应用",
+                                    "文章整体")
+        assert result is None
+    finally:
+        relevance_checker.JIEBA_AVAILABLE = original
+
+
+def test_unrelated_english_pair_rejected():
+    """不含中文的文本可以可靠分词，零重合时直接判定为无关"""
+    checker = RelevanceChecker()
+    result = checker._prefilter("Quantum chromodynamics",
+                                "Medieval poetry",
+                                "文章整体")
+    if relevance_checker._PREFILTER_ENABLED:
+        assert result is not None
+        assert result.is_compliant is False
+        assert result.statistics["check_method"] == "prefilter"
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+文档标题提取测试
+验证关键词模式只取关键词之前的文本，正文句子和章节标题不会被当作标题
+"""
+import os
+import sys
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.checker.relevance_checking.title_extractor import extract_title_from_content
+
+
+def test_chapter_heading_is_not_title():
+    """章节标题不作为论文标题"""
+    assert extract_title_from_content(['第一章 绪论']) is None
+    assert extract_title_from_content(['Chapter 1 Introduction']) is None
+
+
+def test_body_sentence_is_not_title():
+    """以句号结尾的正文句子不作为论文标题"""
+    assert extract_title_from_content(['本文研究了深度学习方法。']) is None
+    assert extract_title_from_content(['第一章 绪论', '本文研究了深度学习方法。']) is None
+
+
+def test_keyword_line_keeps_text_before_keyword():
+    """包含关键词的行取第一个关键词之前的文本，过短时不作为标题"""
+    assert extract_title_from_content(['基于深度学习的图像识别方法研究', '作者：张三']) == '基于深度学习的图像识别方法'
+
+
+def test_plain_title_line():
+    """不含关键词的标题行整体作为标题"""
+    assert extract_title_from_content(['Deep Learning for Image Recognition']) == 'Deep Learning for Image Recognition'
+    assert extract_title_from_content(['', '卷积神经网络在遥感影像中的运用', '张三']) == '卷积神经网络在遥感影像中的运用'
@@ -5,6 +5,7 @@ import zipfile
 import tempfile
 import datetime
 import json
+import pathlib
 
 
 class MineruPDFToMD:
@@ -16,6 +17,8 @@ class MineruPDFToMD:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
+        # 已写出的Markdown文件路径 -> 文件内容，调用方可直接取用而无需重新读盘
+        self.md_contents = {}
     
     def _load_api_key_from_config(self, config_path):
         """从配置文件加载API密钥"""
@@ -242,6 +245,7 @@ class MineruPDFToMD:
                     md_output_path = os.path.join(md_subdir, final_md_name)
                     with open(md_output_path, "w", encoding="utf-8") as f:
                         f.write(content)
+                    self.md_contents[md_output_path] = content
                     
                     # 如果有images文件夹，提取到子文件夹
                     if has_images:
@@ -330,7 +334,8 @@ class MineruPDFToMD:
             return self.convert_pdf_from_local(pdf_input, output_dir, model_version)
 
 
-def convert_pdf_to_markdown(pdf_path: str, output_dir: str = None, config_path: str = None) -> str:
+def convert_pdf_to_markdown(pdf_path: str, output_dir: str = None, config_path: str = None,
+                            return_content: bool = False):
     """
     将PDF文件转换为Markdown格式，使用MinerU API进行转换
 
@@ -338,9 +343,10 @@ def convert_pdf_to_markdown(pdf_path: str, output_dir: str = None, config_path:
         pdf_path: PDF文件路径
         output_dir: 输出目录，默认为临时目录
         config_path: 配置文件路径
+        return_content: 为True时同时返回Markdown内容（取自转换时的内存数据，不重新读取文件）
 
     Returns:
-        转换后的Markdown文件路径
+        转换后的Markdown文件路径；return_content为True时返回 (文件路径, Markdown内容)
     """
     if output_dir is None:
         import tempfile
@@ -353,7 +359,6 @@ def convert_pdf_to_markdown(pdf_path: str, output_dir: str = None, config_path:
             config_path = "config.json"
         else:
             # 尝试在项目根目录查找
-            import pathlib
             project_root = pathlib.Path(__file__).resolve().parent.parent.parent
             project_config_path = project_root / "config.json"
 
@@ -378,7 +383,17 @@ def convert_pdf_to_markdown(pdf_path: str, output_dir: str = None, config_path:
         raise Exception("PDF转换失败：未生成任何Markdown文件")
 
     # 返回第一个转换的Markdown文件路径
-    return md_files[0] if md_files else None
+    md_file_path = md_files[0]
+    if not return_content:
+        return md_file_path
+
+    content = converter.md_contents.get(md_file_path)
+    if content is None:
+        return md_file_path, pathlib.Path(md_file_path).read_text(encoding="utf-8")
+    # 与以文本模式读回文件的结果保持一致（统一换行符）
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return md_file_path, content
 
 
 def fix_title_levels(md_content):